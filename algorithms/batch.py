@@ -0,0 +1,127 @@
+import heapq
+from array import array
+
+import numpy as np
+
+from algorithms.vectorized import fcfs_vectorized
+from models.workload import WorkloadBatch
+
+
+# Lập lịch nhiều workload nhỏ trong một lần gọi (xem models.workload.WorkloadBatch).
+# Kết quả: (start_time, completion_time) phẳng, đánh index theo dòng của batch;
+# mỗi workload bắt đầu từ thời điểm 0 như khi chạy riêng lẻ.
+INT64_MAX = 2 ** 63 - 1
+
+
+def fcfs_batch(batch) -> tuple:
+    # FCFS vectorized theo đoạn: cùng công thức với fcfs_vectorized,
+    #   CT[i] = S[i] + max_{j<=i}(AT[j] - S[j-1]),  S = cumsum(BT) trong workload
+    # Running max theo đoạn: cộng thêm k * BASE cho đoạn k (BASE > mọi giá trị) để một
+    # lần maximum.accumulate trên cả mảng không bao giờ mang max của đoạn trước sang.
+    if len(batch) == 1:
+        # Một workload (vd. --batch một file lớn): công thức gốc, không cần dời theo đoạn
+        _, start_time, completion_time = fcfs_vectorized(batch)
+        return start_time, completion_time
+    order = batch.arrival_order()
+    arrival = batch.arrival_time[order]
+    burst = batch.burst_time[order]
+    segment = batch.segment_ids()
+    starts = batch.offsets[:-1]
+
+    # cumsum cục bộ của workload = cumsum toàn cục - tổng burst các workload đứng trước
+    cumulative = np.cumsum(burst)
+    local = cumulative - np.concatenate([[0], cumulative])[starts][segment]
+
+    slack = np.maximum(arrival - (local - burst), 0)
+    base = int(slack.max()) + 1 if len(slack) else 1
+    if len(batch) * base <= INT64_MAX:
+        shift = segment * base
+        offset = np.maximum.accumulate(slack + shift) - shift
+    else:
+        # slack + k * BASE tràn int64 (arrival rất lớn) -> running max riêng từng đoạn
+        offset = np.empty_like(slack)
+        for lo, hi in zip(starts.tolist(), batch.offsets[1:].tolist()):
+            offset[lo:hi] = np.maximum.accumulate(slack[lo:hi])
+    completion = local + offset
+
+    start_time = np.empty_like(completion)
+    completion_time = np.empty_like(completion)
+    start_time[order] = completion - burst
+    completion_time[order] = completion
+    return start_time, completion_time
+
+
+def _nonpreemptive_batch(batch, key: np.ndarray) -> tuple:
+    # Vòng lặp chặt cho các thuật toán chọn theo khoá (SJF, Priority) trên mọi đoạn:
+    # khoá gộp thành hạng của (key, vị trí (arrival, pid)) trên cả batch -> heap so sánh
+    # int, không tuple, không object Process, không cấp phát kết quả cho từng workload.
+    # Hạng lấy bằng lexsort nên không tràn int64 như khi nhân key * n.
+    order = batch.arrival_order()
+    n = len(order)
+    arrival = batch.arrival_time[order].tolist()
+    burst = batch.burst_time[order].tolist()
+    by_rank = np.lexsort((np.arange(n), key[order]))
+    packed = np.empty(n, dtype=np.int64)
+    packed[by_rank] = np.arange(n)
+    packed = packed.tolist()
+    by_rank = by_rank.tolist()
+    offsets = batch.offsets.tolist()
+
+    # Kết quả ghi thẳng vào mảng int64 (không giữ object int cho từng job);
+    # start suy ra từ completion - burst sau vòng lặp
+    completion = array('q', bytes(8 * n))
+    heappush, heappop = heapq.heappush, heapq.heappop
+    for k in range(len(offsets) - 1):
+        upcoming, end = offsets[k], offsets[k + 1]
+        ready = []
+        current_time = 0
+        while upcoming < end or ready:
+            while upcoming < end and arrival[upcoming] <= current_time:
+                heappush(ready, packed[upcoming])
+                upcoming += 1
+            if not ready:
+                current_time = arrival[upcoming]
+                continue
+            i = by_rank[heappop(ready)]
+            current_time += burst[i]
+            completion[i] = current_time
+
+    done = np.frombuffer(completion, dtype=np.int64)
+    completion_time = np.empty(n, dtype=np.int64)
+    completion_time[order] = done
+    start_time = completion_time - batch.burst_time
+    return start_time, completion_time
+
+
+def sjf_batch(batch) -> tuple:
+    # Cùng thứ tự chọn với sjf_non_preemptive: (burst, arrival, pid)
+    return _nonpreemptive_batch(batch, batch.burst_time)
+
+
+def priority_batch(batch) -> tuple:
+    # Cùng thứ tự chọn với priority_non_preemptive: (priority, arrival, pid)
+    return _nonpreemptive_batch(batch, batch.priority)
+
+
+BATCH_ALGORITHMS = {
+    'FCFS': fcfs_batch,
+    'SJF': sjf_batch,
+    'PRIORITY': priority_batch,
+}
+
+
+def schedule_batch(batch, name: str) -> tuple:
+    try:
+        return BATCH_ALGORITHMS[name.upper()](batch)
+    except KeyError:
+        raise ValueError(f"Algorithm '{name}' has no batched mode "
+                         f"(available: {', '.join(BATCH_ALGORITHMS)})") from None
+
+
+def schedule_workload(workload, name: str, jobs: list = None):
+    # Một workload -> ScheduleResult như bản một CPU, tính thẳng trên cột của workload
+    # (vd. cột memmap của trace, không qua list Process). Non-preemptive: thứ tự hoàn
+    # thành = thứ tự (start, completion) - job burst 0 xong trước job bắt đầu cùng lúc
+    start_time, completion_time = schedule_batch(WorkloadBatch([workload]), name)
+    order = np.lexsort((completion_time, start_time))
+    return workload.to_schedule_result(order, start_time, completion_time, jobs=jobs)
@@ -0,0 +1,99 @@
+import heapq
+from array import array
+from models.schedule import ScheduleResult, int_array
+from utils import profiler
+
+
+def run_event_schedule(processes: list, key, preemptive: bool = False,
+                       quantum: int = None) -> ScheduleResult:
+    # Discrete-event core dùng chung cho mọi thuật toán.
+    # key(p, remaining) : khoá ưu tiên trong ready queue (nhỏ hơn = chạy trước)
+    # preemptive        : job mới đến có khoá nhỏ hơn sẽ giành CPU
+    # quantum           : time slice cho Round Robin (None = chạy tới khi xong)
+    # Thời gian nhảy thẳng tới lần đến / hoàn thành kế tiếp, không đi từng đơn vị.
+    # Workload không bị sửa - trạng thái chạy nằm trong các mảng riêng.
+    n = len(processes)
+    jobs = sorted(range(n), key=lambda i: (processes[i].arrival_time, processes[i].pid))
+    arrival = [processes[i].arrival_time for i in jobs]
+    remaining = [p.burst_time for p in processes]
+    start_time = int_array(n, -1)
+    completion_time = int_array(n)
+    order = array('q')
+    slice_job, slice_start, slice_end = array('q'), array('q'), array('q')
+
+    profile = profiler.active()     # None khi không --profile
+    ready = []              # (key, seq, index)
+    seq = 0
+    next_arrival = 0
+    current_time = 0
+
+    while len(order) < n:
+        while next_arrival < n and arrival[next_arrival] <= current_time:
+            i = jobs[next_arrival]
+            heapq.heappush(ready, (key(processes[i], remaining[i]), seq, i))
+            seq += 1
+            next_arrival += 1
+
+        if not ready:
+            current_time = arrival[next_arrival]
+            continue
+
+        if profile is not None:
+            profile.record_selection(len(ready))
+        index = heapq.heappop(ready)[2]
+        process = processes[index]
+        if start_time[index] < 0:
+            start_time[index] = current_time
+
+        run = remaining[index]
+        if quantum:
+            if ready:
+                run = min(run, quantum)
+            elif next_arrival < n:
+                # Chạy một mình: giữ CPU tới biên quantum đầu tiên sau lần đến kế tiếp
+                gap = arrival[next_arrival] - current_time
+                run = min(run, -(-gap // quantum) * quantum)
+
+        slice_begin = current_time
+        end = current_time + run
+        preempted = False
+
+        if preemptive:
+            while next_arrival < n and arrival[next_arrival] < end:
+                remaining[index] -= arrival[next_arrival] - current_time
+                current_time = arrival[next_arrival]
+                while next_arrival < n and arrival[next_arrival] <= current_time:
+                    i = jobs[next_arrival]
+                    heapq.heappush(ready, (key(processes[i], remaining[i]), seq, i))
+                    seq += 1
+                    next_arrival += 1
+                if ready[0][0] < key(process, remaining[index]):
+                    preempted = True
+                    if profile is not None:
+                        profile.count('preemptions')
+                    break
+
+        if not preempted:
+            remaining[index] -= end - current_time
+            current_time = end
+
+        slice_job.append(index)
+        slice_start.append(slice_begin)
+        slice_end.append(current_time)
+
+        if remaining[index] == 0:
+            completion_time[index] = current_time
+            order.append(index)
+            continue
+
+        # Job đến đúng lúc hết quantum được xếp trước job vừa bị ngắt
+        while next_arrival < n and arrival[next_arrival] <= current_time:
+            i = jobs[next_arrival]
+            heapq.heappush(ready, (key(processes[i], remaining[i]), seq, i))
+            seq += 1
+            next_arrival += 1
+        heapq.heappush(ready, (key(process, remaining[index]), seq, index))
+        seq += 1
+
+    return ScheduleResult(processes, order, start_time, completion_time,
+                          (slice_job, slice_start, slice_end))
@@ -1,17 +1,35 @@
-def fcfs_scheduling(processes:  list) -> list:
-    sorted_processes = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+from array import array
+from models.schedule import ScheduleResult, ScheduledJob, int_array
+
+
+def fcfs_scheduling(processes:  list) -> ScheduleResult:
+    n = len(processes)
+    order = array('q', sorted(range(n), key=lambda i: (processes[i].arrival_time, processes[i].pid)))
+    start_time = int_array(n)
+    completion_time = int_array(n)
     
     current_time = 0
     
-    for process in sorted_processes:
+    for i in order:
+        process = processes[i]
         if current_time < process.arrival_time:
             current_time = process.arrival_time
         
-        process.start_time = current_time
-        process.completion_time = current_time + process.burst_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
-        
-        current_time = process.completion_time
+        start_time[i] = current_time
+        current_time += process.burst_time
+        completion_time[i] = current_time
+    
+    return ScheduleResult(processes, order, start_time, completion_time)
+
+
+def fcfs_stream(processes):
+    # Streaming: input đã sort theo (arrival, pid), trả từng job khi hoàn thành
+    current_time = 0
     
-    return sorted_processes
\ No newline at end of file
+    for process in processes:
+        if current_time < process.arrival_time:
+            current_time = process.arrival_time
+        
+        start = current_time
+        current_time += process.burst_time
+        yield ScheduledJob.from_job(process, start, current_time)
\ No newline at end of file
@@ -0,0 +1,142 @@
+from array import array
+from collections import deque
+from models.schedule import ScheduleResult, int_array
+from utils import profiler
+
+DEFAULT_LEVELS = 3
+DEFAULT_QUANTUM = 2      # quantum tầng 0; tầng k dùng quantum * 2^k
+DEFAULT_BOOST = 100      # chu kỳ đưa mọi job về tầng 0 (0 = tắt)
+DEFAULT_AGING = 50       # chờ ở tầng k >= aging đơn vị -> lên tầng k - 1 (0 = tắt)
+
+
+def level_quanta(levels: int, quantum: int) -> list:
+    return [quantum << k for k in range(levels)]
+
+
+def mlfq_scheduling(processes: list, levels: int = DEFAULT_LEVELS, quantum: int = DEFAULT_QUANTUM,
+                    boost: int = DEFAULT_BOOST, aging: int = DEFAULT_AGING,
+                    quanta: list = None) -> ScheduleResult:
+    # Multi-Level Feedback Queue:
+    #   - job mới đến vào tầng 0 (ưu tiên cao nhất); dùng hết quantum -> xuống một tầng
+    #   - job đến mới giành CPU của job đang chạy ở tầng thấp hơn (job đó giữ tầng, về cuối hàng)
+    #   - mỗi boost đơn vị thời gian: mọi job về tầng 0; aging: chờ lâu ở một tầng -> lên một tầng
+    # Mỗi tầng là một deque FIFO; bit k của mask bật khi tầng k có job -> tầng cao nhất
+    # còn job = bit thấp nhất, O(1) bất kể số tầng. Workload không bị sửa.
+    if levels < 1:
+        raise ValueError(f"MLFQ needs at least one level, got {levels}")
+    if quanta is None:
+        if quantum <= 0:
+            raise ValueError(f"Quantum must be positive, got {quantum}")
+        quanta = level_quanta(levels, quantum)
+    elif len(quanta) != levels or min(quanta) <= 0:
+        raise ValueError(f"Expected {levels} positive quanta, got {list(quanta)}")
+    if boost < 0 or aging < 0:
+        raise ValueError("Boost period and aging threshold must not be negative")
+
+    n = len(processes)
+    jobs = sorted(range(n), key=lambda i: (processes[i].arrival_time, processes[i].pid))
+    arrival = [processes[i].arrival_time for i in jobs]
+    remaining = [p.burst_time for p in processes]
+    enqueued = [0] * n      # thời điểm vào tầng hiện tại (aging)
+    start_time = int_array(n, -1)
+    completion_time = int_array(n)
+    order = array('q')
+    slice_job, slice_start, slice_end = array('q'), array('q'), array('q')
+
+    queues = [deque() for _ in range(levels)]
+    top = queues[0]
+    bottom = levels - 1
+    mask = 0
+    next_arrival = 0
+    current_time = 0
+    next_boost = boost
+    last = -1
+    switches = boosts = promotions = 0
+
+    while len(order) < n:
+        while next_arrival < n and arrival[next_arrival] <= current_time:
+            top.append(jobs[next_arrival])
+            next_arrival += 1
+            mask |= 1
+
+        if boost and current_time >= next_boost:
+            if mask > 1:
+                # Tầng 0 giữ nguyên thứ tự, các tầng dưới nối vào sau theo thứ tự tầng
+                for k in range(1, levels):
+                    queue = queues[k]
+                    if queue:
+                        top.extend(queue)
+                        queue.clear()
+                mask = 1
+                boosts += 1
+            next_boost = (current_time // boost + 1) * boost
+
+        if aging and mask > 1:
+            # Mỗi tầng FIFO theo thời điểm vào -> chỉ cần xét đầu hàng
+            limit = current_time - aging
+            pending = mask & ~1
+            while pending:
+                k = (pending & -pending).bit_length() - 1
+                pending &= pending - 1
+                queue, upper = queues[k], queues[k - 1]
+                while queue and enqueued[queue[0]] <= limit:
+                    i = queue.popleft()
+                    enqueued[i] = current_time
+                    upper.append(i)
+                    promotions += 1
+                    mask |= 1 << (k - 1)
+                if not queue:
+                    mask &= ~(1 << k)
+
+        if not mask:
+            current_time = arrival[next_arrival]
+            continue
+
+        k = (mask & -mask).bit_length() - 1
+        queue = queues[k]
+        index = queue.popleft()
+        if not queue:
+            mask &= ~(1 << k)
+        if start_time[index] < 0:
+            start_time[index] = current_time
+
+        end = current_time + min(remaining[index], quanta[k])
+        preempted = k > 0 and next_arrival < n and arrival[next_arrival] < end
+        if preempted:
+            end = arrival[next_arrival]
+        remaining[index] -= end - current_time
+
+        if index == last and slice_end[-1] == current_time:
+            slice_end[-1] = end     # cùng job chạy tiếp -> nối slice, không đổi ngữ cảnh
+        else:
+            if last >= 0:
+                switches += 1
+            slice_job.append(index)
+            slice_start.append(current_time)
+            slice_end.append(end)
+            last = index
+        current_time = end
+
+        if remaining[index] == 0:
+            completion_time[index] = current_time
+            order.append(index)
+            continue
+
+        # Job đến đúng lúc hết quantum được xếp trước job vừa bị ngắt (như Round Robin)
+        while next_arrival < n and arrival[next_arrival] <= current_time:
+            top.append(jobs[next_arrival])
+            next_arrival += 1
+            mask |= 1
+        if not preempted and k < bottom:
+            k += 1
+        queues[k].append(index)
+        enqueued[index] = current_time
+        mask |= 1 << k
+
+    counters = {'context_switches': switches, 'boosts': boosts, 'promotions': promotions}
+    profile = profiler.active()     # None khi không --profile
+    if profile is not None:
+        for name, value in counters.items():
+            profile.count(name, value)
+    return ScheduleResult(processes, order, start_time, completion_time,
+                          (slice_job, slice_start, slice_end), counters)
@@ -0,0 +1,105 @@
+import heapq
+from array import array
+from models.schedule import MultiCoreResult, int_array
+from utils import profiler
+
+
+# Thứ tự chọn job giống bản một CPU tương ứng (fcfs / sjf / priority non-preemptive)
+MULTICORE_POLICIES = {
+    'FCFS': lambda p: (p.arrival_time, p.pid),
+    'SJF': lambda p: (p.burst_time, p.arrival_time, p.pid),
+    'PRIORITY': lambda p: (p.priority, p.arrival_time, p.pid),
+}
+
+# global   : một hàng đợi chung, core rảnh sớm nhất lấy job tốt nhất
+# per-core : mỗi core một hàng đợi (job chia vòng tròn khi đến), core rảnh mà hàng đợi
+#            của nó trống thì "trộm" từ hàng đợi dài nhất
+QUEUE_MODES = ('global', 'per-core')
+
+
+def _policy_key(policy: str):
+    try:
+        return MULTICORE_POLICIES[policy.upper()]
+    except KeyError:
+        raise ValueError(f"Algorithm '{policy}' has no multi-core mode "
+                         f"(available: {', '.join(MULTICORE_POLICIES)})") from None
+
+
+def multicore_scheduling(processes: list, cores: int = 2, policy: str = 'FCFS',
+                         queue_mode: str = 'global') -> MultiCoreResult:
+    # busy: heap (thời điểm rảnh, core) của core đang chạy; idle: heap id core đang rảnh.
+    # Mỗi job một lần push/pop trên mỗi heap -> O(n log m) cho phần theo dõi core
+    # (cộng O(n log n) của hàng đợi ready như bản một CPU).
+    if cores < 1:
+        raise ValueError("Number of cores must be at least 1")
+    if queue_mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown queue mode '{queue_mode}'. Available: {', '.join(QUEUE_MODES)}")
+    key = _policy_key(policy)
+
+    n = len(processes)
+    arrivals = sorted(range(n), key=lambda i: (processes[i].arrival_time, processes[i].pid))
+    start_time = int_array(n)
+    completion_time = int_array(n)
+    core_of = int_array(n)
+    finished = []
+
+    busy = []
+    idle = list(range(cores))
+    per_core = queue_mode == 'per-core'
+    queues = [[] for _ in range(cores if per_core else 1)]
+    longest = []        # per-core: (-độ dài, core) - entry cũ bỏ qua khi pop
+    profile = profiler.active()
+    queued = 0
+    cursor = 0
+    seq = 0
+
+    while len(finished) < n:
+        # Sự kiện kế tiếp: một core chạy xong, hoặc job đến khi đang có core rảnh
+        time = busy[0][0] if busy else None
+        if cursor < n and idle and not queued:
+            arrival = processes[arrivals[cursor]].arrival_time
+            if time is None or arrival < time:
+                time = arrival
+
+        while busy and busy[0][0] <= time:
+            heapq.heappush(idle, heapq.heappop(busy)[1])
+
+        while cursor < n and processes[arrivals[cursor]].arrival_time <= time:
+            i = arrivals[cursor]
+            target = seq % cores if per_core else 0
+            heapq.heappush(queues[target], (key(processes[i]), seq, i))
+            if per_core:
+                heapq.heappush(longest, (-len(queues[target]), target))
+            seq += 1
+            cursor += 1
+            queued += 1
+
+        # Core rảnh nhận job theo thứ tự id
+        while idle and queued:
+            c = heapq.heappop(idle)
+            source = c if per_core else 0
+            if per_core and not queues[c]:
+                # Work stealing: lấy từ hàng đợi dài nhất
+                while -longest[0][0] != len(queues[longest[0][1]]):
+                    heapq.heappop(longest)
+                source = longest[0][1]
+
+            queue = queues[source]
+            if profile is not None:
+                profile.record_selection(queued)
+                if source != c:
+                    profile.count('steals')
+            i = heapq.heappop(queue)[2]
+            queued -= 1
+            if per_core and queue:
+                heapq.heappush(longest, (-len(queue), source))
+
+            start_time[i] = time
+            completion_time[i] = time + processes[i].burst_time
+            core_of[i] = c
+            finished.append(i)
+            heapq.heappush(busy, (completion_time[i], c))
+
+    # sort ổn định: job hoàn thành cùng lúc giữ thứ tự dispatch (job burst 0 trên cùng core)
+    order = array('q', sorted(finished, key=completion_time.__getitem__))
+    return MultiCoreResult(processes, order, start_time, completion_time, core_of, cores)
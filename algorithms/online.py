@@ -0,0 +1,111 @@
+import heapq
+from collections import namedtuple
+from models.schedule import ScheduledJob
+from utils.calculator import MetricsAccumulator
+
+
+# kind: 'dispatch' (job bắt đầu chạy) hoặc 'complete' (row = ScheduledJob)
+SchedulerEvent = namedtuple('SchedulerEvent', ['kind', 'time', 'pid', 'row'])
+
+ONLINE_POLICIES = {
+    # Cùng thứ tự chọn với fcfs_scheduling / sjf_non_preemptive
+    'FCFS': lambda p: (p.arrival_time, p.pid),
+    'SJF': lambda p: (p.burst_time, p.arrival_time, p.pid),
+}
+
+
+class OnlineScheduler:
+    # Scheduler non-preemptive cho luồng job trực tiếp.
+    #   submit(job)   : O(log n), job phải đến không sớm hơn đồng hồ hiện tại
+    #   advance_to(t) : xử lý mọi sự kiện xảy ra trước t, trả về list event
+    #   drain()       : chạy tới khi hết job
+    # Nộp job theo thứ tự arrival cho ra đúng lịch như bản batch.
+
+    def __init__(self, policy: str = 'SJF', listener=None):
+        policy = policy.upper()
+        if policy not in ONLINE_POLICIES:
+            raise ValueError(f"Unknown online policy '{policy}'. "
+                             f"Available: {', '.join(ONLINE_POLICIES)}")
+        self.policy = policy
+        self._key = ONLINE_POLICIES[policy]
+        self.listener = listener
+        self.current_time = 0
+        self.metrics = MetricsAccumulator()
+
+        self._pending = []      # (arrival, seq, job) - chưa tới giờ đến
+        self._ready = []        # (key, seq, job)
+        self._running = None    # (job, start_time)
+        self._seq = 0
+
+    def __len__(self):
+        # Số job chưa hoàn thành
+        return len(self._pending) + len(self._ready) + (self._running is not None)
+
+    def submit(self, job):
+        if job.arrival_time < self.current_time:
+            raise ValueError(f"Job {job.pid} arrives at {job.arrival_time}, "
+                             f"before the scheduler clock ({self.current_time})")
+        heapq.heappush(self._pending, (job.arrival_time, self._seq, job))
+        self._seq += 1
+
+    def _emit(self, events: list, kind: str, time: int, job, row=None):
+        event = SchedulerEvent(kind, time, job.pid, row)
+        events.append(event)
+        if self.listener is not None:
+            self.listener(event)
+
+    def _run_until(self, limit) -> list:
+        # limit = None: không giới hạn (drain)
+        events = []
+        while True:
+            if self._running is not None:
+                job, start = self._running
+                completion = start + job.burst_time
+                if limit is not None and completion >= limit:
+                    break
+                self.current_time = completion
+                row = ScheduledJob.from_job(job, start, completion)
+                self.metrics.add(row)
+                self._running = None
+                self._emit(events, 'complete', completion, job, row)
+
+            while self._pending and self._pending[0][0] <= self.current_time:
+                _, seq, job = heapq.heappop(self._pending)
+                heapq.heappush(self._ready, (self._key(job), seq, job))
+
+            if self._ready:
+                # Chỉ quyết định khi mọi job đến tại current_time đã có thể được nộp
+                if limit is not None and self.current_time >= limit:
+                    break
+                job = heapq.heappop(self._ready)[2]
+                self._running = (job, self.current_time)
+                self._emit(events, 'dispatch', self.current_time, job)
+            elif self._pending and (limit is None or self._pending[0][0] < limit):
+                self.current_time = self._pending[0][0]
+            else:
+                break
+
+        if limit is not None and limit > self.current_time:
+            self.current_time = limit
+            while self._pending and self._pending[0][0] <= self.current_time:
+                _, seq, job = heapq.heappop(self._pending)
+                heapq.heappush(self._ready, (self._key(job), seq, job))
+        return events
+
+    def advance_to(self, time: int) -> list:
+        # Sự kiện tại đúng thời điểm `time` để lần gọi sau (job đến lúc `time` vẫn nộp được)
+        return self._run_until(time)
+
+    def drain(self) -> list:
+        return self._run_until(None)
+
+    def snapshot(self) -> dict:
+        state = {
+            'time': self.current_time,
+            'completed': self.metrics.count,
+            'ready': len(self._ready),
+            'pending': len(self._pending),
+            'running': self._running[0].pid if self._running else None,
+        }
+        state.update(self.metrics.result())
+        return state
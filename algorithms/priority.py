@@ -0,0 +1,15 @@
+from algorithms.engine import run_event_schedule
+from models.schedule import ScheduleResult
+
+
+def _priority_key(p, remaining):
+    # Số priority nhỏ hơn = ưu tiên cao hơn
+    return (p.priority, p.arrival_time, p.pid)
+
+
+def priority_non_preemptive(processes: list) -> ScheduleResult:
+    return run_event_schedule(processes, key=_priority_key)
+
+
+def priority_preemptive(processes: list) -> ScheduleResult:
+    return run_event_schedule(processes, key=_priority_key, preemptive=True)
@@ -0,0 +1,107 @@
+from algorithms.fcfs import fcfs_scheduling, fcfs_stream
+from algorithms.sjf import sjf_non_preemptive, sjf_stream
+from algorithms.srtf import srtf_scheduling
+from algorithms.round_robin import round_robin_scheduling
+from algorithms.priority import priority_non_preemptive, priority_preemptive
+from algorithms.mlfq import mlfq_scheduling
+
+# Tên ngắn -> hàm scheduling. Dùng tên (không dùng hàm) khi gửi qua process pool
+ALGORITHMS = {
+    'FCFS': fcfs_scheduling,
+    'SJF': sjf_non_preemptive,
+    'SRTF': srtf_scheduling,
+    'RR': round_robin_scheduling,
+    'PRIORITY': priority_non_preemptive,
+    'PRIORITY-P': priority_preemptive,
+    'MLFQ': mlfq_scheduling,
+}
+
+ALGORITHM_TITLES = {
+    'FCFS': "FCFS (First-Come, First-Served)",
+    'SJF': "SJF Non-Preemptive (Shortest Job First)",
+    'SRTF': "SRTF (Shortest Remaining Time First)",
+    'RR': "Round Robin",
+    'PRIORITY': "Priority Non-Preemptive",
+    'PRIORITY-P': "Priority Preemptive",
+    'MLFQ': "MLFQ (Multi-Level Feedback Queue)",
+}
+
+# Tham số dạng "RR:4" -> quantum=4; nhiều tham số theo thứ tự, "MLFQ:4:2" -> levels=4, quantum=2
+ALGORITHM_PARAMS = {
+    'RR': ('quantum',),
+    'MLFQ': ('levels', 'quantum', 'boost', 'aging'),
+}
+
+# Giá trị nhỏ nhất của từng tham số (boost/aging = 0 nghĩa là tắt)
+PARAM_MINIMUMS = {
+    'quantum': 1,
+    'levels': 1,
+    'boost': 0,
+    'aging': 0,
+}
+
+STREAM_ALGORITHMS = {
+    'FCFS': fcfs_stream,
+    'SJF': sjf_stream,
+}
+
+
+def get_algorithm(name: str):
+    try:
+        return ALGORITHMS[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm '{name}'. "
+                         f"Available: {', '.join(ALGORITHMS)}") from None
+
+
+def parse_algorithm_spec(spec: str) -> tuple:
+    # "SJF" -> ('SJF', {}),  "RR:4" -> ('RR', {'quantum': 4})
+    name, _, value = spec.strip().partition(':')
+    name = name.upper()
+    get_algorithm(name)
+
+    params = {}
+    if value:
+        if name not in ALGORITHM_PARAMS:
+            raise ValueError(f"Algorithm '{name}' takes no parameter (got '{spec}')")
+        values = value.split(':')
+        names = ALGORITHM_PARAMS[name]
+        if len(values) > len(names):
+            raise ValueError(f"Too many parameters in '{spec}' (expected {':'.join(names)})")
+        try:
+            params = {key: int(v) for key, v in zip(names, values)}
+        except ValueError:
+            raise ValueError(f"Invalid parameter in '{spec}': expected an integer") from None
+        for key, v in params.items():
+            if v < PARAM_MINIMUMS[key]:
+                raise ValueError(f"Invalid {key} in '{spec}': must be >= {PARAM_MINIMUMS[key]}, got {v}")
+    return name, params
+
+
+def parse_algorithm_list(text: str) -> list:
+    # "FCFS,SJF,RR:4" -> ['FCFS', 'SJF', 'RR:4'] (đã kiểm tra hợp lệ)
+    specs = []
+    for spec in text.split(','):
+        if spec.strip():
+            name, params = parse_algorithm_spec(spec)
+            specs.append(algorithm_label(name, params))
+    return specs
+
+
+def algorithm_label(name: str, params: dict) -> str:
+    if not params:
+        return name
+    return f"{name}:{':'.join(str(v) for v in params.values())}"
+
+
+def algorithm_title(spec: str) -> str:
+    name, params = parse_algorithm_spec(spec)
+    title = ALGORITHM_TITLES[name]
+    if params:
+        title += " (" + ", ".join(f"{k}={v}" for k, v in params.items()) + ")"
+    return title
+
+
+def run_algorithm_spec(spec: str, processes: list):
+    name, params = parse_algorithm_spec(spec)
+    return ALGORITHMS[name](processes, **params)
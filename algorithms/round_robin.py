@@ -0,0 +1,12 @@
+from algorithms.engine import run_event_schedule
+from models.schedule import ScheduleResult
+
+DEFAULT_QUANTUM = 2
+
+
+def round_robin_scheduling(processes: list, quantum: int = DEFAULT_QUANTUM) -> ScheduleResult:
+    if quantum <= 0:
+        raise ValueError(f"Quantum must be positive, got {quantum}")
+
+    # Khoá rỗng -> ready queue chỉ còn thứ tự FIFO theo seq
+    return run_event_schedule(processes, key=lambda p, remaining: (), quantum=quantum)
@@ -1,34 +1,36 @@
-def sjf_non_preemptive(processes:  list) -> list:
-    processes.sort(key=lambda p: (p.arrival_time, p.pid))
+import heapq
+from algorithms.engine import run_event_schedule
+from models.schedule import ScheduleResult, ScheduledJob
 
-    n = len(processes)
-    completed = [False] * n
+
+def sjf_non_preemptive(processes:  list) -> ScheduleResult:
+    # Ready queue: (burst, arrival, pid) giống thứ tự chọn của vòng quét cũ
+    return run_event_schedule(
+        processes,
+        key=lambda p, remaining: (p.burst_time, p.arrival_time, p.pid)
+    )
+
+
+def sjf_stream(processes):
+    # Streaming: input đã sort theo (arrival, pid), chỉ giữ ready queue trong RAM
+    arrivals = iter(processes)
+    upcoming = next(arrivals, None)
+    ready = []
+    seq = 0
     current_time = 0
-    result = []
     
-    for _ in range(n):
-        min_burst = float('inf')
-        shortest_idx = -1
+    while upcoming is not None or ready:
+        while upcoming is not None and upcoming.arrival_time <= current_time:
+            heapq.heappush(ready, (upcoming.burst_time, upcoming.arrival_time,
+                                   upcoming.pid, seq, upcoming))
+            seq += 1
+            upcoming = next(arrivals, None)
         
-        for i, process in enumerate(processes):
-            if (not completed[i] and 
-                process.arrival_time <= current_time and 
-                process.burst_time < min_burst):
-                min_burst = process.burst_time
-                shortest_idx = i
-        if shortest_idx == -1:
-            current_time = min(p.arrival_time for i, p in enumerate(processes) 
-                              if not completed[i])
+        if not ready:
+            current_time = upcoming.arrival_time
             continue
         
-        process = processes[shortest_idx]
-        process.start_time = current_time
-        process.completion_time = current_time + process.burst_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
-        
-        current_time = process.completion_time
-        completed[shortest_idx] = True
-        result.append(process)
-    
-    return result
\ No newline at end of file
+        process = heapq.heappop(ready)[4]
+        start = current_time
+        current_time += process.burst_time
+        yield ScheduledJob.from_job(process, start, current_time)
@@ -0,0 +1,11 @@
+from algorithms.engine import run_event_schedule
+from models.schedule import ScheduleResult
+
+
+def srtf_scheduling(processes: list) -> ScheduleResult:
+    # Shortest Remaining Time First = SJF preemptive
+    return run_event_schedule(
+        processes,
+        key=lambda p, remaining: (remaining, p.arrival_time, p.pid),
+        preemptive=True
+    )
@@ -0,0 +1,22 @@
+import numpy as np
+
+
+def fcfs_vectorized(workload) -> tuple:
+    # FCFS trên mảng:  CT[i] = max(CT[i-1], AT[i]) + BT[i]
+    # Với S = cumsum(BT):  CT[i] = S[i] + max_{j<=i}(AT[j] - S[j-1])
+    order = workload.arrival_order()
+    arrival = workload.arrival_time[order]
+    burst = workload.burst_time[order]
+
+    cumulative = np.cumsum(burst)
+    # current_time bắt đầu từ 0 nên không bao giờ nhỏ hơn 0
+    offset = np.maximum.accumulate(np.maximum(arrival - (cumulative - burst), 0))
+    completion = cumulative + offset
+
+    start_time = np.empty_like(completion)
+    completion_time = np.empty_like(completion)
+    start_time[order] = completion - burst
+    completion_time[order] = completion
+
+    # start/completion đánh index theo workload, order = thứ tự thực thi
+    return order, start_time, completion_time
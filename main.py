@@ -1,20 +1,52 @@
-import copy
 import os
 import argparse
 import sys
 
+# Chế độ batch: rẽ nhánh trước khi import UI / stress test / multiprocessing
+# -> chi phí khởi động chỉ gồm những module batch thật sự dùng
+if __name__ == "__main__" and '--batch' in sys.argv[1:]:
+    from utils.headless import main as batch_main
+    sys.exit(batch_main([arg for arg in sys.argv[1:] if arg != '--batch']))
+
+from datetime import datetime
+
 # Import modules
 from models.process import Process
-from algorithms.fcfs import fcfs_scheduling
-from algorithms.sjf import sjf_non_preemptive
+from algorithms.registry import (
+    ALGORITHMS,
+    STREAM_ALGORITHMS,
+    parse_algorithm_list,
+    algorithm_title
+)
+from algorithms.multicore import multicore_scheduling, MULTICORE_POLICIES, QUEUE_MODES
 from utils.calculator import calculate_metrics
 from utils.csv_handler import (
     read_processes_from_csv, 
+    iter_processes_from_csv,
     export_results_to_csv, 
+    export_results_stream,
     export_comparison_to_csv,
     create_sample_csv
 )
-from utils.stress_test import run_multiple_stress_tests
+from utils.parallel import run_algorithms_concurrently, PARALLEL_MIN_JOBS
+from utils.cache import ResultCache, workload_fingerprint
+from utils import profiler
+from utils.stress_test import (
+    run_multiple_stress_tests,
+    run_large_stress_tests,
+    check_large_algorithms,
+    check_stress_counts,
+    parse_workload_spec,
+    STRESS_TIERS,
+    DEFAULT_TEST_SIZES,
+    DEFAULT_STRESS_ALGORITHMS,
+    LARGE_TEST_SIZES,
+    LARGE_STRESS_ALGORITHMS,
+    LARGE_TRIALS,
+    DEFAULT_TRIALS,
+    DEFAULT_WARMUP,
+    DEFAULT_SEED
+)
 from ui.display import (
     display_input_table,
     display_results, 
@@ -22,23 +54,108 @@ from ui.display import (
     draw_gantt_chart,
     display_comparison
 )
+from ui.gantt import export_gantt_svg, parse_window
 
 
 DEFAULT_INPUT_FILE = "input/processes.csv"
 DEFAULT_OUTPUT_FOLDER = "output"
+DEFAULT_ALGORITHMS = "FCFS,SJF"
+TRACE_EXTENSION = ".trace"
 
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description='CPU Scheduling Algorithm Simulator')
     parser.add_argument('--input', type=str, default=DEFAULT_INPUT_FILE,
-                        help=f'Path to the input CSV file containing processes (default: {DEFAULT_INPUT_FILE})')
+                        help=f'Path to the input CSV file containing processes, or a binary .trace file '
+                             f'(default: {DEFAULT_INPUT_FILE})')
     parser.add_argument('--output', type=str, default=DEFAULT_OUTPUT_FOLDER,
                         help=f'Path to the output directory (default: {DEFAULT_OUTPUT_FOLDER})')
+    parser.add_argument('--algorithms', type=str, default=DEFAULT_ALGORITHMS,
+                        help=f'Comma-separated schedulers to run and compare, e.g. FCFS,SJF,SRTF,RR:4 '
+                             f'(available: {", ".join(ALGORITHMS)}; default: {DEFAULT_ALGORITHMS})')
+    parser.add_argument('--batch', action='store_true',
+                        help='Headless batch mode for many inputs with compact CSV/JSON output '
+                             '(see: main.py --batch --help)')
     parser.add_argument('--stress-test', action='store_true',
                         help='Run stress tests immediately after simulation without prompting')
+    parser.add_argument('--compress', choices=['gzip', 'zstd', 'none'], default=None,
+                        help='Write results as row-group chunks (compressed CSV) into a per-run '
+                             'folder with a manifest, encoded in the background (default: plain CSV)')
+    parser.add_argument('--export-trace', action='store_true',
+                        help='Also write each schedule in the binary .trace format')
+    parser.add_argument('--gantt-window', type=str, default=None,
+                        help='Zoom the Gantt chart into a time window START:END')
+    parser.add_argument('--gantt-export', choices=['svg', 'html'], default=None,
+                        help='Also export each Gantt chart as a static SVG or HTML file')
+    parser.add_argument('--cores', type=int, default=1,
+                        help='Simulate this many CPUs (non-preemptive FCFS, SJF, PRIORITY; default: 1)')
+    parser.add_argument('--core-queue', choices=QUEUE_MODES, default='global',
+                        help='Multi-core ready queue: one global queue, or per-core queues '
+                             'with work stealing (default: global)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always recompute schedules instead of reusing cached results')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream the input CSV in chunks and write results as jobs finish '
+                             '(for traces larger than RAM; skips tables and Gantt chart)')
+    parser.add_argument('--profile', type=str, default=None, metavar='PATH',
+                        help='Record phase timings, scheduler counters and memory peaks to PATH')
+    parser.add_argument('--profile-format', choices=['json', 'chrome'], default='json',
+                        help='Profile output: summary JSON or Chrome trace-event JSON (default: json)')
+    parser.add_argument('--stress-tier', choices=STRESS_TIERS, default='standard',
+                        help='standard: Process-based cells in a worker pool; large: 10^5-10^7 jobs on '
+                             'NumPy columns with peak RSS / tracemalloc reporting (default: standard)')
+    parser.add_argument('--stress-sizes', type=str, default=None,
+                        help=f'Comma-separated process counts for the stress test '
+                             f'(default: {",".join(map(str, DEFAULT_TEST_SIZES))}; large tier: '
+                             f'{",".join(map(str, LARGE_TEST_SIZES))})')
+    parser.add_argument('--stress-algorithms', type=str, default=None,
+                        help=f'Comma-separated algorithms for the stress test, e.g. FCFS,SJF,SRTF,RR '
+                             f'(default: {",".join(DEFAULT_STRESS_ALGORITHMS)}; large tier: '
+                             f'{",".join(LARGE_STRESS_ALGORITHMS)})')
+    parser.add_argument('--stress-workload', type=str, default=None,
+                        help='Synthetic stress workload ARRIVALS:BURSTS, e.g. poisson:pareto or '
+                             'onoff:lognormal (default: legacy uniform generator)')
+    parser.add_argument('--trials', type=int, default=None,
+                        help=f'Timed trials per stress-test cell (default: {DEFAULT_TRIALS}; '
+                             f'large tier: {LARGE_TRIALS})')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP,
+                        help=f'Untimed warm-up rounds per cell (default: {DEFAULT_WARMUP})')
+    parser.add_argument('--seeds', type=int, default=1,
+                        help='Number of random workloads per size (default: 1)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Base random seed for generated workloads (default: {DEFAULT_SEED})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for the stress test and for running the selected '
+                             'algorithms concurrently (default: CPU count, 1 = serial)')
     return parser.parse_args()
 
 
+def stress_test_options(args) -> dict:
+    options = {
+        'sizes': [int(s) for s in args.stress_sizes.split(',') if s.strip()] if args.stress_sizes else None,
+        'algorithms': ([a.strip() for a in args.stress_algorithms.split(',') if a.strip()]
+                       if args.stress_algorithms else None),
+        'seed': args.seed,
+        'workload': parse_workload_spec(args.stress_workload) if args.stress_workload else None
+    }
+    if args.stress_tier == 'large':
+        check_large_algorithms(options['algorithms'])
+        options['trials'] = args.trials if args.trials is not None else LARGE_TRIALS
+        check_stress_counts(options['trials'])
+        return options
+    options.update(trials=args.trials if args.trials is not None else DEFAULT_TRIALS,
+                   warmup=args.warmup, seeds=args.seeds, workers=args.workers)
+    check_stress_counts(options['trials'], options['warmup'], options['seeds'])
+    return options
+
+
+def run_stress_tests(args, options: dict):
+    if args.stress_tier == 'large':
+        run_large_stress_tests(args.output, **options)
+    else:
+        run_multiple_stress_tests(args.output, **options)
+
+
 def print_header():
     print("\n" + "=" * 65)
     print("  ╔═══════════════════════════════════════════════════════════╗")
@@ -49,38 +166,149 @@ def print_header():
     print("=" * 65)
 
 
-def print_footer(input_file, output_folder):
+def print_footer(input_file, output_folder, cache: ResultCache = None):
     print("\n" + "=" * 65)
     print("  ✅ PROGRAM COMPLETED SUCCESSFULLY!")
     print(f"  📁 Input file  : {input_file}")
     print(f"  📁 Output folder: {output_folder}/")
+    if cache is not None:
+        print(f"  💾 Result cache: {cache.summary()}")
     print("=" * 65)
 
 
-def run_algorithm(algorithm_func, algorithm_name: str, processes: list, output_folder: str) -> tuple:
+def report_algorithm(spec: str, result, output_folder: str, export_trace: bool = False,
+                     gantt_window: tuple = None, gantt_export: str = None,
+                     metrics: dict = None, exporter=None) -> dict:
+    algorithm_name = algorithm_title(spec)
+    if getattr(result, 'cores', None):
+        algorithm_name += f" - {result.cores} cores"
     print("\n" + "█" * 65)
     print(f"  ALGORITHM: {algorithm_name}")
     print("█" * 65)
 
-    algo_processes = copy.deepcopy(processes)
-
-    result = algorithm_func(algo_processes)
-    metrics = calculate_metrics(result)
+    if metrics is None:
+        with profiler.phase('metrics'):
+            metrics = calculate_metrics(result)
     
     # Display results
-    display_results(result, algorithm_name)
-    display_metrics(metrics)
-    draw_gantt_chart(result, algorithm_name)
+    with profiler.phase('display'):
+        display_results(result, algorithm_name)
+        display_metrics(metrics)
+        draw_gantt_chart(result, algorithm_name, gantt_window)
 
     # Export results
-    export_results_to_csv(result, metrics, algorithm_name.split()[0], output_folder) # Use first word for filename usually (e.g. FCFS, SJF)
+    with profiler.phase('export'):
+        if exporter is not None:
+            exporter.export_schedule(result, metrics, spec)   # không chặn, nén ở background
+        else:
+            export_results_to_csv(result, metrics, spec.replace(':', '_'), output_folder)
+        if export_trace:
+            from utils.trace_format import export_schedule_trace  # cần NumPy
+            export_schedule_trace(result, spec.replace(':', '_'), output_folder)
+        if gantt_export:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            export_gantt_svg(result, algorithm_name, os.path.join(
+                output_folder, f"Gantt_{spec.replace(':', '_')}_{timestamp}.{gantt_export}"),
+                window=gantt_window)
     
-    return result, metrics
+    return metrics
+
+
+def run_algorithms(processes: list, specs: list, output_folder: str, workers: int = None,
+                   export_trace: bool = False, gantt_window: tuple = None,
+                   gantt_export: str = None, cache: ResultCache = None, exporter=None,
+                   workload=None) -> dict:
+    # Lấy từ cache những gì đã có, chỉ lập lịch phần còn thiếu
+    cached = {}
+    if cache is not None:
+        with profiler.phase('cache'):
+            fingerprint = workload_fingerprint(processes)
+            for spec in specs:
+                entry = cache.get(fingerprint, spec, processes)
+                if entry is not None:
+                    cached[spec] = entry
+    
+    # Workload bất biến -> các thuật toán chạy song song trên cùng dữ liệu, không deepcopy.
+    # Khi profile thì chạy tuần tự để counter của scheduler nằm trong tiến trình này
+    if len(processes) < PARALLEL_MIN_JOBS or profiler.active() is not None:
+        workers = 1
+    missing = [spec for spec in specs if spec not in cached]
+    with profiler.phase('schedule'):
+        results = {}
+        if workload is not None:
+            # Input .trace: thuật toán có bản vectorized chạy thẳng trên cột memmap
+            from algorithms.batch import BATCH_ALGORITHMS, schedule_workload
+            for spec in [spec for spec in missing if spec in BATCH_ALGORITHMS]:
+                results[spec] = schedule_workload(workload, spec, processes)
+                missing.remove(spec)
+        if missing:
+            results.update(run_algorithms_concurrently(processes, missing, workers))
+    
+    metrics_by_algorithm = {}
+    for spec in specs:
+        if spec in cached:
+            result, metrics = cached[spec]
+        else:
+            with profiler.phase('metrics'):
+                result, metrics = results[spec], calculate_metrics(results[spec])
+            if cache is not None:
+                with profiler.phase('cache'):
+                    cache.put(fingerprint, spec, result, metrics)
+        metrics_by_algorithm[spec] = report_algorithm(spec, result, output_folder, export_trace,
+                                                      gantt_window, gantt_export, metrics, exporter)
+    return metrics_by_algorithm
+
+
+def run_multicore(processes: list, specs: list, output_folder: str, cores: int,
+                  queue_mode: str, gantt_window: tuple = None, gantt_export: str = None,
+                  exporter=None, export_trace: bool = False) -> dict:
+    # Mỗi thuật toán một lần chạy m-CPU; không qua cache (cache chỉ lưu lịch một CPU)
+    print(f"\n[INFO] Simulating {cores} cores with {queue_mode} ready queue(s)")
+    metrics_by_algorithm = {}
+    for spec in specs:
+        with profiler.phase('schedule'):
+            result = multicore_scheduling(processes, cores, spec, queue_mode)
+        metrics_by_algorithm[spec] = report_algorithm(spec, result, output_folder,
+                                                      export_trace=export_trace,
+                                                      gantt_window=gantt_window,
+                                                      gantt_export=gantt_export,
+                                                      exporter=exporter)
+    return metrics_by_algorithm
+
+
+def run_streaming(input_file: str, output_folder: str, specs: list) -> dict:
+    # Peak memory = ready queue, không phụ thuộc kích thước trace
+    results = {}
+    for spec in specs:
+        if spec not in STREAM_ALGORITHMS:
+            print(f"\n[!] {spec} has no streaming mode, skipped "
+                  f"(streaming supports: {', '.join(STREAM_ALGORITHMS)})")
+            continue
+        
+        print("\n" + "█" * 65)
+        print(f"  ALGORITHM: {spec} (streaming)")
+        print("█" * 65)
+        
+        completed = STREAM_ALGORITHMS[spec](iter_processes_from_csv(input_file))
+        _, metrics = export_results_stream(completed, spec, output_folder)
+        display_metrics(metrics)
+        results[spec] = metrics
+    
+    return results
+
+
+def finish_profile(args):
+    session = profiler.stop()
+    if session is not None:
+        profiler.display_profile(session)
+        profiler.write_profile(session, args.profile, args.profile_format)
 
 
 def main():
     try:
         args = parse_arguments()
+        if args.profile:
+            profiler.start()
 
         print_header()
         
@@ -90,7 +318,53 @@ def main():
             print(f"\n[ERROR] Failed to create output directory '{args.output}': {e}")
             sys.exit(1)
         
-        processes = read_processes_from_csv(args.input)
+        try:
+            specs = parse_algorithm_list(args.algorithms)
+            gantt_window = parse_window(args.gantt_window) if args.gantt_window else None
+            stress_options = stress_test_options(args)
+            if args.cores < 1:
+                raise ValueError("--cores must be at least 1")
+            if args.cores > 1:
+                unsupported = [spec for spec in specs if spec not in MULTICORE_POLICIES]
+                if unsupported:
+                    raise ValueError(f"No multi-core mode for {', '.join(unsupported)} "
+                                     f"(available: {', '.join(MULTICORE_POLICIES)})")
+        except ValueError as e:
+            print(f"\n[ERROR] {e}")
+            sys.exit(1)
+        
+        if args.stream:
+            if not os.path.isfile(args.input):
+                print(f"\n[ERROR] Could not read input file: {args.input}")
+                sys.exit(1)
+            
+            with profiler.phase('stream'):
+                metrics_by_algorithm = run_streaming(args.input, args.output, specs)
+            if not metrics_by_algorithm or not all(metrics_by_algorithm.values()):
+                print("\n[ERROR] No processes found in input file.")
+                sys.exit(1)
+            
+            display_comparison(metrics_by_algorithm)
+            export_comparison_to_csv(metrics_by_algorithm, args.output)
+            finish_profile(args)
+            print_footer(args.input, args.output)
+            return
+        
+        workload = None
+        with profiler.phase('load'):
+            if args.input.endswith(TRACE_EXTENSION):
+                from utils.trace_format import load_trace  # cần NumPy
+                try:
+                    # Giữ Workload (cột memmap) cho các thuật toán vectorized;
+                    # list Process chỉ cho bảng / Gantt và các thuật toán còn lại
+                    workload = load_trace(args.input)
+                    processes = workload.to_processes()
+                    print(f"[✓] Read {len(processes)} processes from: {args.input}")
+                except (OSError, ValueError) as e:
+                    print(f"[✗] Error reading trace: {e}")
+                    processes = None
+            else:
+                processes = read_processes_from_csv(args.input)
 
         if processes is None:
             if args.input == DEFAULT_INPUT_FILE:
@@ -109,38 +383,51 @@ def main():
             print("\n[ERROR] No processes found in input file.")
             sys.exit(1)
 
-        display_input_table(processes)
+        with profiler.phase('display'):
+            display_input_table(processes)
         
-        # Run FCFS
-        fcfs_result, fcfs_metrics = run_algorithm(
-            fcfs_scheduling, 
-            "FCFS (First-Come, First-Served)", 
-            processes, 
-            args.output
-        )
-        
-        # Run SJF
-        sjf_result, sjf_metrics = run_algorithm(
-            sjf_non_preemptive, 
-            "SJF Non-Preemptive (Shortest Job First)", 
-            processes, 
-            args.output
-        )
+        cache = None
+        exporter = None
+        if args.compress:
+            from utils.export import RunExporter
+            try:
+                exporter = RunExporter(args.output, args.compress)
+            except ValueError as e:
+                print(f"\n[ERROR] {e}")
+                sys.exit(1)
+        if args.cores > 1:
+            metrics_by_algorithm = run_multicore(processes, specs, args.output, args.cores,
+                                                 args.core_queue, gantt_window, args.gantt_export,
+                                                 exporter, args.export_trace)
+        else:
+            cache = None if args.no_cache else ResultCache()
+            metrics_by_algorithm = run_algorithms(processes, specs, args.output, args.workers,
+                                                  args.export_trace, gantt_window, args.gantt_export,
+                                                  cache, exporter, workload)
         
         # Compare
-        display_comparison(fcfs_metrics, sjf_metrics)
-        export_comparison_to_csv(fcfs_metrics, sjf_metrics, args.output)
+        with profiler.phase('display'):
+            display_comparison(metrics_by_algorithm)
+        with profiler.phase('export'):
+            if exporter is not None:
+                # So sánh nằm trong manifest của run
+                exporter.close()
+            else:
+                export_comparison_to_csv(metrics_by_algorithm, args.output)
         
         # Stress Test
         print("\n" + "=" * 65)
         if args.stress_test:
-             run_multiple_stress_tests(args.output)
+            with profiler.phase('stress'):
+                run_stress_tests(args, stress_options)
         else:
             run_stress = input(" Would you like to run the STRESS TEST(y/n): ").strip().lower()
             if run_stress == 'y':
-                run_multiple_stress_tests(args.output)
+                with profiler.phase('stress'):
+                    run_stress_tests(args, stress_options)
         
-        print_footer(args.input, args.output)
+        finish_profile(args)
+        print_footer(args.input, args.output, cache)
 
     except KeyboardInterrupt:
         print("\n\n[INFO] Program interrupted by user. Exiting...")
@@ -1,13 +1,19 @@
 class Process:
+    # Job record bất biến: nhiều thuật toán dùng chung một workload mà không cần deepcopy.
+    # Kết quả lập lịch nằm ở models.schedule.ScheduleResult
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'priority')
     
-    def __init__(self, pid: str, arrival_time: int, burst_time: int):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.start_time = 0          
-        self.completion_time = 0       
-        self.turnaround_time = 0      
-        self.waiting_time = 0          
+    def __init__(self, pid: str, arrival_time: int, burst_time: int, priority: int = 0):
+        object.__setattr__(self, 'pid', pid)
+        object.__setattr__(self, 'arrival_time', arrival_time)
+        object.__setattr__(self, 'burst_time', burst_time)
+        object.__setattr__(self, 'priority', priority)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Process is immutable (cannot set '{name}')")
+    
+    def __reduce__(self):
+        return (Process, (self.pid, self.arrival_time, self.burst_time, self.priority))
     
     def __repr__(self):
         return f"Process({self.pid}, AT={self.arrival_time}, BT={self.burst_time})"
@@ -17,8 +23,5 @@ class Process:
             'PID': self.pid,
             'ArrivalTime': self.arrival_time,
             'BurstTime': self.burst_time,
-            'StartTime': self.start_time,
-            'CompletionTime': self.completion_time,
-            'TurnaroundTime': self.turnaround_time,
-            'WaitingTime': self.waiting_time
+            'Priority': self.priority
         }
\ No newline at end of file
@@ -0,0 +1,114 @@
+from array import array
+from collections import namedtuple
+
+
+_ScheduledJobBase = namedtuple('_ScheduledJobBase', [
+    'pid', 'arrival_time', 'burst_time', 'priority', 'start_time',
+    'completion_time', 'turnaround_time', 'waiting_time', 'response_time'
+])
+
+
+class ScheduledJob(_ScheduledJobBase):
+    # Một dòng kết quả (chỉ đọc) - cùng tên thuộc tính với Process cũ cho UI / export
+    __slots__ = ()
+    
+    @classmethod
+    def from_job(cls, job, start_time: int, completion_time: int) -> 'ScheduledJob':
+        turnaround_time = completion_time - job.arrival_time
+        return cls(job.pid, job.arrival_time, job.burst_time, job.priority,
+                   start_time, completion_time, turnaround_time,
+                   turnaround_time - job.burst_time, start_time - job.arrival_time)
+    
+    def to_dict(self) -> dict:
+        return {
+            'PID': self.pid,
+            'ArrivalTime': self.arrival_time,
+            'BurstTime': self.burst_time,
+            'StartTime': self.start_time,
+            'CompletionTime': self.completion_time,
+            'TurnaroundTime': self.turnaround_time,
+            'WaitingTime': self.waiting_time,
+            'ResponseTime': self.response_time
+        }
+
+
+def int_array(n: int, fill: int = 0) -> array:
+    return array('q', [fill]) * n
+
+
+class ScheduleResult:
+    # Kết quả lập lịch tách khỏi workload:
+    #   jobs            : list Process dùng chung (không bị sửa)
+    #   order           : index job theo thứ tự hoàn thành
+    #   start_time      : thời điểm chạy lần đầu, đánh index theo jobs
+    #   completion_time : thời điểm hoàn thành, đánh index theo jobs
+    #   slices          : (job, start, end) theo thời gian; None = mỗi job chạy liền một mạch
+    #   counters        : số đếm riêng của scheduler (vd. context switch của MLFQ) hoặc None
+    __slots__ = ('jobs', 'order', 'start_time', 'completion_time',
+                 'slice_job', 'slice_start', 'slice_end', 'counters')
+    
+    def __init__(self, jobs: list, order, start_time, completion_time, slices: tuple = None,
+                 counters: dict = None):
+        self.jobs = jobs
+        self.counters = counters
+        self.order = order
+        self.start_time = start_time
+        self.completion_time = completion_time
+        if slices is None:
+            self.slice_job = self.slice_start = self.slice_end = None
+        else:
+            self.slice_job, self.slice_start, self.slice_end = slices
+    
+    def __len__(self):
+        return len(self.order)
+    
+    def __iter__(self):
+        # Duyệt các dòng kết quả theo thứ tự hoàn thành
+        for i in self.order:
+            yield self.row(i)
+    
+    def __repr__(self):
+        return f"ScheduleResult({len(self)} jobs)"
+    
+    def row(self, index: int) -> ScheduledJob:
+        return ScheduledJob.from_job(self.jobs[index], int(self.start_time[index]),
+                                     int(self.completion_time[index]))
+    
+    def segment_count(self) -> int:
+        return len(self.order) if self.slice_job is None else len(self.slice_job)
+    
+    def segments(self):
+        # (pid, start, end) theo thứ tự thời gian - dùng cho Gantt chart
+        if self.slice_job is None:
+            for i in self.order:
+                yield self.jobs[i].pid, int(self.start_time[i]), int(self.completion_time[i])
+        else:
+            for i, start, end in zip(self.slice_job, self.slice_start, self.slice_end):
+                yield self.jobs[i].pid, int(start), int(end)
+
+
+class MultiCoreResult(ScheduleResult):
+    # Kết quả trên m CPU (non-preemptive): thêm cột core, đánh index theo jobs
+    __slots__ = ('core', 'cores')
+    
+    def __init__(self, jobs: list, order, start_time, completion_time, core, cores: int):
+        super().__init__(jobs, order, start_time, completion_time)
+        self.core = core
+        self.cores = cores
+    
+    def __repr__(self):
+        return f"MultiCoreResult({len(self)} jobs, {self.cores} cores)"
+    
+    def lanes(self) -> list:
+        # Một ScheduleResult cho mỗi core; trên một core thứ tự hoàn thành = thứ tự thời gian
+        orders = [array('q') for _ in range(self.cores)]
+        for i in self.order:
+            orders[self.core[i]].append(i)
+        return [ScheduleResult(self.jobs, lane, self.start_time, self.completion_time)
+                for lane in orders]
+    
+    def core_busy_time(self) -> list:
+        busy = [0] * self.cores
+        for i in self.order:
+            busy[self.core[i]] += self.completion_time[i] - self.start_time[i]
+        return busy
@@ -0,0 +1,113 @@
+import numpy as np
+from models.process import Process
+from models.schedule import ScheduleResult
+
+
+class Workload:
+    # Struct-of-arrays: một mảng cho mỗi cột thay vì một object Process mỗi dòng
+
+    def __init__(self, pid, arrival_time, burst_time, priority=None):
+        # pid có thể là hàm trả về mảng: chỉ decode khi thật sự cần (xem utils.trace_format)
+        self._pid = pid if callable(pid) else np.asarray(pid)
+        self.arrival_time = np.asarray(arrival_time, dtype=np.int64)
+        self.burst_time = np.asarray(burst_time, dtype=np.int64)
+        if priority is None:
+            priority = np.zeros(len(self.arrival_time), dtype=np.int64)
+        self.priority = np.asarray(priority, dtype=np.int64)
+
+    @property
+    def pid(self) -> np.ndarray:
+        if callable(self._pid):
+            self._pid = np.asarray(self._pid())
+        return self._pid
+
+    def __len__(self):
+        return len(self.arrival_time)
+
+    def __repr__(self):
+        return f"Workload({len(self)} jobs)"
+
+    @classmethod
+    def from_processes(cls, processes: list) -> 'Workload':
+        return cls(
+            pid=[p.pid for p in processes],
+            arrival_time=[p.arrival_time for p in processes],
+            burst_time=[p.burst_time for p in processes],
+            priority=[p.priority for p in processes]
+        )
+
+    def arrival_order(self) -> np.ndarray:
+        # Thứ tự (arrival, pid) giống sorted() trong fcfs_scheduling
+        return np.lexsort((self.pid, self.arrival_time))
+
+    def to_processes(self) -> list:
+        # Dựng lại list Process (theo thứ tự workload) cho console UI / CSV export
+        return [Process(pid, arrival, burst, priority) for pid, arrival, burst, priority
+                in zip(self.pid.tolist(), self.arrival_time.tolist(),
+                       self.burst_time.tolist(), self.priority.tolist())]
+
+    def to_schedule_result(self, order, start_time, completion_time, slices: tuple = None,
+                           jobs: list = None) -> ScheduleResult:
+        # Kết quả vectorized -> ScheduleResult dùng chung display / export;
+        # jobs: list Process đã dựng sẵn từ workload này (không dựng lại)
+        if jobs is None:
+            jobs = self.to_processes()
+        return ScheduleResult(jobs, order, start_time, completion_time, slices)
+
+
+class WorkloadBatch:
+    # Nhiều workload gộp thành một bộ cột phẳng + offsets:
+    # workload k chiếm các dòng offsets[k] .. offsets[k + 1] - 1 của mọi cột
+
+    def __init__(self, workloads: list, names: list = None, order: np.ndarray = None):
+        # order: thứ tự (workload, arrival, tie-break) đã biết trước -> bỏ qua lexsort theo PID
+        lengths = [len(w) for w in workloads]
+        self.names = list(names) if names is not None else [str(k) for k in range(len(workloads))]
+        self.offsets = np.zeros(len(workloads) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self._workloads = workloads
+        if len(workloads) == 1:
+            # Một workload: dùng thẳng các cột, không copy
+            self.arrival_time = workloads[0].arrival_time
+            self.burst_time = workloads[0].burst_time
+            self.priority = workloads[0].priority
+        else:
+            self.arrival_time = np.concatenate([w.arrival_time for w in workloads] or [np.zeros(0, np.int64)])
+            self.burst_time = np.concatenate([w.burst_time for w in workloads] or [np.zeros(0, np.int64)])
+            self.priority = np.concatenate([w.priority for w in workloads] or [np.zeros(0, np.int64)])
+        self._pid = None
+        self._order = order
+
+    @property
+    def pid(self) -> np.ndarray:
+        # PID chỉ ghép khi cần (thứ tự tie-break); workload sinh ra dùng PID lazy
+        if self._pid is None:
+            self._pid = np.concatenate([np.asarray(w.pid, dtype=str) for w in self._workloads]
+                                       or [np.zeros(0, dtype=str)])
+        return self._pid
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __repr__(self):
+        return f"WorkloadBatch({len(self)} workloads, {self.job_count()} jobs)"
+
+    def job_count(self) -> int:
+        return int(self.offsets[-1])
+
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def segment_ids(self) -> np.ndarray:
+        # Số thứ tự workload của từng dòng
+        return np.repeat(np.arange(len(self)), self.lengths())
+
+    def workload(self, k: int) -> Workload:
+        return self._workloads[k]
+
+    def arrival_order(self) -> np.ndarray:
+        # Thứ tự (workload, arrival, pid) - trong mỗi workload giống Workload.arrival_order.
+        # Tính một lần, dùng chung cho mọi thuật toán chạy trên batch
+        if self._order is None:
+            self._order = np.lexsort((self.pid, self.arrival_time, self.segment_ids()))
+        return self._order
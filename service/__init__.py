@@ -0,0 +1 @@
+# service package
\ No newline at end of file
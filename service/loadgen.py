@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+
+from service.server import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE
+from utils.stress_test import summarize_timings
+
+
+# Load generator cho service.server: nhiều kết nối gửi submit theo batch,
+# đo latency từng request và throughput tổng, rồi drain và đếm completion event.
+
+class _Client:
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int, unix_path: str = None):
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def request(self, message: dict) -> dict:
+        self.writer.write((json.dumps(message) + "\n").encode('utf-8'))
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _submitter(client: _Client, batches: list, latencies: list) -> int:
+    accepted = 0
+    for batch in batches:
+        start = time.perf_counter_ns()
+        response = await client.request({'op': 'submit', 'jobs': batch})
+        latencies.append(time.perf_counter_ns() - start)
+        accepted += response.get('accepted', 0)
+        if not response.get('ok'):
+            print(f"[!] Submit rejected: {response.get('errors', response)}")
+    return accepted
+
+
+async def _count_completions(client: _Client, expected: int) -> int:
+    received = 0
+    while received < expected:
+        line = await client.reader.readline()
+        if not line:
+            break
+        if json.loads(line).get('event') == 'complete':
+            received += 1
+    return received
+
+
+async def run_load(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_path: str = None,
+                   jobs: int = 100_000, batch_size: int = 500, connections: int = 4,
+                   seed: int = 0) -> dict:
+    control = await _Client.connect(host, port, unix_path)
+    clock = (await control.request({'op': 'query'}))['state']['time']
+
+    rng = random.Random(seed)
+    # Arrival tăng dần từ đồng hồ hiện tại -> không job nào đến trước đồng hồ của scheduler
+    workload = []
+    arrival = clock
+    for i in range(jobs):
+        arrival += rng.randint(0, 3)
+        workload.append({'pid': f"L{i+1}", 'arrival': arrival, 'burst': rng.randint(1, 20)})
+    batches = [workload[i:i + batch_size] for i in range(0, jobs, batch_size)]
+
+    subscriber = await _Client.connect(host, port, unix_path)
+    await subscriber.request({'op': 'subscribe'})
+    clients = [await _Client.connect(host, port, unix_path) for _ in range(connections)]
+
+    latencies = []
+    start = time.perf_counter()
+    accepted = await asyncio.gather(*(_submitter(client, batches[k::connections], latencies)
+                                      for k, client in enumerate(clients)))
+    submit_elapsed = time.perf_counter() - start
+
+    # Chỉ chờ completion của các job được nhận (job bị từ chối không bao giờ hoàn thành)
+    completions = asyncio.create_task(_count_completions(subscriber, sum(accepted)))
+
+    await control.request({'op': 'drain'})
+    received = await completions
+    total_elapsed = time.perf_counter() - start
+    state = await control.request({'op': 'query'})
+
+    for client in clients + [subscriber, control]:
+        await client.close()
+
+    summary = summarize_timings(latencies) if latencies else {'median': 0, 'p95': 0}
+    return {
+        'jobs': jobs,
+        'requests': len(latencies),
+        'submit_seconds': submit_elapsed,
+        'total_seconds': total_elapsed,
+        'jobs_per_second': jobs / submit_elapsed if submit_elapsed > 0 else 0,
+        'latency_median_ms': summary['median'] * 1e3,
+        'latency_p95_ms': summary['p95'] * 1e3,
+        'latency_mean_ms': statistics.fmean(latencies) / 1e6 if latencies else 0,
+        'completions': received,
+        'state': state.get('state', {})
+    }
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Load generator for the scheduling service')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', type=str, default=None, help='Connect to a Unix socket instead')
+    parser.add_argument('--jobs', type=int, default=100_000, help='Total jobs to submit')
+    parser.add_argument('--batch', type=int, default=500, help='Jobs per submit request')
+    parser.add_argument('--connections', type=int, default=4, help='Concurrent submitting connections')
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    try:
+        report = asyncio.run(run_load(args.host, args.port, args.unix, args.jobs,
+                                      args.batch, args.connections, args.seed))
+    except OSError as e:
+        print(f"[✗] Could not connect to service: {e}")
+        return 1
+
+    print("\n" + "=" * 55)
+    print("  LOAD TEST RESULTS")
+    print("=" * 55)
+    print(f"  Jobs submitted          : {report['jobs']} in {report['requests']} requests")
+    print(f"  Submit throughput       : {report['jobs_per_second']:.0f} jobs/s")
+    print(f"  Request latency median  : {report['latency_median_ms']:.3f} ms")
+    print(f"  Request latency p95     : {report['latency_p95_ms']:.3f} ms")
+    print(f"  Completion events       : {report['completions']}")
+    print(f"  End-to-end time         : {report['total_seconds']:.3f} s")
+    if report['state'].get('avg_waiting_time') is not None:
+        print(f"  Average Waiting Time    : {report['state']['avg_waiting_time']:.2f}")
+    print("-" * 55)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
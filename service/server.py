@@ -0,0 +1,229 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import traceback
+
+from models.process import Process
+from algorithms.online import OnlineScheduler, ONLINE_POLICIES
+
+
+# Giao thức: mỗi dòng một object JSON, phản hồi cũng một dòng JSON (có "id" nếu request có)
+#   {"op": "submit", "jobs": [{"pid": "P1", "arrival": 0, "burst": 5, "priority": 0}, ...]}
+#   {"op": "advance", "time": 100}       {"op": "drain"}
+#   {"op": "query"}                      {"op": "subscribe"}      {"op": "ping"}
+# Subscriber nhận mỗi sự kiện thành một dòng {"event": "complete", ...}
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BATCH = 1024            # số lệnh tối đa gom vào một lượt của scheduler
+COMMAND_QUEUE_SIZE = 4096   # đầy -> reader ngừng đọc socket (backpressure)
+SUBSCRIBER_QUEUE_SIZE = 10_000
+MAX_LINE = 16 * 1024 * 1024
+MAX_TIME = 2 ** 63 - 1        # thời gian/burst lưu trong int64 như các bộ đọc CSV
+
+
+def _event_to_dict(event) -> dict:
+    message = {'event': event.kind, 'time': event.time, 'pid': event.pid}
+    if event.row is not None:
+        message.update({
+            'start': event.row.start_time,
+            'completion': event.row.completion_time,
+            'waiting': event.row.waiting_time,
+            'turnaround': event.row.turnaround_time
+        })
+    return message
+
+
+def _as_int(value, name: str) -> int:
+    # JSON number/string -> int; inf/nan, bool và giá trị ngoài int64 -> ValueError
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a number, got {value!r}")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"{name} must be finite, got {value!r}")
+    number = int(value)
+    if not -MAX_TIME <= number <= MAX_TIME:
+        raise ValueError(f"{name} out of range: {value!r}")
+    return number
+
+
+class SchedulerService:
+    # Một scheduler "ấm" dùng chung cho mọi kết nối.
+    # Chỉ một task (_scheduler_loop) chạm vào OnlineScheduler -> không cần lock.
+
+    def __init__(self, policy: str = 'SJF'):
+        self.scheduler = OnlineScheduler(policy)
+        self.commands = asyncio.Queue(maxsize=COMMAND_QUEUE_SIZE)
+        self.subscribers = set()
+        self.stats = {'connections': 0, 'submitted': 0, 'rejected': 0, 'batches': 0}
+
+    async def _publish(self, events: list):
+        # put() chờ khi queue subscriber đầy -> scheduler chậm lại theo subscriber chậm nhất
+        for event in events:
+            message = _event_to_dict(event)
+            for queue in list(self.subscribers):
+                if queue in self.subscribers:
+                    await queue.put(message)
+
+    def _submit(self, request: dict) -> dict:
+        jobs = request.get('jobs')
+        if jobs is None:
+            jobs = [request.get('job', request)]
+        accepted, errors = 0, []
+        for job in jobs:
+            try:
+                process = Process(str(job['pid']), _as_int(job['arrival'], 'arrival'),
+                                  _as_int(job['burst'], 'burst'),
+                                  _as_int(job.get('priority', 0), 'priority'))
+                # Cùng luật với RowValidator của các bộ đọc CSV
+                if process.burst_time <= 0:
+                    raise ValueError("burst must be positive")
+                if process.arrival_time < 0:
+                    raise ValueError("arrival must not be negative")
+                self.scheduler.submit(process)
+                accepted += 1
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"{job!r}: {e}")
+        self.stats['submitted'] += accepted
+        self.stats['rejected'] += len(errors)
+        response = {'ok': not errors, 'accepted': accepted}
+        if errors:
+            response['rejected'] = len(errors)
+            response['errors'] = errors[:10]
+        return response
+
+    async def _execute(self, request: dict) -> dict:
+        op = request.get('op')
+        if op == 'submit':
+            return self._submit(request)
+        if op == 'advance':
+            events = self.scheduler.advance_to(_as_int(request['time'], 'time'))
+            await self._publish(events)
+            return {'ok': True, 'events': len(events), 'time': self.scheduler.current_time}
+        if op == 'drain':
+            events = self.scheduler.drain()
+            await self._publish(events)
+            return {'ok': True, 'events': len(events), 'time': self.scheduler.current_time}
+        if op == 'query':
+            return {'ok': True, 'state': self.scheduler.snapshot(), 'service': dict(self.stats)}
+        if op == 'ping':
+            return {'ok': True}
+        return {'ok': False, 'error': f"unknown op '{op}'"}
+
+    async def _scheduler_loop(self):
+        while True:
+            batch = [await self.commands.get()]
+            while len(batch) < MAX_BATCH and not self.commands.empty():
+                batch.append(self.commands.get_nowait())
+            self.stats['batches'] += 1
+
+            for request, future in batch:
+                try:
+                    response = await self._execute(request)
+                except (KeyError, TypeError, ValueError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                except Exception as e:
+                    # Lỗi bất ngờ chỉ làm hỏng request này, task scheduler vẫn chạy tiếp
+                    traceback.print_exc(file=sys.stderr)
+                    response = {'ok': False, 'error': f"internal error: {type(e).__name__}: {e}"}
+                if not future.done():
+                    future.set_result(response)
+
+    async def _stream_events(self, queue: asyncio.Queue, writer: asyncio.StreamWriter):
+        while True:
+            message = await queue.get()
+            writer.write((json.dumps(message) + "\n").encode('utf-8'))
+            await writer.drain()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.stats['connections'] += 1
+        loop = asyncio.get_running_loop()
+        subscription = None
+        stream_task = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"invalid JSON: {e}"}
+                else:
+                    if request.get('op') == 'subscribe':
+                        if subscription is None:
+                            subscription = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+                            self.subscribers.add(subscription)
+                            stream_task = asyncio.create_task(self._stream_events(subscription, writer))
+                        response = {'ok': True, 'subscribed': True}
+                    else:
+                        future = loop.create_future()
+                        await self.commands.put((request, future))
+                        response = await future
+                    if 'id' in request:
+                        response['id'] = request['id']
+
+                writer.write((json.dumps(response) + "\n").encode('utf-8'))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if subscription is not None:
+                self.subscribers.discard(subscription)
+                stream_task.cancel()
+                # Giải phóng scheduler nếu nó đang chờ put() vào queue này
+                while not subscription.empty():
+                    subscription.get_nowait()
+            writer.close()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                    unix_path: str = None):
+        scheduler_task = asyncio.create_task(self._scheduler_loop())
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path, limit=MAX_LINE)
+            where = unix_path
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+            where = f"{host}:{server.sockets[0].getsockname()[1]}"
+
+        print(f"[✓] Scheduler service ({self.scheduler.policy}) listening on {where}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            scheduler_task.cancel()
+            if unix_path and os.path.exists(unix_path):
+                os.unlink(unix_path)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='CPU Scheduling service (newline-delimited JSON)')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST,
+                        help=f'TCP host to bind (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'TCP port to bind (default: {DEFAULT_PORT})')
+    parser.add_argument('--unix', type=str, default=None,
+                        help='Listen on a Unix socket at this path instead of TCP')
+    parser.add_argument('--policy', type=str, default='SJF', choices=list(ONLINE_POLICIES),
+                        help='Scheduling policy (default: SJF)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    service = SchedulerService(args.policy)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\n[INFO] Service stopped.")
+    except OSError as e:
+        print(f"[✗] Could not start service: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from algorithms.batch import BATCH_ALGORITHMS, schedule_batch
+from algorithms.registry import run_algorithm_spec
+from models.process import Process
+from models.workload import Workload, WorkloadBatch
+from tests.test_engine import result_schedule
+from tests.test_sjf import random_workload
+
+HUGE = 4 * 10 ** 18     # vài workload * HUGE vượt int64 nếu gộp khoá bằng phép nhân
+
+
+def batch_schedules(workloads: list, spec: str) -> list:
+    # -> {pid: (start, completion)} cho từng workload, lấy từ một lần schedule_batch
+    batch = WorkloadBatch([Workload.from_processes(w) for w in workloads])
+    start_time, completion_time = schedule_batch(batch, spec)
+    schedules = []
+    for k, processes in enumerate(workloads):
+        lo, hi = batch.offsets[k], batch.offsets[k + 1]
+        schedules.append(dict(zip([p.pid for p in processes],
+                                  zip(start_time[lo:hi].tolist(), completion_time[lo:hi].tolist()))))
+    return schedules
+
+
+@pytest.mark.parametrize("spec", list(BATCH_ALGORITHMS))
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_single_cpu_per_workload(seed, spec):
+    rng = random.Random(seed)
+    workloads = [[Process(p.pid, p.arrival_time, p.burst_time, rng.randint(-3, 3))
+                  for p in random_workload(rng, rng.randint(0, 30), rng.choice([0, 10, 200]), 10)]
+                 for _ in range(rng.randint(1, 6))]
+    expected = [result_schedule(run_algorithm_spec(spec, w)) for w in workloads]
+    assert batch_schedules(workloads, spec) == expected
+
+
+@pytest.mark.parametrize("spec", list(BATCH_ALGORITHMS))
+def test_huge_values_do_not_overflow(spec):
+    # Arrival, burst và priority gần giới hạn int64: key * n, k * BASE và priority - min
+    # đều tràn nếu tính trực tiếp trên int64
+    workloads = [[Process("A", 0, HUGE, HUGE), Process("B", 1, 2, -HUGE), Process("C", 1, 1, 0)],
+                 [Process("A", HUGE, 5, 1), Process("B", 0, 3, 2)],
+                 [Process("X", HUGE, HUGE // 2, -HUGE), Process("Y", 7, 1, HUGE)]]
+    expected = [result_schedule(run_algorithm_spec(spec, w)) for w in workloads]
+    assert batch_schedules(workloads, spec) == expected
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from algorithms.engine import run_event_schedule
+from algorithms.priority import priority_non_preemptive, priority_preemptive
+from algorithms.round_robin import round_robin_scheduling
+from algorithms.srtf import srtf_scheduling
+from models.process import Process
+from tests.test_sjf import random_workload
+
+
+def unit_step_schedule(processes: list, key, preemptive: bool) -> list:
+    # Mô phỏng từng đơn vị thời gian, không heap: mỗi bước chọn job có khoá nhỏ nhất
+    # (preemptive) hoặc giữ job đang chạy tới khi xong. -> timeline: pid mỗi đơn vị (None = rảnh)
+    remaining = {p.pid: p.burst_time for p in processes}
+    timeline = []
+    current = None
+    t = 0
+    while any(remaining.values()):
+        if current is None or preemptive:
+            ready = [p for p in processes if p.arrival_time <= t and remaining[p.pid]]
+            current = min(ready, key=lambda p: key(p, remaining[p.pid])) if ready else None
+        if current is None:
+            timeline.append(None)
+        else:
+            timeline.append(current.pid)
+            remaining[current.pid] -= 1
+            if not remaining[current.pid]:
+                current = None
+        t += 1
+    return timeline
+
+
+def result_timeline(result) -> list:
+    # Slices của ScheduleResult -> cùng dạng timeline từng đơn vị
+    timeline = []
+    for job, start, end in zip(result.slice_job, result.slice_start, result.slice_end):
+        timeline.extend([None] * (start - len(timeline)))
+        assert len(timeline) == start, "slices overlap or go back in time"
+        timeline.extend([result.jobs[job].pid] * (end - start))
+    return timeline
+
+
+def timeline_schedule(timeline: list) -> dict:
+    # -> {pid: (start, completion)}
+    schedule = {}
+    for t, pid in enumerate(timeline):
+        if pid is not None:
+            schedule[pid] = (schedule.get(pid, (t,))[0], t + 1)
+    return schedule
+
+
+def result_schedule(result) -> dict:
+    return {row.pid: (row.start_time, row.completion_time) for row in result}
+
+
+SCHEDULERS = [
+    ('SRTF', srtf_scheduling),
+    ('PRIORITY', priority_non_preemptive),
+    ('PRIORITY-P', priority_preemptive),
+    ('RR:1', lambda processes: round_robin_scheduling(processes, 1)),
+    ('RR:3', lambda processes: round_robin_scheduling(processes, 3)),
+]
+
+
+@pytest.mark.parametrize("name, scheduler", SCHEDULERS)
+@pytest.mark.parametrize("seed", range(20))
+def test_slices_are_consistent(name, scheduler, seed):
+    # Bất biến chung của engine: slice không chồng nhau, không chạy trước khi đến,
+    # tổng slice = burst, start/completion khớp slice đầu/cuối, order theo completion
+    rng = random.Random(seed)
+    processes = [Process(p.pid, p.arrival_time, p.burst_time, rng.randint(0, 3))
+                 for p in random_workload(rng, rng.randint(1, 40), rng.choice([0, 10, 200]), 8)]
+    result = scheduler(processes)
+    timeline = result_timeline(result)
+    arrival = {p.pid: p.arrival_time for p in processes}
+    assert all(pid is None or t >= arrival[pid] for t, pid in enumerate(timeline))
+    assert {pid: timeline.count(pid) for pid in arrival} == {p.pid: p.burst_time for p in processes}
+    assert timeline_schedule(timeline) == result_schedule(result)
+    completions = [result.completion_time[i] for i in result.order]
+    assert sorted(result.order) == list(range(len(processes)))
+    assert completions == sorted(completions)
+
+
+def test_custom_key_and_sequence_tie_break():
+    # Khoá bằng nhau -> thứ tự vào ready queue (arrival, pid) quyết định
+    processes = [Process("B", 0, 2), Process("A", 0, 2), Process("C", 1, 1)]
+    result = run_event_schedule(processes, key=lambda p, remaining: 0)
+    assert result_schedule(result) == {"A": (0, 2), "B": (2, 4), "C": (4, 5)}
+
+
+def test_workload_not_modified():
+    processes = random_workload(random.Random(11), 30, 20, 6)
+    snapshot = [(p.pid, p.arrival_time, p.burst_time) for p in processes]
+    for _, scheduler in SCHEDULERS:
+        scheduler(processes)
+    assert [(p.pid, p.arrival_time, p.burst_time) for p in processes] == snapshot
+
+
+@pytest.mark.parametrize("_, scheduler", SCHEDULERS)
+def test_empty_workload(_, scheduler):
+    result = scheduler([])
+    assert len(result.order) == 0 and result_timeline(result) == []
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from algorithms.mlfq import level_quanta, mlfq_scheduling
+from algorithms.round_robin import round_robin_scheduling
+from models.process import Process
+from tests.test_engine import result_schedule, result_timeline
+from tests.test_sjf import random_workload
+
+
+def level_of(used: int, quanta: list) -> int:
+    # Tầng của job đã chạy `used` đơn vị khi không có boost / aging / preempt:
+    # tầng k dùng hết quanta[k] thì xuống tầng k + 1, tầng cuối giữ nguyên
+    for k, quantum in enumerate(quanta):
+        if used < quantum:
+            return k
+        used -= quantum
+    return len(quanta) - 1
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 3, 5])
+@pytest.mark.parametrize("seed", range(25))
+def test_single_level_is_round_robin(seed, quantum):
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    processes = random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 10 * n]),
+                                max_burst=rng.choice([1, 3, 12]))
+    mlfq = mlfq_scheduling(processes, levels=1, quantum=quantum, boost=0, aging=0)
+    rr = round_robin_scheduling(processes, quantum)
+    assert result_timeline(mlfq) == result_timeline(rr)
+    assert result_schedule(mlfq) == result_schedule(rr)
+
+
+@pytest.mark.parametrize("levels, quantum", [(2, 1), (3, 2), (4, 1), (3, 3)])
+@pytest.mark.parametrize("seed", range(20))
+def test_runs_highest_level_within_quantum(seed, levels, quantum):
+    # Mọi job đến lúc 0, không boost / aging -> tầng của job suy ra từ số đơn vị đã chạy.
+    # Slice liền nhau của cùng job bị gộp, nên kiểm tra từng đơn vị thời gian: job đang
+    # chạy phải ở tầng cao nhất còn job. Slice vượt quantum của tầng mình trong khi job
+    # khác còn chờ ở tầng đó -> job đang chạy đã sang tầng dưới -> sai.
+    rng = random.Random(seed)
+    processes = random_workload(rng, rng.randint(1, 15), max_arrival=0, max_burst=rng.choice([3, 20]))
+    quanta = level_quanta(levels, quantum)
+    timeline = result_timeline(mlfq_scheduling(processes, levels, quantum, boost=0, aging=0))
+    remaining = {p.pid: p.burst_time for p in processes}
+    used = dict.fromkeys(remaining, 0)
+    for pid in timeline:
+        running = level_of(used[pid], quanta)
+        waiting = [level_of(used[other], quanta) for other in remaining
+                   if other != pid and remaining[other]]
+        assert running <= min(waiting, default=running)
+        used[pid] += 1
+        remaining[pid] -= 1
+    assert not any(remaining.values())
+
+
+def test_demotion_sequence():
+    processes = [Process("A", 0, 10), Process("B", 0, 10)]
+    timeline = result_timeline(mlfq_scheduling(processes, levels=3, quantum=2, boost=0, aging=0))
+    assert timeline == ["A"] * 2 + ["B"] * 2 + ["A"] * 4 + ["B"] * 4 + ["A"] * 4 + ["B"] * 4
+
+
+def test_arrival_preempts_lower_level():
+    # A xuống tầng 1 lúc 2; B đến lúc 3 giành CPU, A giữ tầng 1 và được lại trọn quantum 4
+    processes = [Process("A", 0, 10), Process("B", 3, 1)]
+    result = mlfq_scheduling(processes, levels=3, quantum=2, boost=0, aging=0)
+    assert result_timeline(result) == ["A"] * 3 + ["B"] + ["A"] * 7
+    assert result_schedule(result) == {"A": (0, 11), "B": (3, 4)}
+
+
+def test_rejects_invalid_parameters():
+    for kwargs in ({'levels': 0}, {'quantum': 0}, {'boost': -1}, {'aging': -1},
+                   {'levels': 2, 'quanta': [2]}):
+        with pytest.raises(ValueError):
+            mlfq_scheduling([Process("P1", 0, 1)], **kwargs)
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from algorithms.fcfs import fcfs_scheduling
+from algorithms.multicore import QUEUE_MODES, multicore_scheduling
+from algorithms.priority import priority_non_preemptive
+from algorithms.sjf import sjf_non_preemptive
+from models.process import Process
+from tests.test_engine import result_schedule
+from tests.test_sjf import random_workload
+
+SINGLE_CPU = {
+    'FCFS': fcfs_scheduling,
+    'SJF': sjf_non_preemptive,
+    'PRIORITY': priority_non_preemptive,
+}
+
+
+def random_jobs(rng: random.Random) -> list:
+    n = rng.randint(1, 50)
+    return [Process(p.pid, p.arrival_time, p.burst_time, rng.randint(0, 3))
+            for p in random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 10 * n]),
+                                     max_burst=rng.choice([1, 3, 12]))]
+
+
+@pytest.mark.parametrize("queue_mode", QUEUE_MODES)
+@pytest.mark.parametrize("policy", list(SINGLE_CPU))
+@pytest.mark.parametrize("seed", range(15))
+def test_one_core_matches_single_cpu(seed, policy, queue_mode):
+    processes = random_jobs(random.Random(seed))
+    result = multicore_scheduling(processes, cores=1, policy=policy, queue_mode=queue_mode)
+    assert result_schedule(result) == result_schedule(SINGLE_CPU[policy](processes))
+
+
+@pytest.mark.parametrize("queue_mode", QUEUE_MODES)
+@pytest.mark.parametrize("cores", [2, 3, 8])
+@pytest.mark.parametrize("seed", range(15))
+def test_no_overlap_on_a_core(seed, cores, queue_mode):
+    processes = random_jobs(random.Random(seed))
+    result = multicore_scheduling(processes, cores=cores, policy='SJF', queue_mode=queue_mode)
+    assert sorted(result.order) == list(range(len(processes)))
+    for i, p in enumerate(processes):
+        assert 0 <= result.core[i] < cores
+        assert result.start_time[i] >= p.arrival_time
+        assert result.completion_time[i] - result.start_time[i] == p.burst_time
+    for lane in result.lanes():
+        spans = [(result.start_time[i], result.completion_time[i]) for i in lane.order]
+        assert all(prev_end <= start for (_, prev_end), (start, _) in zip(spans, spans[1:]))
+    assert sum(result.core_busy_time()) == sum(p.burst_time for p in processes)
+
+
+def test_idle_core_takes_waiting_job():
+    # global: core rảnh lấy job đầu hàng chung; per-core: job chia vòng tròn, P4 vào hàng core 1
+    processes = [Process("P1", 0, 10), Process("P2", 0, 2), Process("P3", 1, 4), Process("P4", 1, 4)]
+    result = multicore_scheduling(processes, cores=2, policy='FCFS', queue_mode='global')
+    assert result_schedule(result) == {"P1": (0, 10), "P2": (0, 2), "P3": (2, 6), "P4": (6, 10)}
+    result = multicore_scheduling(processes, cores=2, policy='FCFS', queue_mode='per-core')
+    assert result_schedule(result) == {"P1": (0, 10), "P2": (0, 2), "P4": (2, 6), "P3": (6, 10)}
+
+
+def test_work_stealing():
+    # P3, P5 vào hàng core 0 (bận tới 10); core 1 chạy P4 của mình rồi trộm cả P3 lẫn P5
+    processes = [Process("P1", 0, 10), Process("P2", 0, 2), Process("P3", 1, 1),
+                 Process("P4", 1, 1), Process("P5", 1, 1)]
+    result = multicore_scheduling(processes, cores=2, policy='FCFS', queue_mode='per-core')
+    assert [result.core[i] for i in range(5)] == [0, 1, 1, 1, 1]
+    assert result_schedule(result)["P5"] == (4, 5)
+
+
+def test_rejects_invalid_options():
+    for kwargs in ({'cores': 0}, {'policy': 'RR'}, {'queue_mode': 'shared'}):
+        with pytest.raises(ValueError):
+            multicore_scheduling([Process("P1", 0, 1)], **kwargs)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from algorithms.priority import priority_non_preemptive, priority_preemptive
+from models.process import Process
+from tests.test_engine import result_schedule, result_timeline, unit_step_schedule
+from tests.test_sjf import random_workload
+
+
+def priority_key(p, remaining):
+    # Số nhỏ hơn = ưu tiên cao hơn; hoà -> arrival, rồi PID
+    return (p.priority, p.arrival_time, p.pid)
+
+
+def random_priority_workload(rng: random.Random, n: int) -> list:
+    processes = random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 10 * n]),
+                                max_burst=rng.choice([1, 3, 12]))
+    levels = rng.choice([1, 3, 10])
+    return [Process(p.pid, p.arrival_time, p.burst_time, rng.randint(0, levels - 1))
+            for p in processes]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_non_preemptive_matches_unit_step(seed):
+    processes = random_priority_workload(random.Random(seed), random.Random(seed).randint(1, 40))
+    assert result_timeline(priority_non_preemptive(processes)) == \
+        unit_step_schedule(processes, priority_key, preemptive=False)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_preemptive_matches_unit_step(seed):
+    processes = random_priority_workload(random.Random(seed), random.Random(seed).randint(1, 40))
+    assert result_timeline(priority_preemptive(processes)) == \
+        unit_step_schedule(processes, priority_key, preemptive=True)
+
+
+def test_ties_on_priority_and_arrival():
+    # So sánh PID theo chuỗi: "P10" < "P2"
+    processes = [Process("P2", 1, 2, 1), Process("P10", 1, 2, 1), Process("P1", 0, 3, 1),
+                 Process("P3", 1, 1, 0)]
+    assert result_schedule(priority_non_preemptive(processes)) == \
+        {"P1": (0, 3), "P3": (3, 4), "P10": (4, 6), "P2": (6, 8)}
+    assert result_schedule(priority_preemptive(processes)) == \
+        {"P1": (0, 4), "P3": (1, 2), "P10": (4, 6), "P2": (6, 8)}
+
+
+def test_idle_gap_and_preemption():
+    processes = [Process("P1", 0, 4, 2), Process("P2", 10, 5, 2), Process("P3", 12, 2, 0)]
+    assert result_schedule(priority_preemptive(processes)) == \
+        {"P1": (0, 4), "P2": (10, 17), "P3": (12, 14)}
+    assert result_schedule(priority_non_preemptive(processes)) == \
+        {"P1": (0, 4), "P2": (10, 15), "P3": (15, 17)}
@@ -0,0 +1,74 @@
+import random
+from collections import deque
+
+import pytest
+
+from algorithms.round_robin import round_robin_scheduling
+from models.process import Process
+from tests.test_engine import result_schedule, result_timeline
+from tests.test_sjf import random_workload
+
+
+def brute_round_robin(processes: list, quantum: int) -> list:
+    # Từng đơn vị thời gian với hàng đợi FIFO. Job đến đúng lúc hết quantum
+    # vào hàng trước job vừa hết quantum. -> timeline: pid mỗi đơn vị (None = rảnh)
+    jobs = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    remaining = {p.pid: p.burst_time for p in processes}
+    queue = deque()
+    timeline = []
+    current, used, upcoming, t = None, 0, 0, 0
+    while upcoming < len(jobs) or queue or current is not None:
+        while upcoming < len(jobs) and jobs[upcoming].arrival_time <= t:
+            queue.append(jobs[upcoming].pid)
+            upcoming += 1
+        if current is not None and used == quantum:
+            queue.append(current)
+            current = None
+        if current is None and queue:
+            current, used = queue.popleft(), 0
+        if current is None:
+            timeline.append(None)
+        else:
+            timeline.append(current)
+            remaining[current] -= 1
+            used += 1
+            if not remaining[current]:
+                current = None
+        t += 1
+    return timeline
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 3, 5])
+@pytest.mark.parametrize("seed", range(25))
+def test_matches_unit_step_on_random_workloads(seed, quantum):
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    processes = random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 10 * n]),
+                                max_burst=rng.choice([1, 3, 12]))
+    assert result_timeline(round_robin_scheduling(processes, quantum)) == \
+        brute_round_robin(processes, quantum)
+
+
+def test_arrival_at_quantum_boundary_goes_first():
+    # P2 đến đúng lúc P1 hết quantum -> P2 chạy trước, P1 về cuối hàng
+    processes = [Process("P1", 0, 5), Process("P2", 2, 2)]
+    timeline = result_timeline(round_robin_scheduling(processes, 2))
+    assert timeline == ["P1", "P1", "P2", "P2", "P1", "P1", "P1"]
+
+
+def test_arrival_inside_quantum_of_lone_job():
+    # P1 chạy một mình; P2 đến giữa quantum -> P1 giữ CPU tới hết quantum đó
+    processes = [Process("P1", 0, 10), Process("P2", 4, 2)]
+    timeline = result_timeline(round_robin_scheduling(processes, 3))
+    assert timeline == ["P1"] * 6 + ["P2"] * 2 + ["P1"] * 4 == brute_round_robin(processes, 3)
+
+
+def test_idle_gap():
+    processes = [Process("P1", 0, 3), Process("P2", 8, 4), Process("P3", 9, 1)]
+    assert result_schedule(round_robin_scheduling(processes, 2)) == \
+        {"P1": (0, 3), "P2": (8, 13), "P3": (10, 11)}
+
+
+def test_rejects_non_positive_quantum():
+    with pytest.raises(ValueError):
+        round_robin_scheduling([Process("P1", 0, 1)], 0)
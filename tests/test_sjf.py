@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from algorithms.sjf import sjf_non_preemptive, sjf_stream
+from models.process import Process
+
+
+def baseline_sjf(processes: list) -> dict:
+    # Vòng quét O(n^2) cũ (trước heap engine), giữ nguyên thứ tự chọn:
+    # list sort theo (arrival, pid), chọn burst nhỏ nhất bằng so sánh '<' -> hoà thì
+    # job đứng trước (arrival, pid nhỏ hơn) thắng. Khác bản cũ: đếm theo số job đã xong
+    # thay vì range(n), vì vòng CPU rảnh không được tiêu mất một lượt chọn.
+    # -> {pid: (start, completion)}
+    jobs = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    n = len(jobs)
+    completed = [False] * n
+    current_time = 0
+    schedule = {}
+
+    while len(schedule) < n:
+        min_burst = float('inf')
+        shortest_idx = -1
+        for i, process in enumerate(jobs):
+            if (not completed[i] and
+                    process.arrival_time <= current_time and
+                    process.burst_time < min_burst):
+                min_burst = process.burst_time
+                shortest_idx = i
+        if shortest_idx == -1:
+            current_time = min(p.arrival_time for i, p in enumerate(jobs) if not completed[i])
+            continue
+
+        process = jobs[shortest_idx]
+        schedule[process.pid] = (current_time, current_time + process.burst_time)
+        current_time += process.burst_time
+        completed[shortest_idx] = True
+    return schedule
+
+
+def random_workload(rng: random.Random, n: int, max_arrival: int, max_burst: int) -> list:
+    # Khoảng arrival / burst nhỏ -> nhiều job trùng arrival và trùng burst;
+    # max_arrival lớn so với tổng burst -> có khoảng CPU rảnh
+    pids = [f"P{i}" for i in range(1, n + 1)]
+    rng.shuffle(pids)
+    return [Process(pid, rng.randint(0, max_arrival), rng.randint(1, max_burst))
+            for pid in pids]
+
+
+def heap_schedule(processes: list) -> dict:
+    return {row.pid: (row.start_time, row.completion_time)
+            for row in sjf_non_preemptive(processes)}
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_baseline_on_random_workloads(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 60)
+    processes = random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 20 * n]),
+                                max_burst=rng.choice([1, 3, 20]))
+    assert heap_schedule(processes) == baseline_sjf(processes)
+
+
+def test_idle_gaps():
+    processes = [Process("P1", 0, 3), Process("P2", 10, 2), Process("P3", 10, 1),
+                 Process("P4", 30, 5)]
+    expected = {"P1": (0, 3), "P3": (10, 11), "P2": (11, 13), "P4": (30, 35)}
+    assert baseline_sjf(processes) == expected
+    assert heap_schedule(processes) == expected
+
+
+def test_ties_on_burst_and_arrival():
+    # Cùng burst: arrival sớm hơn trước, rồi tới PID (so sánh chuỗi như bản cũ)
+    processes = [Process("P10", 1, 2), Process("P2", 1, 2), Process("P1", 0, 4),
+                 Process("P3", 2, 2)]
+    assert heap_schedule(processes) == baseline_sjf(processes)
+    order = [row.pid for row in sorted(sjf_non_preemptive(processes), key=lambda r: r.start_time)]
+    assert order == ["P1", "P10", "P2", "P3"]
+
+
+def test_workload_not_modified():
+    processes = random_workload(random.Random(7), 30, 40, 5)
+    snapshot = [(p.pid, p.arrival_time, p.burst_time) for p in processes]
+    sjf_non_preemptive(processes)
+    assert [(p.pid, p.arrival_time, p.burst_time) for p in processes] == snapshot
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_stream_matches_baseline(seed):
+    rng = random.Random(seed)
+    processes = random_workload(rng, 40, 100, 10)
+    ordered = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    streamed = {row.pid: (row.start_time, row.completion_time) for row in sjf_stream(ordered)}
+    assert streamed == baseline_sjf(processes)
+
+
+def test_empty_workload():
+    assert heap_schedule([]) == baseline_sjf([]) == {}
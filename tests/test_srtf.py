@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from algorithms.srtf import srtf_scheduling
+from models.process import Process
+from tests.test_engine import result_schedule, result_timeline, timeline_schedule, unit_step_schedule
+from tests.test_sjf import random_workload
+
+
+def srtf_key(p, remaining):
+    return (remaining, p.arrival_time, p.pid)
+
+
+def brute_srtf(processes: list) -> list:
+    return unit_step_schedule(processes, srtf_key, preemptive=True)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_unit_step_on_random_workloads(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    processes = random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 10 * n]),
+                                max_burst=rng.choice([1, 3, 12]))
+    assert result_timeline(srtf_scheduling(processes)) == brute_srtf(processes)
+
+
+def test_preempts_on_shorter_arrival():
+    processes = [Process("P1", 0, 8), Process("P2", 1, 4), Process("P3", 2, 9), Process("P4", 3, 5)]
+    assert result_schedule(srtf_scheduling(processes)) == \
+        {"P1": (0, 17), "P2": (1, 5), "P4": (5, 10), "P3": (17, 26)}
+
+
+def test_equal_remaining_does_not_preempt():
+    # P2 đến lúc P1 còn đúng 3 đơn vị: hoà remaining -> arrival sớm hơn (P1) giữ CPU
+    processes = [Process("P1", 0, 5), Process("P2", 2, 3)]
+    timeline = result_timeline(srtf_scheduling(processes))
+    assert timeline == ["P1"] * 5 + ["P2"] * 3 == brute_srtf(processes)
+
+
+def test_idle_gap():
+    processes = [Process("P1", 0, 2), Process("P2", 6, 3), Process("P3", 7, 1)]
+    result = srtf_scheduling(processes)
+    assert result_schedule(result) == {"P1": (0, 2), "P2": (6, 10), "P3": (7, 8)}
+    assert timeline_schedule(brute_srtf(processes)) == result_schedule(result)
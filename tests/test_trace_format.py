@@ -0,0 +1,85 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.batch import BATCH_ALGORITHMS, schedule_workload
+from algorithms.multicore import multicore_scheduling
+from algorithms.registry import run_algorithm_spec
+from algorithms.srtf import srtf_scheduling
+from models.process import Process
+from models.workload import Workload
+from tests.test_engine import result_schedule, result_timeline
+from tests.test_sjf import random_workload
+from utils.trace_format import (load_schedule_trace, load_trace, open_trace, read_pid,
+                                write_schedule_trace, write_trace)
+
+
+def sample_processes(seed: int = 0, n: int = 40) -> list:
+    rng = random.Random(seed)
+    return [Process(p.pid, p.arrival_time, p.burst_time, rng.randint(-2, 5))
+            for p in random_workload(rng, n, max_arrival=2 * n, max_burst=9)]
+
+
+def test_workload_round_trip(tmp_path):
+    processes = sample_processes() + [Process("Ünïcode", 3, 4, 1)]
+    path = write_trace(str(tmp_path / "w.trace"), Workload.from_processes(processes))
+    columns = open_trace(path)
+    workload = columns['workload']
+    # Cột đọc thẳng từ file map vào bộ nhớ, không copy
+    assert isinstance(workload.arrival_time.base, np.memmap)
+    assert workload.arrival_time.tolist() == [p.arrival_time for p in processes]
+    assert workload.burst_time.tolist() == [p.burst_time for p in processes]
+    assert workload.priority.tolist() == [p.priority for p in processes]
+    assert workload.pid.tolist() == [p.pid for p in processes]
+    assert read_pid(columns, len(processes) - 1) == "Ünïcode"
+    assert 'start_time' not in columns
+
+
+def test_empty_workload_round_trip(tmp_path):
+    path = write_trace(str(tmp_path / "empty.trace"), Workload.from_processes([]))
+    assert len(load_trace(path)) == 0
+
+
+def test_preemptive_schedule_keeps_slices(tmp_path):
+    processes = sample_processes(1)
+    result = srtf_scheduling(processes)
+    loaded = load_schedule_trace(write_schedule_trace(str(tmp_path / "srtf.trace"), result))
+    assert result_schedule(loaded) == result_schedule(result)
+    assert list(loaded.order) == list(result.order)
+    assert result_timeline(loaded) == result_timeline(result)
+
+
+def test_multicore_schedule_round_trip(tmp_path):
+    processes = sample_processes(2)
+    result = multicore_scheduling(processes, cores=3, policy='SJF')
+    loaded = load_schedule_trace(write_schedule_trace(str(tmp_path / "mc.trace"), result))
+    assert loaded.cores == 3
+    assert list(loaded.core) == list(result.core)
+    assert result_schedule(loaded) == result_schedule(result)
+    assert loaded.slice_job is None
+
+
+@pytest.mark.parametrize("spec", list(BATCH_ALGORITHMS))
+def test_schedule_workload_from_trace(tmp_path, spec):
+    processes = sample_processes(3)
+    path = write_trace(str(tmp_path / "w.trace"), Workload.from_processes(processes))
+    result = schedule_workload(load_trace(path), spec, processes)
+    expected = run_algorithm_spec(spec, processes)
+    assert result_schedule(result) == result_schedule(expected)
+    assert list(result.order) == list(expected.order)
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = write_schedule_trace(str(tmp_path / "cut.trace"), srtf_scheduling(sample_processes(4)))
+    with open(path, 'r+b') as f:
+        f.truncate(f.seek(0, 2) - 8)
+    with pytest.raises(ValueError, match="size mismatch"):
+        open_trace(path)
+
+
+def test_not_a_trace(tmp_path):
+    path = tmp_path / "bad.trace"
+    path.write_bytes(b"PID,ArrivalTime,BurstTime\n" * 4)
+    with pytest.raises(ValueError, match="bad magic"):
+        open_trace(str(path))
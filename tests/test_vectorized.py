@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.batch import fcfs_batch
+from algorithms.fcfs import fcfs_scheduling
+from algorithms.vectorized import fcfs_vectorized
+from models.workload import Workload, WorkloadBatch
+from tests.test_sjf import random_workload
+
+
+def fcfs_schedule(processes: list) -> dict:
+    return {row.pid: (row.start_time, row.completion_time) for row in fcfs_scheduling(processes)}
+
+
+def vectorized_schedule(processes: list) -> dict:
+    # Process -> Workload -> fcfs_vectorized -> ScheduleResult (qua converter)
+    workload = Workload.from_processes(processes)
+    result = workload.to_schedule_result(*fcfs_vectorized(workload))
+    return {row.pid: (row.start_time, row.completion_time) for row in result}
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_fcfs_on_random_workloads(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 60)
+    processes = random_workload(rng, n, max_arrival=rng.choice([0, 5, n, 20 * n]),
+                                max_burst=rng.choice([1, 3, 20]))
+    assert vectorized_schedule(processes) == fcfs_schedule(processes)
+
+
+def test_order_matches_fcfs():
+    processes = random_workload(random.Random(3), 40, 10, 5)
+    order, _, _ = fcfs_vectorized(Workload.from_processes(processes))
+    assert order.tolist() == list(fcfs_scheduling(processes).order)
+
+
+def test_workload_round_trip():
+    processes = random_workload(random.Random(5), 30, 50, 9)
+    back = Workload.from_processes(processes).to_processes()
+    assert [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in back] == \
+        [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+
+@pytest.mark.parametrize("count", [1, 2, 7])
+def test_batch_matches_fcfs_per_workload(count):
+    rng = random.Random(count)
+    workloads = [random_workload(rng, rng.randint(0, 40), rng.choice([0, 10, 200]), 10)
+                 for _ in range(count)]
+    batch = WorkloadBatch([Workload.from_processes(w) for w in workloads])
+    start_time, completion_time = fcfs_batch(batch)
+    for k, processes in enumerate(workloads):
+        lo, hi = batch.offsets[k], batch.offsets[k + 1]
+        pids = [p.pid for p in processes]
+        got = dict(zip(pids, zip(start_time[lo:hi].tolist(), completion_time[lo:hi].tolist())))
+        assert got == fcfs_schedule(processes)
+
+
+def test_empty_workload():
+    order, start_time, completion_time = fcfs_vectorized(Workload.from_processes([]))
+    assert len(order) == len(start_time) == len(completion_time) == 0
+    assert fcfs_batch(WorkloadBatch([Workload([], np.zeros(0), np.zeros(0))]))[1].size == 0
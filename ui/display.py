@@ -1,3 +1,10 @@
+from utils.calculator import COMPARISON_METRICS, SCHEDULER_COUNTERS, best_algorithm
+from ui.gantt import draw_gantt_aggregated
+
+# Nhiều hơn số ô này thì vẽ dạng gộp theo cột (ui.gantt)
+GANTT_DETAIL_LIMIT = 30
+
+
 def display_input_table(processes: list):
     print("\n" + "=" * 50)
     print("  INPUT PROCESSES (from CSV file)")
@@ -10,7 +17,7 @@ def display_input_table(processes: list):
     print(f"Total: {len(processes)} processes\n")
 
 
-def display_results(processes: list, algorithm_name: str):
+def display_results(result, algorithm_name: str):
     print("\n" + "=" * 65)
     print(f"  {algorithm_name} SCHEDULING RESULTS")
     print("=" * 65)
@@ -20,7 +27,7 @@ def display_results(processes: list, algorithm_name: str):
     print("-" * 56)
     
     # Data rows - sắp xếp theo PID
-    for p in sorted(processes, key=lambda x: x.pid):
+    for p in sorted(result, key=lambda x: x.pid):
         print(f"{p.pid:<8}{p.arrival_time:<8}{p.burst_time:<8}"
               f"{p.start_time:<8}{p.completion_time:<8}"
               f"{p.turnaround_time:<8}{p. waiting_time:<8}")
@@ -39,23 +46,49 @@ def display_metrics(metrics: dict):
     print(f"  Average Turnaround Time : {metrics['avg_turnaround_time']:.2f}")
     print(f"  CPU Utilization         : {metrics['cpu_utilization']:.2f}%")
     print(f"  Throughput              :  {metrics['throughput']:.4f} processes/unit")
+    if 'p95_waiting_time' in metrics:
+        print(f"  Waiting p50/p95/p99     : {metrics['p50_waiting_time']:.2f} / "
+              f"{metrics['p95_waiting_time']:.2f} / {metrics['p99_waiting_time']:.2f}")
+        print(f"  Turnaround p50/p95/p99  : {metrics['p50_turnaround_time']:.2f} / "
+              f"{metrics['p95_turnaround_time']:.2f} / {metrics['p99_turnaround_time']:.2f}")
+        print(f"  Max Waiting Time        : {metrics['max_waiting_time']}")
+        print(f"  Slowdown (avg / max)    : {metrics['avg_slowdown']:.2f} / {metrics['max_slowdown']:.2f}")
+        print(f"  Fairness (Jain)         : {metrics['fairness_index']:.4f}")
+        print(f"  Starved Jobs            : {metrics['starved_jobs']}")
+    for core, utilization in enumerate(metrics.get('core_utilization', [])):
+        print(f"  Core {core:<3} Utilization    : {utilization:.2f}%")
+    for label, key in SCHEDULER_COUNTERS:
+        if key in metrics:
+            print(f"  {label:<24}: {metrics[key]}")
     print("-" * 45)
 
 
-def draw_gantt_chart(processes: list, algorithm_name: str):
+def draw_gantt_chart(result, algorithm_name: str, window: tuple = None):
+    if getattr(result, 'cores', None):
+        # Một lane mỗi core; bản gộp dùng chung trục thời gian để các lane thẳng hàng
+        if window is None and len(result) and result.segment_count() > GANTT_DETAIL_LIMIT:
+            window = (min(result.start_time), max(max(result.completion_time), min(result.start_time) + 1))
+        for core, lane in enumerate(result.lanes()):
+            draw_gantt_chart(lane, f"{algorithm_name} - Core {core}", window)
+        return
+    
+    if window is not None or result.segment_count() > GANTT_DETAIL_LIMIT:
+        draw_gantt_aggregated(result, algorithm_name, window=window)
+        return
+    
     print(f"\n{'='*55}")
     print(f"  GANTT CHART - {algorithm_name}")
     print("=" * 55)
     
-    if not processes:
+    if not result:
         print("  No processes to display.")
         return
 
-    # Sort by execution order (start_time)
-    sorted_p = sorted(processes, key=lambda p: p.start_time)
+    # Execution order - mỗi slice là một ô (job bị preempt có nhiều ô)
+    segments = list(result.segments())
     
     # Calculate total duration for scaling
-    total_duration = sorted_p[-1].completion_time - sorted_p[0].start_time
+    total_duration = segments[-1][2] - segments[0][1]
     if total_duration == 0:
         return
 
@@ -63,9 +96,9 @@ def draw_gantt_chart(processes: list, algorithm_name: str):
     scale = max_chart_width / total_duration
     
     segment_widths = []
-    for p in sorted_p:
-        prop_width = int(p.burst_time * scale)
-        actual_width = max(prop_width, len(p.pid) + 2)
+    for pid, start, end in segments:
+        prop_width = int((end - start) * scale)
+        actual_width = max(prop_width, len(pid) + 2)
         segment_widths.append(actual_width)
 
     # border tren
@@ -77,9 +110,9 @@ def draw_gantt_chart(processes: list, algorithm_name: str):
 
 
     mid = "│"
-    for i, p in enumerate(sorted_p):
+    for i, (pid, start, end) in enumerate(segments):
         width = segment_widths[i]
-        mid += f"{p.pid:^{width}}│"
+        mid += f"{pid:^{width}}│"
     print(mid)
     
     # Lower border
@@ -91,50 +124,34 @@ def draw_gantt_chart(processes: list, algorithm_name: str):
     
     # Timeline
     # Start time
-    timeline = f"{sorted_p[0].start_time}"
-    current_pos_char = len(str(sorted_p[0].start_time))
+    timeline = f"{segments[0][1]}"
     
-    for i, p in enumerate(sorted_p):
+    for i, (pid, start, end) in enumerate(segments):
         width = segment_widths[i]
-
-        num_str = str(p.completion_time)
-        
-        padding = width + 1 - len(num_str)
-        padding = max(1, padding) 
-        
-        timeline += f"{p.completion_time:>{width + 1}}"
+        timeline += f"{end:>{width + 1}}"
         
     print(timeline)
     
     # Execution Order
-    execution_order = " -> ".join([p.pid for p in sorted_p])
+    execution_order = " -> ".join([pid for pid, start, end in segments])
     print(f"\nExecution Order: {execution_order}")
 
 
-def display_comparison(fcfs_metrics: dict, sjf_metrics: dict):
-    print("\n" + "=" * 65)
-    print("  ALGORITHM COMPARISON:  FCFS vs SJF (Non-Preemptive)")
-    print("=" * 65)
+def display_comparison(metrics_by_algorithm: dict):
+    names = list(metrics_by_algorithm)
+    width = 25 + 15 * len(names) + 12
     
-    print(f"{'Metric':<25}{'FCFS':<15}{'SJF':<15}{'Better':<10}")
-    print("-" * 65)
+    print("\n" + "=" * width)
+    print(f"  ALGORITHM COMPARISON:  {' vs '.join(names)}")
+    print("=" * width)
     
-    comparisons = [
-        ('Avg Waiting Time', 'avg_waiting_time', 'lower'),
-        ('Avg Turnaround Time', 'avg_turnaround_time', 'lower'),
-        ('CPU Utilization (%)', 'cpu_utilization', 'higher'),
-        ('Throughput', 'throughput', 'higher'),
-    ]
+    header = f"{'Metric':<25}" + "".join(f"{name:<15}" for name in names) + "Better"
+    print(header)
+    print("-" * width)
     
-    for name, key, better in comparisons:
-        fcfs_val = fcfs_metrics[key]
-        sjf_val = sjf_metrics[key]
-        
-        if better == 'lower':
-            winner = "FCFS" if fcfs_val < sjf_val else "SJF" if sjf_val < fcfs_val else "Equal"
-        else: 
-            winner = "FCFS" if fcfs_val > sjf_val else "SJF" if sjf_val > fcfs_val else "Equal"
-        
-        print(f"{name:<25}{fcfs_val: <15.2f}{sjf_val:<15.2f}{winner:<10}")
+    for name, key, better in COMPARISON_METRICS:
+        winner = best_algorithm(metrics_by_algorithm, key, better)
+        values = "".join(f"{metrics_by_algorithm[n][key]:<15.2f}" for n in names)
+        print(f"{name:<25}{values}{winner}")
     
-    print("-" * 65)
\ No newline at end of file
+    print("-" * width)
\ No newline at end of file
@@ -0,0 +1,228 @@
+import os
+import zlib
+from bisect import bisect_right
+from html import escape
+
+
+DEFAULT_CHART_WIDTH = 80
+DEFAULT_SVG_WIDTH = 1200
+GLYPHS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+DENSITY = " ▁▂▃▄▅▆▇█"
+
+
+class _OrderedView:
+    # column[order[k]] tính khi được truy cập: bisect / duyệt window không phải dựng
+    # cả cột n phần tử trước
+    __slots__ = ('column', 'order')
+
+    def __init__(self, column, order):
+        self.column = column
+        self.order = order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, k):
+        return self.column[self.order[k]]
+
+
+def _segment_columns(result) -> tuple:
+    # (job, start, end) dạng cột, sắp theo thời gian -> bisect được khi zoom
+    if result.slice_job is not None:
+        return result.slice_job, result.slice_start, result.slice_end
+    order = result.order
+    return (order, _OrderedView(result.start_time, order),
+            _OrderedView(result.completion_time, order))
+
+
+def aggregate_timeline(result, width: int = DEFAULT_CHART_WIDTH, window: tuple = None) -> dict:
+    # Chia trục thời gian thành `width` cột, mỗi cột tổng hợp:
+    #   dominant job, busy/idle fraction, số job chạy trong cột.
+    # Chỉ duyệt các slice nằm trong window -> chi phí O(slice trong window + width)
+    jobs, starts, ends = _segment_columns(result)
+    if not len(jobs):
+        return None
+
+    t0, t1 = window if window else (int(starts[0]), int(ends[-1]))
+    if t1 <= t0:
+        t1 = t0 + 1
+    width = max(1, min(width, t1 - t0))
+    span = (t1 - t0) / width
+
+    buckets = [{'busy': 0.0, 'dominant': None, 'jobs': 0} for _ in range(width)]
+    current_bucket = -1
+    per_job = {}
+
+    def flush():
+        if current_bucket >= 0 and per_job:
+            bucket = buckets[current_bucket]
+            bucket['dominant'] = max(per_job, key=per_job.get)
+            bucket['jobs'] = len(per_job)
+
+    first = bisect_right(ends, t0)
+    for k in range(first, len(jobs)):
+        start, end = int(starts[k]), int(ends[k])
+        if start >= t1:
+            break
+        start, end = max(start, t0), min(end, t1)
+        if end <= start:
+            continue
+
+        b = min(width - 1, int((start - t0) / span))
+        while b < width:
+            b_begin = t0 + b * span
+            b_end = b_begin + span
+            overlap = min(end, b_end) - max(start, b_begin)
+            if overlap > 0:
+                if b != current_bucket:
+                    flush()
+                    current_bucket = b
+                    per_job = {}
+                buckets[b]['busy'] += overlap
+                per_job[jobs[k]] = per_job.get(jobs[k], 0) + overlap
+            if end <= b_end:
+                break
+            b += 1
+    flush()
+
+    for bucket in buckets:
+        bucket['busy'] = min(1.0, bucket['busy'] / span)
+    return {'start': t0, 'end': t1, 'span': span, 'buckets': buckets}
+
+
+def render_gantt_aggregated(result, algorithm_name: str, width: int = DEFAULT_CHART_WIDTH,
+                            window: tuple = None) -> str:
+    timeline = aggregate_timeline(result, width, window)
+    lines = [f"\n{'='*55}", f"  GANTT CHART - {algorithm_name} (aggregated)", "=" * 55]
+    if timeline is None:
+        lines.append("  No processes to display.")
+        return "\n".join(lines)
+
+    buckets = timeline['buckets']
+    width = len(buckets)
+
+    # Mỗi job nổi bật được gán một ký tự; cột idle để trống
+    glyph_of = {}
+    for bucket in buckets:
+        job = bucket['dominant']
+        if job is not None and job not in glyph_of:
+            glyph_of[job] = GLYPHS[len(glyph_of) % len(GLYPHS)]
+
+    jobs_row = "".join(glyph_of[b['dominant']] if b['dominant'] is not None else " "
+                       for b in buckets)
+    busy_row = "".join(DENSITY[round(b['busy'] * (len(DENSITY) - 1))] for b in buckets)
+
+    axis = [" "] * (width + 12)
+    for col in range(0, width + 1, 20 if width >= 40 else 10):
+        label = str(int(timeline['start'] + col * timeline['span']))
+        for k, ch in enumerate(label):
+            if col + k < len(axis):
+                axis[col + k] = ch
+
+    idle = 1 - sum(b['busy'] for b in buckets) / width
+    job_counts = [b['jobs'] for b in buckets]
+    lines += [
+        f"  Window: [{timeline['start']}, {timeline['end']})  "
+        f"{timeline['span']:.2f} time units/column",
+        "┌" + "─" * width + "┐",
+        "│" + jobs_row + "│  dominant job",
+        "│" + busy_row + "│  CPU busy",
+        "└" + "─" * width + "┘",
+        " " + "".join(axis).rstrip(),
+        f"\n  Jobs/column: min {min(job_counts)}, max {max(job_counts)}   Idle: {idle * 100:.1f}%",
+    ]
+
+    legend = [f"{glyph}={result.jobs[job].pid}" for job, glyph in glyph_of.items()]
+    if len(legend) <= len(GLYPHS):
+        lines.append("  Legend: " + "  ".join(legend))
+    return "\n".join(lines)
+
+
+def draw_gantt_aggregated(result, algorithm_name: str, width: int = DEFAULT_CHART_WIDTH,
+                          window: tuple = None):
+    print(render_gantt_aggregated(result, algorithm_name, width, window))
+
+
+def _job_color(pid: str) -> str:
+    hue = zlib.crc32(pid.encode('utf-8')) % 360
+    return f"hsl({hue},65%,55%)"
+
+
+def render_gantt_svg(result, algorithm_name: str, width: int = DEFAULT_SVG_WIDTH,
+                     window: tuple = None) -> str:
+    # Một rect mỗi cột pixel -> kích thước file theo width, không theo số job.
+    # Kết quả nhiều core: một lane mỗi core, chung trục thời gian
+    lanes = [result]
+    if getattr(result, 'cores', None):
+        lanes = result.lanes()
+        if window is None and len(result):
+            t0, t1 = min(result.start_time), max(result.completion_time)
+            window = (t0, max(t1, t0 + 1))
+
+    lane_height, bar_top, bar_height = 50, 30, 40
+    height = bar_top + lane_height * len(lanes) + 20
+    label_width = 60 if len(lanes) > 1 else 0
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width + label_width + 20}" '
+             f'height="{height}" font-family="monospace" font-size="12">',
+             f'<text x="10" y="18">{escape(algorithm_name)}</text>']
+
+    timeline = None
+    for lane_index, lane in enumerate(lanes):
+        lane_timeline = aggregate_timeline(lane, width, window)
+        timeline = lane_timeline or timeline
+        top = bar_top + lane_index * lane_height
+        if len(lanes) > 1:
+            parts.append(f'<text x="10" y="{top + bar_height // 2 + 4}">Core {lane_index}</text>')
+        if lane_timeline is None:
+            continue
+        buckets = lane_timeline['buckets']
+        column_width = width / len(buckets)
+        for col, bucket in enumerate(buckets):
+            if bucket['dominant'] is None:
+                continue
+            pid = result.jobs[bucket['dominant']].pid
+            parts.append(
+                f'<rect x="{10 + label_width + col * column_width:.2f}" y="{top}" '
+                f'width="{column_width:.2f}" height="{bar_height}" '
+                f'fill="{_job_color(pid)}" fill-opacity="{max(0.15, bucket["busy"]):.2f}">'
+                f'<title>{escape(pid)} ({bucket["jobs"]} jobs, '
+                f'{bucket["busy"] * 100:.0f}% busy)</title></rect>')
+
+    if timeline is not None:
+        parts.append(f'<text x="{10 + label_width}" y="{height - 8}">{timeline["start"]}</text>')
+        parts.append(f'<text x="{width + label_width + 10}" y="{height - 8}" text-anchor="end">'
+                     f'{timeline["end"]}</text>')
+    parts.append('</svg>')
+    return "\n".join(parts)
+
+
+def export_gantt_svg(result, algorithm_name: str, filepath: str,
+                     width: int = DEFAULT_SVG_WIDTH, window: tuple = None) -> str:
+    # .html -> bọc SVG trong trang HTML tĩnh, còn lại ghi SVG thuần
+    svg = render_gantt_svg(result, algorithm_name, width, window)
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        if filepath.endswith('.html'):
+            f.write(f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                    f"<title>Gantt - {escape(algorithm_name)}</title></head>\n<body>\n")
+            f.write(svg)
+            f.write("\n</body></html>\n")
+        else:
+            f.write(svg)
+
+    print(f"[✓] Gantt chart exported: {filepath}")
+    return filepath
+
+
+def parse_window(text: str) -> tuple:
+    # "100:500" -> (100, 500)
+    try:
+        start, end = (int(v) for v in text.split(':'))
+    except ValueError:
+        raise ValueError(f"Invalid time window '{text}', expected START:END") from None
+    if end <= start:
+        raise ValueError(f"Invalid time window '{text}': END must be greater than START")
+    return start, end
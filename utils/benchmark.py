@@ -0,0 +1,246 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from algorithms.registry import ALGORITHMS
+from utils.calculator import calculate_metrics
+from utils.csv_handler import read_processes_from_csv, export_results_to_csv
+from utils.stress_test import generate_random_processes, summarize_timings
+from ui.display import draw_gantt_chart
+
+
+BASELINE_VERSION = 1
+DEFAULT_SIZE = 2000
+DEFAULT_TRIALS = 15
+DEFAULT_WARMUP = 2
+DEFAULT_THRESHOLD = 0.10     # chậm hơn > 10% mới tính là regression
+DEFAULT_ALPHA = 0.01
+
+
+def _build_cases(size: int, seed: int, temp_dir: str) -> dict:
+    # name -> (setup, run): setup chạy ngoài vùng đo, run nhận kết quả setup
+    workload = generate_random_processes(size, seed)
+    scheduled = ALGORITHMS['FCFS'](workload)
+    metrics = calculate_metrics(scheduled)
+
+    csv_path = os.path.join(temp_dir, "workload.csv")
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        f.write("PID,ArrivalTime,BurstTime\n")
+        for p in workload:
+            f.write(f"{p.pid},{p.arrival_time},{p.burst_time}\n")
+    export_dir = os.path.join(temp_dir, "export")
+
+    cases = {}
+    for name, func in ALGORITHMS.items():
+        cases[f"algorithm:{name}"] = (lambda: workload, func)
+    cases["calculate_metrics"] = (lambda: scheduled, calculate_metrics)
+    cases["csv_read"] = (lambda: csv_path, read_processes_from_csv)
+    try:
+        from utils.fast_csv import read_workload_csv
+        cases["csv_parse"] = (lambda: csv_path, read_workload_csv)
+    except ImportError:
+        pass
+    cases["csv_write"] = (lambda: scheduled,
+                          lambda result: export_results_to_csv(result, metrics, "BENCH", export_dir))
+    cases["gantt"] = (lambda: scheduled, lambda result: draw_gantt_chart(result, "BENCH"))
+    return cases
+
+
+def run_benchmark_suite(size: int = DEFAULT_SIZE, trials: int = DEFAULT_TRIALS,
+                        warmup: int = DEFAULT_WARMUP, seed: int = 0,
+                        only: list = None) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="cpu_bench_") as temp_dir:
+        cases = _build_cases(size, seed, temp_dir)
+        for name, (setup, run) in cases.items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+
+            samples = []
+            for round_index in range(warmup + trials):
+                arg = setup()
+                # Bỏ output console (CSV/Gantt in ra stdout) khỏi phép đo
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter_ns()
+                    run(arg)
+                    elapsed = time.perf_counter_ns() - start
+                if round_index >= warmup:
+                    samples.append(elapsed)
+
+            summary = summarize_timings(samples)
+            results[name] = {
+                'samples_ns': samples,
+                'median': summary['median'],
+                'p95': summary['p95'],
+                'stddev': summary['stddev']
+            }
+            print(f"  {name:<24}{summary['median'] * 1e3:>12.3f} ms"
+                  f"  (p95 {summary['p95'] * 1e3:.3f} ms)")
+
+    return {
+        'version': BASELINE_VERSION,
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'size': size,
+        'seed': seed,
+        'trials': trials,
+        'warmup': warmup,
+        'cases': results
+    }
+
+
+def save_baseline(report: dict, filepath: str) -> str:
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"[✓] Baseline saved: {filepath}")
+    return filepath
+
+
+def load_baseline(filepath: str) -> dict:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    if report.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {report.get('version')}")
+    return report
+
+
+def mann_whitney_p_greater(current: list, baseline: list) -> float:
+    # One-sided Mann-Whitney U (xấp xỉ chuẩn): p của giả thuyết current > baseline
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+
+    rank_sum = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_to_baseline(current: dict, baseline: dict,
+                        threshold: float = DEFAULT_THRESHOLD,
+                        alpha: float = DEFAULT_ALPHA) -> list:
+    # Regression = median chậm hơn threshold VÀ có ý nghĩa thống kê (p < alpha)
+    if current.get('size') != baseline.get('size'):
+        print(f"[!] Workload size differs: current {current.get('size')}, "
+              f"baseline {baseline.get('size')}")
+
+    print("\n" + "=" * 78)
+    print("  BENCHMARK COMPARISON")
+    print("=" * 78)
+    print(f"{'Case':<24}{'Baseline (ms)':<15}{'Current (ms)':<15}{'Change':<10}"
+          f"{'p-value':<10}{'Status':<8}")
+    print("-" * 78)
+
+    regressions = []
+    for name, case in current['cases'].items():
+        base_case = baseline['cases'].get(name)
+        if base_case is None:
+            print(f"{name:<24}{'-':<15}{case['median'] * 1e3:<15.3f}{'':<10}{'':<10}{'NEW':<8}")
+            continue
+
+        ratio = case['median'] / base_case['median'] if base_case['median'] > 0 else 1.0
+        p_value = mann_whitney_p_greater(case['samples_ns'], base_case['samples_ns'])
+        if ratio > 1 + threshold and p_value < alpha:
+            status = "SLOWER"
+            regressions.append({'case': name, 'ratio': ratio, 'p_value': p_value})
+        elif ratio < 1 - threshold and mann_whitney_p_greater(
+                base_case['samples_ns'], case['samples_ns']) < alpha:
+            status = "FASTER"
+        else:
+            status = "OK"
+
+        change = f"{(ratio - 1) * 100:+.1f}%"
+        print(f"{name:<24}{base_case['median'] * 1e3:<15.3f}{case['median'] * 1e3:<15.3f}"
+              f"{change:<10}{p_value:<10.4f}{status:<8}")
+    print("-" * 78)
+
+    if regressions:
+        print(f"[✗] {len(regressions)} significant regression(s) "
+              f"(> {threshold * 100:.0f}% slower, p < {alpha})")
+    else:
+        print("[✓] No significant regressions")
+    return regressions
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='CPU Scheduling benchmark suite')
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE,
+                        help=f'Processes in the generated workload (default: {DEFAULT_SIZE})')
+    parser.add_argument('--trials', type=int, default=DEFAULT_TRIALS,
+                        help=f'Timed rounds per case (default: {DEFAULT_TRIALS})')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP,
+                        help=f'Untimed warm-up rounds per case (default: {DEFAULT_WARMUP})')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the generated workload (default: 0)')
+    parser.add_argument('--only', type=str, default=None,
+                        help='Comma-separated case-name prefixes to run (e.g. algorithm:,csv_)')
+    parser.add_argument('--save', type=str, default=None,
+                        help='Write the results as a JSON baseline to this path')
+    parser.add_argument('--compare', type=str, default=None,
+                        help='Compare against a stored JSON baseline; exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Minimum relative slowdown to flag (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA,
+                        help=f'Significance level (default: {DEFAULT_ALPHA})')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    only = [s.strip() for s in args.only.split(',')] if args.only else None
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"[✗] Could not load baseline '{args.compare}': {e}")
+            return 2
+
+    print("\n" + "=" * 55)
+    print(f"  BENCHMARK SUITE - {args.size} PROCESSES")
+    print("=" * 55)
+    report = run_benchmark_suite(args.size, args.trials, args.warmup, args.seed, only)
+
+    if args.save:
+        save_baseline(report, args.save)
+
+    if baseline is not None:
+        regressions = compare_to_baseline(report, baseline, args.threshold, args.alpha)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
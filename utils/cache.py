@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import struct
+from array import array
+
+from models.schedule import ScheduleResult
+
+
+# Cache kết quả lập lịch theo nội dung workload:
+#   key  = blake2b(cột pid/arrival/burst/priority + thuật toán + tham số)
+#   file = <key>.bin: header, metrics JSON, rồi các cột int64 order/start/completion (+ slices)
+# LRU theo mtime: lần hit "chạm" file, quá giới hạn dung lượng thì xoá file cũ nhất.
+# Chỉ dùng thư viện chuẩn (array 'q', native byte order) - cache là cục bộ trên máy.
+DEFAULT_CACHE_DIR = ".cache/schedules"
+DEFAULT_CACHE_LIMIT = 256 * 1024 * 1024
+CACHE_MAGIC = b'CPUCACHE'
+CACHE_VERSION = 2     # 2: metrics của ScheduleResult dùng percentile chính xác
+_ENTRY_EXTENSION = ".bin"
+_HEADER = struct.Struct('<8sIIQQQ')   # magic, version, có slices, n, số slice, độ dài metrics
+
+
+def workload_fingerprint(processes: list) -> str:
+    # Thứ tự dòng là một phần của key: kết quả đánh index theo vị trí trong list
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(struct.pack('<Q', len(processes)))
+    for column in ('arrival_time', 'burst_time', 'priority'):
+        digest.update(array('q', (getattr(p, column) for p in processes)).tobytes())
+    digest.update("\n".join(p.pid for p in processes).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cache_key(fingerprint: str, spec: str) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (str(CACHE_VERSION), fingerprint, spec.upper()):
+        digest.update(part.encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+
+def _read_column(f, length: int) -> array:
+    column = array('q')
+    column.fromfile(f, length)
+    return column
+
+
+class ResultCache:
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_LIMIT):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_EXTENSION)
+
+    def get(self, fingerprint: str, spec: str, processes: list):
+        # -> (ScheduleResult, metrics) hoặc None
+        path = self._path(cache_key(fingerprint, spec))
+        try:
+            with open(path, 'rb') as f:
+                magic, version, has_slices, n, slice_count, metrics_length = \
+                    _HEADER.unpack(f.read(_HEADER.size))
+                if magic != CACHE_MAGIC or version != CACHE_VERSION or n != len(processes):
+                    raise ValueError("stale cache entry")
+                metrics = json.loads(f.read(metrics_length).decode('utf-8'))
+                order, start, completion = (_read_column(f, n) for _ in range(3))
+                slices = None
+                if has_slices:
+                    slices = tuple(_read_column(f, slice_count) for _ in range(3))
+            os.utime(path)
+        except (OSError, ValueError, EOFError, struct.error):
+            # Không có hoặc hỏng -> coi như miss, lần put sau sẽ ghi đè
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return ScheduleResult(processes, order, start, completion, slices), metrics
+
+    def put(self, fingerprint: str, spec: str, result, metrics: dict):
+        columns = [result.order, result.start_time, result.completion_time]
+        has_slices = result.slice_job is not None
+        if has_slices:
+            columns += [result.slice_job, result.slice_start, result.slice_end]
+        encoded_metrics = json.dumps(metrics).encode('utf-8')
+        header = _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, has_slices, len(result.order),
+                              len(result.slice_job) if has_slices else 0, len(encoded_metrics))
+
+        path = self._path(cache_key(fingerprint, spec))
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, 'wb') as f:
+                f.write(header)
+                f.write(encoded_metrics)
+                for column in columns:
+                    if not (isinstance(column, array) and column.typecode == 'q'):
+                        column = array('q', (int(v) for v in column))
+                    column.tofile(f)
+            # rename nguyên tử -> tiến trình khác không bao giờ đọc phải file ghi dở
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f"[!] Could not write cache entry: {e}")
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            return
+        self.evict()
+
+    def evict(self):
+        # Xoá entry ít dùng gần đây nhất cho tới khi tổng dung lượng <= max_bytes
+        try:
+            entries = [entry for entry in os.scandir(self.directory)
+                       if entry.name.endswith(_ENTRY_EXTENSION)]
+        except OSError:
+            return
+        stats = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue    # tiến trình khác vừa xoá / thay entry này
+            stats.append((stat.st_mtime, stat.st_size, entry.path))
+        stats.sort()
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in stats:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def summary(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.directory})"
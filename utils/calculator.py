@@ -1,27 +1,357 @@
-def calculate_metrics(processes: list) -> dict:
-    n = len(processes)
+import math
+from operator import attrgetter
+
+
+# Độ chính xác tương đối của QuantileSketch và giới hạn số bucket (bộ nhớ cố định)
+SKETCH_ACCURACY = 0.01
+SKETCH_MAX_BUCKETS = 2048
+# Job có slowdown (turnaround / burst) từ ngưỡng này trở lên được tính là bị "đói"
+STARVATION_SLOWDOWN = 10
+TAIL_QUANTILES = (50, 95, 99)
+
+# Số đếm riêng của scheduler (ScheduleResult.counters) được gộp vào metrics
+SCHEDULER_COUNTERS = [
+    ('Context Switches', 'context_switches'),
+    ('Priority Boosts', 'boosts'),
+    ('Aging Promotions', 'promotions'),
+]
+
+COMPARISON_METRICS = [
+    ('Avg Waiting Time', 'avg_waiting_time', 'lower'),
+    ('Avg Turnaround Time', 'avg_turnaround_time', 'lower'),
+    ('CPU Utilization (%)', 'cpu_utilization', 'higher'),
+    ('Throughput', 'throughput', 'higher'),
+    ('P95 Waiting Time', 'p95_waiting_time', 'lower'),
+    ('Fairness (Jain)', 'fairness_index', 'higher'),
+]
+
+
+def best_algorithm(metrics_by_algorithm: dict, key: str, better: str) -> str:
+    values = {name: metrics[key] for name, metrics in metrics_by_algorithm.items()}
+    target = min(values.values()) if better == 'lower' else max(values.values())
+    winners = [name for name, value in values.items() if value == target]
+    return "Equal" if len(winners) == len(values) else "/".join(winners)
+
+
+def calculate_metrics(result, starvation_slowdown: float = STARVATION_SLOWDOWN) -> dict:
+    # ScheduleResult đã dựng đủ -> tính trên các cột (percentile chính xác, giống
+    # calculate_metrics_arrays). List ScheduledJob / luồng SchedulerEvent (streaming, online)
+    # -> một lượt qua MetricsAccumulator, percentile từ sketch
+    columns = _result_columns(result)
+    if columns is not None:
+        metrics = calculate_metrics_arrays(*columns, starvation_slowdown=starvation_slowdown)
+        total_time = metrics['total_execution_time'] - int(columns[2].min()) if metrics else 0
+    else:
+        accumulator = MetricsAccumulator(starvation_slowdown)
+        accumulator.consume(result)
+        metrics = accumulator.result()
+        total_time = accumulator.completion_time - (accumulator.first_start or 0)
+    if metrics and getattr(result, 'cores', None):
+        metrics.update(_core_metrics(result, total_time))
+    if metrics and getattr(result, 'counters', None):
+        metrics.update(result.counters)
+    return metrics
+
+
+def _result_columns(result):
+    # ScheduleResult -> (arrival, burst, start, completion) dạng mảng NumPy theo order;
+    # None khi không phải ScheduleResult hoặc không có NumPy
+    if not (hasattr(result, 'jobs') and hasattr(result, 'start_time')):
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    jobs, n = result.jobs, len(result.jobs)
+    arrival = np.fromiter(map(attrgetter('arrival_time'), jobs), dtype=np.int64, count=n)
+    burst = np.fromiter(map(attrgetter('burst_time'), jobs), dtype=np.int64, count=n)
+    start = np.asarray(result.start_time, dtype=np.int64)
+    completion = np.asarray(result.completion_time, dtype=np.int64)
+    if len(result.order) != n:
+        # Kết quả chỉ phủ một phần jobs (vd. một lane của MultiCoreResult)
+        order = np.asarray(result.order, dtype=np.int64)
+        return arrival[order], burst[order], start[order], completion[order]
+    return arrival, burst, start, completion
+
+
+def _core_metrics(result, total_time: int) -> dict:
+    # Nhiều CPU: utilization chia theo số core, kèm utilization từng core
+    busy = result.core_busy_time()
+    per_core = [b / total_time * 100 if total_time > 0 else 0 for b in busy]
+    return {
+        'cores': result.cores,
+        'cpu_utilization': sum(per_core) / result.cores,
+        'core_utilization': per_core
+    }
+
+
+def calculate_metrics_arrays(arrival_time, burst_time, start_time, completion_time,
+                             starvation_slowdown: float = STARVATION_SLOWDOWN) -> dict:
+    # Bản vectorized: nhận trực tiếp các mảng NumPy, không cần list Process
+    n = len(arrival_time)
     
     if n == 0:
         return {}
     
-    # Calculate tổng
-    total_waiting = sum(p.waiting_time for p in processes)
-    total_turnaround = sum(p.turnaround_time for p in processes)
-    total_burst = sum(p.burst_time for p in processes)
+    turnaround = completion_time - arrival_time
+    total_turnaround = int(turnaround.sum())
+    total_burst = int(burst_time.sum())
+    total_waiting = total_turnaround - total_burst
     
-    # Time to excute
-    completion_time = max(p.completion_time for p in processes)
-    first_start = min(p.start_time for p in processes)
-    total_time = completion_time - first_start
+    completion = int(completion_time.max())
+    first_start = int(start_time.min())
+    total_time = completion - first_start
 
     cpu_utilization = (total_burst / total_time * 100) if total_time > 0 else 0
     
     throughput = n / total_time if total_time > 0 else 0
     
-    return {
+    metrics = {
         'avg_waiting_time': total_waiting / n,
         'avg_turnaround_time':  total_turnaround / n,
         'cpu_utilization': cpu_utilization,
         'throughput': throughput,
-        'total_execution_time': completion_time
-    }
\ No newline at end of file
+        'total_execution_time': completion
+    }
+    
+    # Bản mảng có đủ dữ liệu -> percentile chính xác thay vì sketch
+    import numpy as np  # chỉ bản vectorized cần NumPy
+    waiting = turnaround - burst_time
+    slowdown = turnaround / np.maximum(burst_time, 1)
+    for q in TAIL_QUANTILES:
+        metrics[f'p{q}_waiting_time'] = float(np.percentile(waiting, q))
+        metrics[f'p{q}_turnaround_time'] = float(np.percentile(turnaround, q))
+    metrics.update(_fairness_metrics(n, int(waiting.max()), float(slowdown.sum()),
+                                     float(np.square(slowdown).sum()), float(slowdown.max()),
+                                     int((slowdown >= starvation_slowdown).sum())))
+    return metrics
+
+
+def calculate_batch_metrics(batch, start_time, completion_time) -> dict:
+    # Metrics cho từng workload của một WorkloadBatch trong một lượt theo cột:
+    # tổng / max / min theo đoạn bằng ufunc.reduceat trên offsets.
+    # -> bảng {tên metric: mảng, một phần tử mỗi workload}; workload rỗng cho giá trị 0
+    import numpy as np  # chỉ bản vectorized cần NumPy
+    lengths = batch.lengths()
+    nonempty = lengths > 0
+    starts = batch.offsets[:-1][nonempty]
+    n = lengths[nonempty]
+
+    turnaround = completion_time - batch.arrival_time
+    waiting = turnaround - batch.burst_time
+    slowdown = turnaround / np.maximum(batch.burst_time, 1)
+
+    def per_workload(values, dtype=np.float64):
+        column = np.zeros(len(lengths), dtype=dtype)
+        column[nonempty] = values
+        return column
+
+    total_turnaround = np.add.reduceat(turnaround, starts) if len(starts) else np.zeros(0, np.int64)
+    total_burst = np.add.reduceat(batch.burst_time, starts) if len(starts) else np.zeros(0, np.int64)
+    completion = np.maximum.reduceat(completion_time, starts) if len(starts) else np.zeros(0, np.int64)
+    first_start = np.minimum.reduceat(start_time, starts) if len(starts) else np.zeros(0, np.int64)
+    total_time = completion - first_start
+    busy = total_time > 0
+    span = np.where(busy, total_time, 1)
+
+    table = {
+        'jobs': lengths,
+        'avg_waiting_time': per_workload((total_turnaround - total_burst) / n),
+        'avg_turnaround_time': per_workload(total_turnaround / n),
+        'cpu_utilization': per_workload(np.where(busy, total_burst / span * 100, 0)),
+        'throughput': per_workload(np.where(busy, n / span, 0)),
+        'total_execution_time': per_workload(completion, np.int64),
+    }
+
+    # Percentile chính xác (nội suy tuyến tính như np.percentile): sort trong từng đoạn
+    segment = batch.segment_ids()
+    for kind, values in (('waiting', waiting), ('turnaround', turnaround)):
+        ordered = values[np.lexsort((values, segment))]
+        for q in TAIL_QUANTILES:
+            position = (n - 1) * (q / 100)
+            low = np.floor(position).astype(np.int64)
+            high = np.ceil(position).astype(np.int64)
+            low_value = ordered[starts + low]
+            value = low_value + (ordered[starts + high] - low_value) * (position - low)
+            table[f'p{q}_{kind}_time'] = per_workload(value)
+
+    if len(starts):
+        slowdown_sum = np.add.reduceat(slowdown, starts)
+        slowdown_squares = np.add.reduceat(np.square(slowdown), starts)
+        max_waiting = np.maximum.reduceat(waiting, starts)
+        max_slowdown = np.maximum.reduceat(slowdown, starts)
+        starved = np.add.reduceat((slowdown >= STARVATION_SLOWDOWN).astype(np.int64), starts)
+    else:
+        slowdown_sum = slowdown_squares = max_slowdown = np.zeros(0)
+        max_waiting = starved = np.zeros(0, np.int64)
+    # Cùng công thức Jain với _fairness_metrics
+    positive = slowdown_squares > 0
+    fairness = np.where(positive, slowdown_sum ** 2 / (n * np.where(positive, slowdown_squares, 1)), 1.0)
+    table.update({
+        'max_waiting_time': per_workload(max_waiting, np.int64),
+        'avg_slowdown': per_workload(slowdown_sum / n),
+        'max_slowdown': per_workload(max_slowdown),
+        'fairness_index': per_workload(fairness),
+        'starved_jobs': per_workload(starved, np.int64),
+    })
+    return table
+
+
+def _fairness_metrics(n: int, max_waiting: int, slowdown_sum: float, slowdown_squares: float,
+                      max_slowdown: float, starved: int) -> dict:
+    # Jain's index trên slowdown: 1 = mọi job bị chậm như nhau, 1/n = dồn hết vào một job
+    fairness = slowdown_sum * slowdown_sum / (n * slowdown_squares) if slowdown_squares > 0 else 1.0
+    return {
+        'max_waiting_time': max_waiting,
+        'avg_slowdown': slowdown_sum / n,
+        'max_slowdown': max_slowdown,
+        'fairness_index': fairness,
+        'starved_jobs': starved
+    }
+
+
+class QuantileSketch:
+    # Sketch log-bucket: giá trị x > 0 rơi vào bucket ceil(log_gamma(x)),
+    # sai số tương đối <= accuracy, số bucket không vượt max_buckets
+    # (vượt thì gộp các bucket nhỏ nhất -> chỉ đuôi thấp mất chính xác).
+    
+    def __init__(self, accuracy: float = SKETCH_ACCURACY, max_buckets: int = SKETCH_MAX_BUCKETS):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+    
+    def add(self, value):
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+    
+    def _collapse(self):
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        merged = sum(self.buckets.pop(k) for k in keys[:excess + 1])
+        self.buckets[keys[excess]] = merged
+    
+    def merge(self, other: 'QuantileSketch'):
+        # Gộp sketch từ worker khác (cùng accuracy)
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for bound in (other.min, other.max):
+            if bound is not None:
+                self.min = bound if self.min is None else min(self.min, bound)
+                self.max = bound if self.max is None else max(self.max, bound)
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+    
+    def quantile(self, q: float):
+        # q trong [0, 1]
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(0, self.min)
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                estimate = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+
+class MetricsAccumulator:
+    # Tích luỹ metrics từng job một - dùng cho streaming, không giữ list Process.
+    # Bộ nhớ cố định: percentile lấy từ QuantileSketch.
+    
+    def __init__(self, starvation_slowdown: float = STARVATION_SLOWDOWN):
+        self.starvation_slowdown = starvation_slowdown
+        self.waiting_sketch = QuantileSketch()
+        self.turnaround_sketch = QuantileSketch()
+        self.max_waiting = 0
+        self.slowdown_sum = 0.0
+        self.slowdown_squares = 0.0
+        self.max_slowdown = 0.0
+        self.starved = 0
+        self.count = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.total_burst = 0
+        self.first_start = None
+        self.completion_time = 0
+    
+    def add(self, row):
+        self.count += 1
+        self.total_waiting += row.waiting_time
+        self.total_turnaround += row.turnaround_time
+        self.total_burst += row.burst_time
+        if self.first_start is None or row.start_time < self.first_start:
+            self.first_start = row.start_time
+        if row.completion_time > self.completion_time:
+            self.completion_time = row.completion_time
+        
+        self.waiting_sketch.add(row.waiting_time)
+        self.turnaround_sketch.add(row.turnaround_time)
+        if row.waiting_time > self.max_waiting:
+            self.max_waiting = row.waiting_time
+        # burst 0 -> coi như 1 để slowdown không chia cho 0
+        slowdown = row.turnaround_time / (row.burst_time or 1)
+        self.slowdown_sum += slowdown
+        self.slowdown_squares += slowdown * slowdown
+        if slowdown > self.max_slowdown:
+            self.max_slowdown = slowdown
+        if slowdown >= self.starvation_slowdown:
+            self.starved += 1
+    
+    def add_event(self, event):
+        # SchedulerEvent từ OnlineScheduler: chỉ sự kiện 'complete' mang kết quả
+        if event.kind == 'complete':
+            self.add(event.row)
+    
+    def consume(self, rows):
+        # Nhận lẫn lộn ScheduledJob và SchedulerEvent từ bất kỳ scheduler nào
+        for row in rows:
+            if hasattr(row, 'kind'):
+                self.add_event(row)
+            else:
+                self.add(row)
+        return self
+    
+    def result(self) -> dict:
+        n = self.count
+        
+        if n == 0:
+            return {}
+        
+        total_time = self.completion_time - self.first_start
+        cpu_utilization = (self.total_burst / total_time * 100) if total_time > 0 else 0
+        throughput = n / total_time if total_time > 0 else 0
+        
+        metrics = {
+            'avg_waiting_time': self.total_waiting / n,
+            'avg_turnaround_time': self.total_turnaround / n,
+            'cpu_utilization': cpu_utilization,
+            'throughput': throughput,
+            'total_execution_time': self.completion_time
+        }
+        for q in TAIL_QUANTILES:
+            metrics[f'p{q}_waiting_time'] = self.waiting_sketch.quantile(q / 100)
+            metrics[f'p{q}_turnaround_time'] = self.turnaround_sketch.quantile(q / 100)
+        metrics.update(_fairness_metrics(n, self.max_waiting, self.slowdown_sum,
+                                         self.slowdown_squares, self.max_slowdown, self.starved))
+        return metrics
\ No newline at end of file
@@ -1,26 +1,46 @@
 import csv
+import heapq
 import os
 from datetime import datetime
+from itertools import islice
 from models.process import Process
+from utils.csv_validation import CsvErrorReport, RowValidator, check_columns
+from utils.calculator import (MetricsAccumulator, COMPARISON_METRICS, SCHEDULER_COUNTERS, TAIL_QUANTILES,
+                              best_algorithm)
+
+STREAM_CHUNK_SIZE = 100_000
 
 
 def read_processes_from_csv(filepath: str) -> list:
-    processes = []
+    # Đường nhanh (NumPy): parse theo khối, kiểm tra hàng loạt, báo lỗi gộp
+    try:
+        from utils.fast_csv import read_workload_csv
+    except ImportError:
+        return _read_processes_slow(filepath)
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            
-            for row in reader:
-                try:
-                    process = Process(
-                        pid=row['PID'].strip(),
-                        arrival_time=int(row['ArrivalTime']),
-                        burst_time=int(row['BurstTime'])
-                    )
-                    processes.append(process)
-                except ValueError as ve:
-                    print(f"[!] Skipping invalid row: {row} - Error: {ve}")
+        workload, report = read_workload_csv(filepath)
+    except FileNotFoundError:
+        print(f"[✗] File not found: {filepath}")
+        return None
+    except KeyError as e:
+        print(f"[✗] CSV missing column: {e}")
+        return None
+    except Exception as e:
+        print(f"[✗] Error reading file: {e}")
+        return None
+    
+    report.print_summary(filepath)
+    processes = workload.to_processes()
+    print(f"[✓] Read {len(processes)} processes from: {filepath}")
+    return processes
+
+
+def _read_processes_slow(filepath: str) -> list:
+    # Không có NumPy: đọc từng dòng, cùng luật hợp lệ và báo lỗi gộp như đường nhanh
+    try:
+        processes = [Process(pid, arrival, burst, priority)
+                     for pid, arrival, burst, priority in _iter_csv_rows(filepath)]
         
         print(f"[✓] Read {len(processes)} processes from: {filepath}")
         return processes
@@ -36,7 +56,83 @@ def read_processes_from_csv(filepath: str) -> list:
         return None
 
 
-def export_results_to_csv(processes: list, metrics: dict, 
+def _iter_csv_rows(filepath: str, report: CsvErrorReport = None):
+    # (pid, arrival, burst, priority) cho từng dòng hợp lệ theo RowValidator;
+    # dòng bị bỏ được gom vào report, in một lần khi đọc hết file
+    report = report if report is not None else CsvErrorReport()
+    with open(filepath, 'r', encoding='utf-8-sig', newline='') as file:
+        reader = csv.DictReader(file)
+        reader.fieldnames = check_columns(reader.fieldnames)
+        validator = RowValidator(report)
+        for row in reader:
+            values = validator.validate(reader.line_num, row)
+            if values is not None:
+                yield values
+    report.print_summary(filepath)
+
+
+def _is_arrival_sorted(filepath: str) -> bool:
+    # Cùng header/luật dòng với _iter_csv_rows nhưng report riêng, không in:
+    # dòng bị bỏ không ảnh hưởng thứ tự, lỗi được báo một lần khi đọc thật
+    last = None
+    with open(filepath, 'r', encoding='utf-8-sig', newline='') as file:
+        reader = csv.DictReader(file)
+        reader.fieldnames = check_columns(reader.fieldnames)
+        validator = RowValidator(CsvErrorReport(max_examples=0))
+        for row in reader:
+            values = validator.validate(reader.line_num, row)
+            if values is None:
+                continue
+            key = (values[1], values[0])
+            if last is not None and key < last:
+                return False
+            last = key
+    return True
+
+
+def _external_sort(filepath: str, chunk_size: int, temp_dir: str):
+    # Sort từng chunk ra file tạm rồi merge - RAM chỉ cần một chunk
+    run_files = []
+    rows = _iter_csv_rows(filepath)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        chunk.sort(key=lambda r: (r[1], r[0]))
+        run_path = os.path.join(temp_dir, f"run_{len(run_files)}.csv")
+        with open(run_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(chunk)
+        run_files.append(run_path)
+
+    def read_run(path):
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for pid, arrival, burst, priority in csv.reader(f):
+                yield (pid, int(arrival), int(burst), int(priority))
+
+    yield from heapq.merge(*(read_run(p) for p in run_files),
+                           key=lambda r: (r[1], r[0]))
+
+
+def iter_processes_from_csv(filepath: str, chunk_size: int = STREAM_CHUNK_SIZE):
+    # Streaming: yield Process theo thứ tự (arrival, pid), đọc file theo chunk.
+    # File chưa sort sẽ được external sort qua thư mục tạm.
+    if _is_arrival_sorted(filepath):
+        rows = _iter_csv_rows(filepath)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            for pid, arrival, burst, priority in chunk:
+                yield Process(pid, arrival, burst, priority)
+    else:
+        print(f"[!] Input is not sorted by arrival time, using external sort: {filepath}")
+        import tempfile
+        with tempfile.TemporaryDirectory(prefix="cpu_sched_") as temp_dir:
+            for pid, arrival, burst, priority in _external_sort(filepath, chunk_size, temp_dir):
+                yield Process(pid, arrival, burst, priority)
+
+
+def export_results_to_csv(result, metrics: dict, 
                           algorithm_name: str, output_folder: str) -> str:
     os.makedirs(output_folder, exist_ok=True)
     
@@ -47,59 +143,110 @@ def export_results_to_csv(processes: list, metrics: dict,
     with open(filepath, 'w', newline='', encoding='utf-8') as file:
         file.write(f"Algorithm,{algorithm_name}\n")
         file.write(f"Generated,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        file.write(f"Total Processes,{len(processes)}\n")
+        file.write(f"Total Processes,{len(result)}\n")
         file.write("\n")
         
         file.write("=== SCHEDULING RESULTS ===\n")
         fieldnames = ['PID', 'ArrivalTime', 'BurstTime', 'StartTime', 
-                      'CompletionTime', 'TurnaroundTime', 'WaitingTime']
+                      'CompletionTime', 'TurnaroundTime', 'WaitingTime', 'ResponseTime']
+        
+        core = getattr(result, 'core', None)
+        if core is not None:
+            fieldnames.append('Core')
         
         writer = csv.DictWriter(file, fieldnames=fieldnames)
         writer.writeheader()
         
-        for p in sorted(processes, key=lambda x:  x.pid):
-            writer. writerow(p. to_dict())
+        if core is None:
+            for p in sorted(result, key=lambda x:  x.pid):
+                writer. writerow(p. to_dict())
+        else:
+            for i in sorted(result.order, key=lambda i: result.jobs[i].pid):
+                row = result.row(i).to_dict()
+                row['Core'] = core[i]
+                writer.writerow(row)
         
         file.write("\n=== PERFORMANCE METRICS ===\n")
-        file.write(f"Average Waiting Time,{metrics['avg_waiting_time']:.2f}\n")
-        file.write(f"Average Turnaround Time,{metrics['avg_turnaround_time']:.2f}\n")
-        file.write(f"CPU Utilization (%),{metrics['cpu_utilization']:.2f}\n")
-        file.write(f"Throughput (processes/unit),{metrics['throughput']:.4f}\n")
-        file.write(f"Total Execution Time,{metrics['total_execution_time']}\n")
+        _write_metrics(file, metrics)
     
     print(f"[✓] Exported:  {filepath}")
     return filepath
 
 
-def export_comparison_to_csv(fcfs_metrics: dict, sjf_metrics: dict, 
-                              output_folder: str) -> str:
+def _write_metrics(file, metrics: dict):
+    file.write(f"Average Waiting Time,{metrics['avg_waiting_time']:.2f}\n")
+    file.write(f"Average Turnaround Time,{metrics['avg_turnaround_time']:.2f}\n")
+    file.write(f"CPU Utilization (%),{metrics['cpu_utilization']:.2f}\n")
+    file.write(f"Throughput (processes/unit),{metrics['throughput']:.4f}\n")
+    file.write(f"Total Execution Time,{metrics['total_execution_time']}\n")
+    if 'p95_waiting_time' in metrics:
+        for kind, label in (('waiting', 'Waiting Time'), ('turnaround', 'Turnaround Time')):
+            for q in TAIL_QUANTILES:
+                file.write(f"P{q} {label},{metrics[f'p{q}_{kind}_time']:.2f}\n")
+        file.write(f"Max Waiting Time,{metrics['max_waiting_time']}\n")
+        file.write(f"Average Slowdown,{metrics['avg_slowdown']:.4f}\n")
+        file.write(f"Max Slowdown,{metrics['max_slowdown']:.4f}\n")
+        file.write(f"Fairness Index (Jain),{metrics['fairness_index']:.4f}\n")
+        file.write(f"Starved Jobs,{metrics['starved_jobs']}\n")
+    for label, key in SCHEDULER_COUNTERS:
+        if key in metrics:
+            file.write(f"{label},{metrics[key]}\n")
+    for core, utilization in enumerate(metrics.get('core_utilization', [])):
+        file.write(f"Core {core} Utilization (%),{utilization:.2f}\n")
+
+
+def export_results_stream(completed, algorithm_name: str, output_folder: str) -> tuple:
+    # Ghi từng job ngay khi hoàn thành (theo thứ tự completion, không sort PID)
     os.makedirs(output_folder, exist_ok=True)
     
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{algorithm_name.replace(' ', '_')}_{timestamp}.csv"
+    filepath = os.path.join(output_folder, filename)
+    accumulator = MetricsAccumulator()
+    
+    with open(filepath, 'w', newline='', encoding='utf-8') as file:
+        file.write(f"Algorithm,{algorithm_name}\n")
+        file.write(f"Generated,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        file.write("Mode,Streaming\n")
+        file.write("\n")
+        
+        file.write("=== SCHEDULING RESULTS ===\n")
+        fieldnames = ['PID', 'ArrivalTime', 'BurstTime', 'StartTime', 
+                      'CompletionTime', 'TurnaroundTime', 'WaitingTime', 'ResponseTime']
+        
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        
+        for p in completed:
+            writer.writerow(p.to_dict())
+            accumulator.add(p)
+        
+        metrics = accumulator.result()
+        file.write("\n=== PERFORMANCE METRICS ===\n")
+        file.write(f"Total Processes,{accumulator.count}\n")
+        if metrics:
+            _write_metrics(file, metrics)
+    
+    print(f"[✓] Exported:  {filepath}")
+    return filepath, metrics
+
+
+def export_comparison_to_csv(metrics_by_algorithm: dict, output_folder: str) -> str:
+    os.makedirs(output_folder, exist_ok=True)
+    names = list(metrics_by_algorithm)
+    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filepath = os.path.join(output_folder, f"Comparison_{timestamp}.csv")
     
     with open(filepath, 'w', newline='', encoding='utf-8') as file:
-        file.write("=== ALGORITHM COMPARISON:  FCFS vs SJF ===\n")
+        file.write(f"=== ALGORITHM COMPARISON:  {' vs '.join(names)} ===\n")
         file.write(f"Generated,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        file.write("Metric,FCFS,SJF,Better Algorithm\n")
-        
-        comparisons = [
-            ('Average Waiting Time', 'avg_waiting_time', 'lower'),
-            ('Average Turnaround Time', 'avg_turnaround_time', 'lower'),
-            ('CPU Utilization (%)', 'cpu_utilization', 'higher'),
-            ('Throughput', 'throughput', 'higher'),
-        ]
+        writer = csv.writer(file)
+        writer.writerow(['Metric'] + names + ['Better Algorithm'])
         
-        for name, key, better in comparisons:
-            fcfs_val = fcfs_metrics[key]
-            sjf_val = sjf_metrics[key]
-            
-            if better == 'lower':
-                winner = 'FCFS' if fcfs_val < sjf_val else 'SJF' if sjf_val < fcfs_val else 'Equal'
-            else:
-                winner = 'FCFS' if fcfs_val > sjf_val else 'SJF' if sjf_val > fcfs_val else 'Equal'
-            
-            file.write(f"{name},{fcfs_val:.4f},{sjf_val:.4f},{winner}\n")
+        for name, key, better in COMPARISON_METRICS:
+            winner = best_algorithm(metrics_by_algorithm, key, better)
+            writer.writerow([name] + [f"{metrics_by_algorithm[n][key]:.4f}" for n in names] + [winner])
     
     print(f"[✓] Comparison exported: {filepath}")
     return filepath
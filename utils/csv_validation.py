@@ -0,0 +1,114 @@
+# Luật hợp lệ của một dòng workload CSV, dùng chung cho mọi đường đọc:
+# read_workload_csv (NumPy, kiểm tra hàng loạt) và đọc từng dòng qua module csv
+# (không có NumPy, streaming) -> cùng một file luôn cho cùng một workload.
+# Module này không import NumPy.
+MAX_ERROR_EXAMPLES = 20
+REQUIRED_COLUMNS = ('PID', 'ArrivalTime', 'BurstTime')
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1   # giá trị lưu trong cột int64 của Workload
+
+
+class CsvErrorReport:
+    # Đếm lỗi theo loại, chỉ giữ max_examples ví dụ đầu tiên
+
+    def __init__(self, max_examples: int = MAX_ERROR_EXAMPLES):
+        self.max_examples = max_examples
+        self.counts = {}
+        self.examples = []
+        self.rows_read = 0
+        self.rows_valid = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, kind: str, line: int, text):
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if len(self.examples) < self.max_examples:
+            if isinstance(text, bytes):
+                text = text.decode('utf-8', errors='replace')
+            self.examples.append((line, kind, text))
+
+    def add_many(self, kind: str, lines, texts):
+        # Hàng loạt (mảng NumPy hoặc list): chỉ chuyển sang Python phần ví dụ cần giữ
+        self.counts[kind] = self.counts.get(kind, 0) + len(lines)
+        room = max(0, self.max_examples - len(self.examples))
+        head = lines[:room]
+        head = head.tolist() if hasattr(head, 'tolist') else list(head)
+        for line, text in zip(head, texts[:room]):
+            if isinstance(text, bytes):
+                text = text.decode('utf-8', errors='replace')
+            self.examples.append((line, kind, text))
+
+    def print_summary(self, filepath: str):
+        if not self.counts:
+            return
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in sorted(self.counts.items()))
+        print(f"[!] Skipped {self.total} invalid rows in {filepath} ({kinds})")
+        for line, kind, text in sorted(self.examples)[:self.max_examples]:
+            print(f"    line {line}: {kind} - {text}")
+        if self.total > len(self.examples):
+            print(f"    ... {self.total - len(self.examples)} more not shown")
+
+
+def check_columns(names) -> list:
+    # Header -> tên cột đã strip (bỏ BOM); thiếu cột bắt buộc -> KeyError như _parse_header
+    names = [name.strip().lstrip('\ufeff') for name in names or []]
+    for name in REQUIRED_COLUMNS:
+        if name not in names:
+            raise KeyError(name)
+    return names
+
+
+class RowValidator:
+    # Từng dòng một, cùng thứ tự kiểm tra với read_workload_csv:
+    # số ô, int hỏng (kể cả ngoài int64) -> burst <= 0, arrival âm, PID rỗng -> PID trùng (giữ lần đầu).
+    # Tập PID đã gặp là bộ nhớ duy nhất tăng theo số dòng.
+
+    def __init__(self, report: CsvErrorReport):
+        self.report = report
+        self.seen = set()
+
+    def validate(self, line: int, row: dict):
+        # row từ csv.DictReader -> (pid, arrival, burst, priority) hoặc None nếu bị bỏ
+        report = self.report
+        report.rows_read += 1
+        if None in row or None in row.values():
+            # Thừa ô (khoá None, giá trị là list ô thừa) hoặc thiếu ô (giá trị None)
+            fields = []
+            for value in row.values():
+                if isinstance(value, list):
+                    fields.extend(value)
+                elif value is not None:
+                    fields.append(value)
+            report.add('wrong_field_count', line, ",".join(fields))
+            return None
+
+        values = []
+        for name, kind in (('ArrivalTime', 'invalid_arrival'), ('BurstTime', 'invalid_burst'),
+                           ('Priority', 'invalid_priority')):
+            raw = row.get(name)
+            if name == 'Priority' and not (raw or '').strip():
+                values.append(0)
+                continue
+            try:
+                value = int(raw)
+            except ValueError:
+                value = None
+            if value is None or not INT64_MIN <= value <= INT64_MAX:
+                report.add(kind, line, raw)
+                return None
+            values.append(value)
+        arrival, burst, priority = values
+
+        pid = row['PID'].strip()
+        for kind, bad in (('non_positive_burst', burst <= 0), ('negative_arrival', arrival < 0),
+                          ('empty_pid', pid == '')):
+            if bad:
+                report.add(kind, line, pid)
+                return None
+        if pid in self.seen:
+            report.add('duplicate_pid', line, pid)
+            return None
+        self.seen.add(pid)
+        report.rows_valid += 1
+        return pid, arrival, burst, priority
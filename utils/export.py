@@ -0,0 +1,165 @@
+import csv
+import gzip
+import io
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from utils.calculator import COMPARISON_METRICS, best_algorithm
+
+
+# Export theo run: mỗi lần chạy một thư mục run_<run id> gồm các file kết quả nén
+# (.csv.gz / .csv.zst) và manifest.json mô tả chúng.
+#   - Kết quả chia thành row group ROW_GROUP_SIZE dòng; mỗi nhóm được dựng text và nén
+#     độc lập trên thread pool. Dựng text là code Python (giữ GIL, không song song với
+#     luồng chính); chỉ bước nén (zlib / zstd nhả GIL) thật sự chạy song song với việc
+#     lập lịch / hiển thị. Các nhóm nén nối tiếp nhau vẫn là một file gzip (nhiều
+#     member) / zstd (nhiều frame) hợp lệ, đọc lại như một file liền.
+#   - Run id = thời điểm + pid tiến trình + chuỗi ngẫu nhiên -> các run song song
+#     không bao giờ trùng tên, kể cả trong cùng một giây.
+ROW_GROUP_SIZE = 250_000
+COMPRESSIONS = ('gzip', 'zstd', 'none')
+COMPRESSION_LEVELS = {'gzip': 1, 'zstd': 3}    # mức nhanh: CSV số vẫn nhỏ đi ~3 lần
+EXTENSIONS = {'gzip': '.csv.gz', 'zstd': '.csv.zst', 'none': '.csv'}
+RESULT_COLUMNS = ['PID', 'ArrivalTime', 'BurstTime', 'StartTime', 'CompletionTime',
+                  'TurnaroundTime', 'WaitingTime', 'ResponseTime']
+MANIFEST_VERSION = 1
+
+
+def new_run_id() -> str:
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+
+
+def _compressor(compression: str):
+    if compression == 'gzip':
+        level = COMPRESSION_LEVELS['gzip']
+        return lambda data: gzip.compress(data, compresslevel=level, mtime=0)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compression requires the 'zstandard' package "
+                             "(pip install zstandard)") from None
+        level = COMPRESSION_LEVELS['zstd']
+        return lambda data: zstandard.ZstdCompressor(level=level).compress(data)
+    if compression == 'none':
+        return lambda data: data
+    raise ValueError(f"Unknown compression '{compression}'. Available: {', '.join(COMPRESSIONS)}")
+
+
+def _encode_rows(result, indices, core, columns: list = None) -> bytes:
+    # Một row group -> bytes CSV (thứ tự hoàn thành, không sort PID). Qua csv.writer
+    # để PID có dấu phẩy / ngoặc kép được quote như export_results_to_csv
+    jobs, start_time, completion_time = result.jobs, result.start_time, result.completion_time
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if columns:
+        writer.writerow(columns)
+    rows = []
+    for i in indices:
+        job = jobs[i]
+        start, completion = start_time[i], completion_time[i]
+        turnaround = completion - job.arrival_time
+        row = [job.pid, job.arrival_time, job.burst_time, start, completion,
+               turnaround, turnaround - job.burst_time, start - job.arrival_time]
+        if core is not None:
+            row.append(core[i])
+        rows.append(row)
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+class RunExporter:
+    # Dùng: with RunExporter("output") as run: run.export_schedule(...); ...
+    # close() chờ mọi row group, ghi manifest và trả về đường dẫn manifest.
+
+    def __init__(self, output_folder: str, compression: str = 'gzip', workers: int = None,
+                 row_group_size: int = ROW_GROUP_SIZE):
+        self.compress = _compressor(compression)
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.run_id = new_run_id()
+        self.folder = os.path.join(output_folder, f"run_{self.run_id}")
+        os.makedirs(self.folder, exist_ok=True)
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self.files = []
+        self.metrics = {}
+        self._encoders = ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1),
+                                            thread_name_prefix='export-encode')
+        # Một writer: ghi các file theo thứ tự, mỗi file theo thứ tự row group
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='export-write')
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _encode_group(self, result, indices, core, columns: list) -> bytes:
+        return self.compress(_encode_rows(result, indices, core, columns))
+
+    def _write_file(self, entry: dict, groups: list):
+        path = os.path.join(self.folder, entry['file'])
+        with open(path, 'wb') as f:
+            for group in groups:
+                f.write(group.result())
+        with self._lock:
+            entry['bytes'] = os.path.getsize(path)
+
+    def export_schedule(self, result, metrics: dict, name: str) -> str:
+        # Không chặn: trả về ngay tên file; dữ liệu được dựng / nén / ghi trên thread pool
+        safe = name.replace(':', '_').replace(' ', '_')
+        filename = f"{safe}{EXTENSIONS[self.compression]}"
+        core = getattr(result, 'core', None)
+        columns = RESULT_COLUMNS + (['Core'] if core is not None else [])
+
+        order = result.order
+        groups = []
+        for begin in range(0, max(len(order), 1), self.row_group_size):
+            indices = order[begin:begin + self.row_group_size]
+            groups.append(self._encoders.submit(self._encode_group, result, indices, core,
+                                                columns if begin == 0 else None))
+
+        entry = {'algorithm': name, 'file': filename, 'rows': len(order), 'row_groups': len(groups),
+                 'columns': columns, 'compression': self.compression}
+        self.files.append(entry)
+        self.metrics[name] = metrics
+        self._pending.append(self._writer.submit(self._write_file, entry, groups))
+        return os.path.join(self.folder, filename)
+
+    def close(self) -> str:
+        if self._encoders is None:
+            return os.path.join(self.folder, "manifest.json")
+        try:
+            for future in self._pending:
+                future.result()
+        finally:
+            self._encoders.shutdown()
+            self._writer.shutdown()
+            self._encoders = self._writer = None
+
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'run_id': self.run_id,
+            'created': self.created,
+            'completed': datetime.now().isoformat(timespec='seconds'),
+            'compression': self.compression,
+            'row_group_size': self.row_group_size,
+            'files': self.files,
+            'metrics': self.metrics,
+        }
+        if len(self.metrics) > 1:
+            manifest['comparison'] = {key: best_algorithm(self.metrics, key, better)
+                                      for _, key, better in COMPARISON_METRICS}
+        path = os.path.join(self.folder, "manifest.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        total = sum(entry['bytes'] for entry in self.files)
+        print(f"[✓] Run {self.run_id}: {len(self.files)} result files "
+              f"({total / 1024:.1f} KB, {self.compression}) -> {self.folder}")
+        return path
@@ -0,0 +1,205 @@
+import csv
+import io
+
+import numpy as np
+
+from models.workload import Workload
+from utils.csv_validation import CsvErrorReport, MAX_ERROR_EXAMPLES, REQUIRED_COLUMNS
+
+
+# Parser CSV theo khối cho file lớn: đọc từng khối byte, tách cột bằng NumPy,
+# kiểm tra hợp lệ hàng loạt và gom lỗi vào một báo cáo có giới hạn
+# thay vì in một dòng cho mỗi row hỏng. Luật hợp lệ giống utils.csv_validation.RowValidator.
+BLOCK_SIZE = 16 * 1024 * 1024
+
+_NEWLINE, _COMMA, _ZERO = ord('\n'), ord(','), ord('0')
+
+
+def _parse_header(line: bytes) -> dict:
+    names = [name.strip() for name in line.decode('utf-8-sig').strip().split(',')]
+    columns = {name: index for index, name in enumerate(names)}
+    for name in REQUIRED_COLUMNS:
+        if name not in columns:
+            raise KeyError(name)
+    return columns
+
+
+def _to_int(data: np.ndarray, starts: np.ndarray, ends: np.ndarray, lines: np.ndarray,
+            kind: str, report: CsvErrorReport, valid: np.ndarray, blank_default: int = None) -> tuple:
+    # -> (giá trị int64, mask hợp lệ). valid là mask sau các cột trước: dòng đã bị bỏ
+    # không được báo lần nữa (mỗi dòng một lỗi, như RowValidator). Đường nhanh: ô chỉ
+    # gồm chữ số được đổi trực tiếp từ byte cho cả cột cùng lúc, không qua chuỗi Python
+    values = np.zeros(len(starts), dtype=np.int64)
+    valid = valid.copy()
+    if not len(starts):
+        return values, valid
+
+    # Horner theo từng vị trí ký tự: value = value * 10 + chữ số (cột ngắn -> ít vòng lặp)
+    width = ends - starts
+    plain = (width > 0) & (width <= 18)
+    last = len(data) - 1
+    for j in range(min(int(width.max()), 18)):
+        inside = j < width
+        digit = data[np.minimum(starts + j, last)].astype(np.int64) - _ZERO
+        plain &= ~inside | ((digit >= 0) & (digit <= 9))
+        values = np.where(inside, values * 10 + digit, values)
+    values[~plain] = 0
+
+    # Ô còn lại (dấu, khoảng trắng, rỗng, giá trị hỏng): đổi từng ô - hiếm gặp
+    for k in np.flatnonzero(~plain & valid).tolist():
+        raw = data[starts[k]:ends[k]].tobytes()
+        if blank_default is not None and not raw.strip():
+            values[k] = blank_default
+            continue
+        try:
+            values[k] = int(raw)
+        except (ValueError, OverflowError):
+            valid[k] = False
+            report.add(kind, int(lines[k]), raw)
+    return values, valid
+
+
+def _to_bytes(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    # Gom các ô thành ma trận byte [ô, độ rộng lớn nhất] -> mảng 'S<w>'
+    # (byte 0 đệm ở cuối bị NumPy bỏ qua)
+    if not len(starts):
+        return np.zeros(0, dtype=bytes)
+    width = ends - starts
+    span = np.arange(max(1, int(width.max())))
+    chars = data[np.minimum(starts[:, None] + span, len(data) - 1)]
+    chars[span >= width[:, None]] = 0
+    return chars.view(f'S{chars.shape[1]}').ravel()
+
+
+def _split_block(block: bytes, ncols: int, first_line: int, report: CsvErrorReport) -> tuple:
+    # -> (buffer uint8, vị trí đầu ô [rows, ncols], vị trí cuối ô, số dòng file của từng row)
+    if b'"' in block:
+        # Có quote -> để module csv xử lý đúng chuẩn rồi ghép lại thành buffer (hiếm gặp)
+        fields, lines = [], []
+        for offset, row in enumerate(csv.reader(io.StringIO(block.decode('utf-8')))):
+            if not row or not any(field.strip() for field in row):
+                continue
+            if len(row) != ncols:
+                report.add('wrong_field_count', first_line + offset, ",".join(row))
+                continue
+            fields.extend(field.encode('utf-8') for field in row)
+            lines.append(first_line + offset)
+        ends = np.cumsum([len(field) for field in fields], dtype=np.int64)
+        starts = ends - [len(field) for field in fields]
+        data = np.frombuffer(b''.join(fields) or b'\0', dtype=np.uint8)
+        return (data, starts.reshape(-1, ncols), ends.reshape(-1, ncols),
+                np.array(lines, dtype=np.int64))
+
+    # Vị trí mọi dấu phân cách; dòng hợp lệ có đúng ncols dấu (ncols - 1 phẩy + xuống dòng)
+    data = np.frombuffer(block, dtype=np.uint8)
+    delims = np.flatnonzero((data == _COMMA) | (data == _NEWLINE))
+    starts = np.concatenate([[0], delims[:-1] + 1])
+    newline = data[delims] == _NEWLINE
+    line_of = np.cumsum(newline) - newline
+    per_line = np.bincount(line_of, minlength=int(newline.sum()))
+    line_numbers = first_line + np.arange(len(per_line))
+
+    good = per_line == ncols
+    if not good.all():
+        line_ends = delims[newline]
+        line_starts = np.concatenate([[0], line_ends[:-1] + 1])
+        blank = line_ends == line_starts
+        bad = np.flatnonzero(~good & ~blank)
+        if bad.size:
+            texts = [block[line_starts[k]:line_ends[k]] for k in bad[:report.max_examples].tolist()]
+            report.add_many('wrong_field_count', line_numbers[bad], texts)
+        keep = good[line_of]
+        starts, delims = starts[keep], delims[keep]
+        line_numbers = line_numbers[good]
+    return data, starts.reshape(-1, ncols), delims.reshape(-1, ncols), line_numbers
+
+
+def _iter_blocks(file, block_size: int):
+    # Khối luôn kết thúc ở ranh giới dòng; phần dư nối vào khối sau
+    remainder = b''
+    while True:
+        chunk = file.read(block_size)
+        if not chunk:
+            break
+        chunk = remainder + chunk
+        cut = chunk.rfind(b'\n') + 1
+        if cut == 0:
+            remainder = chunk
+            continue
+        remainder = chunk[cut:]
+        yield chunk[:cut]
+    if remainder.strip():
+        yield remainder + b'\n'
+
+
+def read_workload_csv(filepath: str, block_size: int = BLOCK_SIZE,
+                      max_errors: int = MAX_ERROR_EXAMPLES) -> tuple:
+    # -> (Workload, CsvErrorReport). Cùng header với read_processes_from_csv
+    # (PID, ArrivalTime, BurstTime, tuỳ chọn Priority, thứ tự cột bất kỳ).
+    report = CsvErrorReport(max_errors)
+    parts = {'pid': [], 'arrival': [], 'burst': [], 'priority': [], 'line': []}
+
+    with open(filepath, 'rb') as file:
+        header = file.readline()
+        columns = _parse_header(header)
+        ncols = len(columns)
+        next_line = 2
+
+        for block in _iter_blocks(file, block_size):
+            block = block.replace(b'\r', b'')
+            first_line = next_line
+            next_line += block.count(b'\n')
+            data, starts, ends, lines = _split_block(block, ncols, first_line, report)
+            if not len(lines):
+                continue
+
+            def column(name, kind, valid, blank_default=None):
+                index = columns[name]
+                return _to_int(data, starts[:, index], ends[:, index], lines, kind, report,
+                               valid, blank_default)
+
+            valid = np.ones(len(lines), dtype=bool)
+            arrival, valid = column('ArrivalTime', 'invalid_arrival', valid)
+            burst, valid = column('BurstTime', 'invalid_burst', valid)
+            if 'Priority' in columns:
+                priority, valid = column('Priority', 'invalid_priority', valid, blank_default=0)
+            else:
+                priority = np.zeros(len(lines), dtype=np.int64)
+
+            index = columns['PID']
+            pid = np.char.strip(_to_bytes(data, starts[:, index], ends[:, index]))
+            for key, values in (('pid', pid), ('arrival', arrival), ('burst', burst),
+                                ('priority', priority), ('line', lines)):
+                parts[key].append(values[valid])
+
+    def joined(key, dtype):
+        return np.concatenate(parts[key]) if parts[key] else np.zeros(0, dtype=dtype)
+
+    pid, arrival, burst = joined('pid', bytes), joined('arrival', np.int64), joined('burst', np.int64)
+    priority, lines = joined('priority', np.int64), joined('line', np.int64)
+    report.rows_read = next_line - 2
+
+    # Kiểm tra hàng loạt: burst <= 0, arrival âm, PID rỗng, PID trùng (giữ lần đầu)
+    checks = [('non_positive_burst', burst <= 0), ('negative_arrival', arrival < 0),
+              ('empty_pid', pid == b'')]
+    keep = np.ones(len(pid), dtype=bool)
+    for kind, bad in checks:
+        bad &= keep
+        if bad.any():
+            report.add_many(kind, lines[bad], pid[bad][:max_errors].tolist())
+            keep &= ~bad
+    kept = np.flatnonzero(keep)
+    _, first = np.unique(pid[kept], return_index=True)
+    duplicate = keep.copy()
+    duplicate[kept[first]] = False
+    if duplicate.any():
+        report.add_many('duplicate_pid', lines[duplicate], pid[duplicate][:max_errors].tolist())
+        keep &= ~duplicate
+
+    pid = pid[keep]
+    try:
+        pid = pid.astype(str)
+    except UnicodeDecodeError:
+        pid = np.char.decode(pid, 'utf-8')
+    report.rows_valid = int(keep.sum())
+    return Workload(pid, arrival[keep], burst[keep], priority[keep]), report
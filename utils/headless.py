@@ -0,0 +1,208 @@
+import argparse
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+
+# Chế độ batch không giao diện (python main.py --batch ...): không banner, không bảng,
+# không input(). Chỉ import registry + calculator; loader CSV / trace và writer JSON
+# được import khi thật sự cần. Mọi thông báo đi ra stderr, stdout chỉ chứa kết quả.
+# Input được đọc thẳng thành Workload (cần NumPy) và gộp thành một WorkloadBatch.
+BATCH_FORMATS = ('csv', 'json')
+BATCH_EXTENSIONS = ('.csv', '.trace')
+DEFAULT_BATCH_ALGORITHMS = "FCFS,SJF"
+
+BATCH_FIELDS = [
+    ('input', 'input', '{}'),
+    ('algorithm', 'algorithm', '{}'),
+    ('jobs', 'jobs', '{}'),
+    ('avg_wt', 'avg_waiting_time', '{:.4f}'),
+    ('avg_tat', 'avg_turnaround_time', '{:.4f}'),
+    ('p95_wt', 'p95_waiting_time', '{:.4f}'),
+    ('p99_wt', 'p99_waiting_time', '{:.4f}'),
+    ('max_wt', 'max_waiting_time', '{}'),
+    ('cpu_util', 'cpu_utilization', '{:.4f}'),
+    ('throughput', 'throughput', '{:.6f}'),
+    ('fairness', 'fairness_index', '{:.6f}'),
+    ('starved', 'starved_jobs', '{}'),
+    ('makespan', 'total_execution_time', '{}'),
+    ('elapsed_ms', 'elapsed_ms', '{:.3f}'),
+]
+
+
+def collect_inputs(paths: list) -> list:
+    # File giữ nguyên thứ tự; thư mục -> mọi file .csv / .trace bên trong (sắp xếp theo tên)
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            inputs.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                          if name.endswith(BATCH_EXTENSIONS))
+        else:
+            inputs.append(path)
+    return inputs
+
+
+def load_workload(path: str):
+    # -> Workload (cột NumPy, không dựng Process). Thông báo của loader đi ra stderr
+    with redirect_stdout(sys.stderr):
+        if path.endswith('.trace'):
+            from utils.trace_format import load_trace
+            workload = load_trace(path)
+        else:
+            from utils.fast_csv import read_workload_csv
+            try:
+                workload, report = read_workload_csv(path)
+            except KeyError as e:
+                raise ValueError(f"CSV missing column: {e}") from None
+            report.print_summary(path)
+        print(f"[✓] Read {len(workload)} processes from: {path}")
+    return workload
+
+
+def generate_ensemble(count: int, size: int, seed: int = 0) -> tuple:
+    # count workload sinh ngẫu nhiên (seed, seed + 1, ...) -> (tên, workload)
+    from utils.workload_gen import generate_workload
+    names = [f"ensemble[{k}]" for k in range(count)]
+    return names, [generate_workload(size, seed + k) for k in range(count)]
+
+
+def run_batch(names: list, workloads: list, specs: list) -> list:
+    # Thuật toán có bản batched (algorithms.batch) chạy một lần trên mọi workload đã gộp
+    # thành cột phẳng + offsets; thuật toán khác chạy từng workload như trước.
+    # elapsed_ms của bản batched = tổng thời gian / số workload.
+    from algorithms.batch import BATCH_ALGORITHMS, schedule_batch
+    from algorithms.registry import run_algorithm_spec
+    from models.workload import WorkloadBatch
+    from utils.calculator import calculate_metrics_arrays, calculate_batch_metrics
+    import numpy as np
+
+    batch = WorkloadBatch(workloads, names)
+    processes = [None] * len(workloads)
+    metrics_by_spec = {}
+    for spec in specs:
+        if spec in BATCH_ALGORITHMS:
+            start = time.perf_counter_ns()
+            start_time, completion_time = schedule_batch(batch, spec)
+            table = calculate_batch_metrics(batch, start_time, completion_time)
+            elapsed = (time.perf_counter_ns() - start) / 1e6 / max(1, len(batch))
+            columns = {key: values.tolist() for key, values in table.items()}
+            metrics_by_spec[spec] = [dict({key: values[k] for key, values in columns.items()},
+                                          elapsed_ms=elapsed) for k in range(len(batch))]
+            continue
+
+        metrics_by_spec[spec] = []
+        for k, workload in enumerate(workloads):
+            if processes[k] is None:
+                processes[k] = workload.to_processes()
+            start = time.perf_counter_ns()
+            result = run_algorithm_spec(spec, processes[k])
+            elapsed = (time.perf_counter_ns() - start) / 1e6
+            # Cùng kiểu metrics theo cột (percentile chính xác) với bản batched
+            metrics = calculate_metrics_arrays(workload.arrival_time, workload.burst_time,
+                                               np.frombuffer(result.start_time, dtype=np.int64),
+                                               np.frombuffer(result.completion_time, dtype=np.int64))
+            metrics_by_spec[spec].append(dict(metrics, elapsed_ms=elapsed))
+
+    rows = []
+    for k, name in enumerate(names):
+        for spec in specs:
+            rows.append(dict(metrics_by_spec[spec][k], input=name, algorithm=spec,
+                             jobs=len(workloads[k])))
+    return rows
+
+
+def write_batch(rows: list, file, fmt: str = 'csv'):
+    if fmt == 'json':
+        import json
+        json.dump([{name: row[key] for name, key, _ in BATCH_FIELDS} for row in rows],
+                  file, separators=(',', ':'))
+        file.write("\n")
+        return
+
+    import csv
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow([name for name, _, _ in BATCH_FIELDS])
+    for row in rows:
+        writer.writerow([template.format(row[key]) for _, key, template in BATCH_FIELDS])
+
+
+def parse_ensemble(text: str) -> tuple:
+    # "5000:50" -> (5000, 50)
+    try:
+        count, size = (int(v) for v in text.split(':'))
+    except ValueError:
+        raise ValueError(f"Invalid ensemble '{text}', expected COUNT:SIZE") from None
+    if count < 1 or size < 1:
+        raise ValueError(f"Invalid ensemble '{text}': COUNT and SIZE must be positive")
+    return count, size
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog='main.py --batch',
+                                     description='Headless batch mode: schedule many inputs, '
+                                                 'print one compact result row per input and algorithm')
+    parser.add_argument('inputs', nargs='*',
+                        help='Input .csv / .trace files, or directories containing them')
+    parser.add_argument('--ensemble', type=str, default=None, metavar='COUNT:SIZE',
+                        help='Also schedule COUNT generated workloads of SIZE jobs each, e.g. 5000:50')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Base seed for --ensemble (workload k uses seed + k; default: 0)')
+    parser.add_argument('--algorithms', type=str, default=DEFAULT_BATCH_ALGORITHMS,
+                        help=f'Comma-separated schedulers, e.g. FCFS,SJF,RR:4 '
+                             f'(default: {DEFAULT_BATCH_ALGORITHMS})')
+    parser.add_argument('--format', choices=BATCH_FORMATS, default='csv',
+                        help='Result format (default: csv)')
+    parser.add_argument('--out', type=str, default='-',
+                        help='Result file (default: - = stdout)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    from algorithms.registry import parse_algorithm_list
+    try:
+        specs = parse_algorithm_list(args.algorithms)
+        ensemble = parse_ensemble(args.ensemble) if args.ensemble else None
+    except ValueError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return 2
+
+    inputs = collect_inputs(args.inputs)
+    if not inputs and ensemble is None:
+        print("[ERROR] No .csv or .trace inputs found", file=sys.stderr)
+        return 2
+
+    names, workloads, failed = [], [], 0
+    for path in inputs:
+        try:
+            workload = load_workload(path)
+        except (OSError, ValueError) as e:
+            print(f"[✗] {path}: {e}", file=sys.stderr)
+            workload = None
+        if workload is None or not len(workload):
+            print(f"[✗] No processes read from: {path}", file=sys.stderr)
+            failed += 1
+            continue
+        names.append(path)
+        workloads.append(workload)
+    if ensemble is not None:
+        generated_names, generated = generate_ensemble(*ensemble, args.seed)
+        names += generated_names
+        workloads += generated
+
+    rows = run_batch(names, workloads, specs) if workloads else []
+    if args.out == '-':
+        write_batch(rows, sys.stdout, args.format)
+    else:
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.out, 'w', encoding='utf-8', newline='') as f:
+            write_batch(rows, f, args.format)
+        print(f"[✓] {len(rows)} results written to: {args.out}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from models.process import Process
+from models.schedule import ScheduleResult
+from algorithms.registry import run_algorithm_spec
+
+
+# Dưới ngưỡng này chi phí khởi tạo pool lớn hơn thời gian lập lịch
+PARALLEL_MIN_JOBS = 10_000
+
+_INT_SIZE = array('q').itemsize
+
+# Workload đã attach trong worker (mỗi worker dựng một lần qua initializer)
+_worker_jobs = None
+
+
+class SharedWorkload:
+    # Workload chỉ-đọc trong shared memory:
+    #   [n, pid_bytes] arrival[n] burst[n] priority[n] pid_offsets[n+1] | pid bytes (utf-8)
+
+    def __init__(self, processes: list):
+        n = len(processes)
+        encoded = [p.pid.encode('utf-8') for p in processes]
+        offsets = array('q', [0])
+        for pid in encoded:
+            offsets.append(offsets[-1] + len(pid))
+
+        ints = array('q', [n, offsets[-1]])
+        ints.extend(p.arrival_time for p in processes)
+        ints.extend(p.burst_time for p in processes)
+        ints.extend(p.priority for p in processes)
+        ints.extend(offsets)
+        int_bytes = ints.tobytes()
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, len(int_bytes) + offsets[-1]))
+        self.shm.buf[:len(int_bytes)] = int_bytes
+        self.shm.buf[len(int_bytes):len(int_bytes) + offsets[-1]] = b''.join(encoded)
+        self.name = self.shm.name
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_shared_workload(name: str) -> list:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buf = shm.buf
+        n, pid_bytes = array('q', bytes(buf[:2 * _INT_SIZE]))
+        ints = array('q', bytes(buf[2 * _INT_SIZE:(2 + 4 * n + 1) * _INT_SIZE]))
+        pid_blob = bytes(buf[(2 + 4 * n + 1) * _INT_SIZE:(2 + 4 * n + 1) * _INT_SIZE + pid_bytes])
+    finally:
+        shm.close()
+
+    arrival, burst, priority = ints[:n], ints[n:2 * n], ints[2 * n:3 * n]
+    offsets = ints[3 * n:]
+    return [Process(pid_blob[offsets[i]:offsets[i + 1]].decode('utf-8'),
+                    arrival[i], burst[i], priority[i]) for i in range(n)]
+
+
+def _init_worker(name: str):
+    global _worker_jobs
+    _worker_jobs = load_shared_workload(name)
+
+
+def _run_in_worker(spec: str) -> tuple:
+    # Chỉ trả về các mảng kết quả; parent ghép lại với list job của nó
+    result = run_algorithm_spec(spec, _worker_jobs)
+    slices = None
+    if result.slice_job is not None:
+        slices = (result.slice_job, result.slice_start, result.slice_end)
+    return spec, result.order, result.start_time, result.completion_time, slices, result.counters
+
+
+def run_algorithms_concurrently(processes: list, specs: list, workers: int = None) -> dict:
+    # Chạy nhiều thuật toán song song trên cùng một workload chỉ-đọc.
+    # Trả về {spec: ScheduleResult} theo thứ tự specs
+    workers = min(workers or os.cpu_count() or 1, len(specs))
+    if workers <= 1 or len(specs) <= 1:
+        return {spec: run_algorithm_spec(spec, processes) for spec in specs}
+
+    results = {}
+    with SharedWorkload(processes) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.name,)) as executor:
+            for spec, order, start_time, completion_time, slices, counters in \
+                    executor.map(_run_in_worker, specs):
+                results[spec] = ScheduleResult(processes, order, start_time,
+                                               completion_time, slices, counters)
+    return {spec: results[spec] for spec in specs}
@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+# Instrumentation bật bằng --profile. Khi tắt: phase() trả về một nullcontext dùng chung,
+# count()/sample() chỉ là một phép so sánh với None -> gần như không tốn gì.
+#   phases   : (tên, bắt đầu, thời lượng, peak bộ nhớ tracemalloc) - lồng nhau được
+#   counters : tổng cộng dồn (vd. số lần chọn job)
+#   samples  : chuỗi (thời điểm, giá trị) cho counter theo thời gian (vd. độ dài ready queue)
+# tracemalloc / json chỉ import khi profile thật sự bật -> không làm chậm khởi động CLI.
+SAMPLE_INTERVAL = 256   # ghi một mẫu mỗi N lần gọi sample() cho cùng một tên
+
+_active = None
+_NULL_PHASE = nullcontext()
+
+
+class Profiler:
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.origin = time.perf_counter_ns()
+        self.phases = []
+        self.counters = {}
+        self.samples = {}
+        self._sample_ticks = {}
+        self._stack = []
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self.origin) / 1e3
+
+    @contextmanager
+    def phase(self, name: str):
+        # peak của phase con được cộng dồn lên phase cha (reset_peak chỉ có một bộ đếm)
+        entry = {'name': name, 'start_us': self._now_us(), 'child_peak': 0,
+                 'depth': len(self._stack)}
+        self._stack.append(entry)
+        if self.memory:
+            import tracemalloc
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            record = {'name': name, 'depth': entry['depth'], 'start_us': entry['start_us'],
+                      'duration_us': self._now_us() - entry['start_us']}
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], entry['child_peak'])
+                record['peak_bytes'] = peak
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent['child_peak'] = max(parent['child_peak'], peak)
+            self.phases.append(record)
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def sample(self, name: str, value):
+        tick = self._sample_ticks.get(name, 0)
+        self._sample_ticks[name] = tick + 1
+        if tick % SAMPLE_INTERVAL == 0:
+            self.samples.setdefault(name, []).append((self._now_us(), value))
+
+    def record_selection(self, ready_size: int):
+        # Một lần chọn job từ heap: số phép so sánh ~ log2(kích thước heap)
+        self.count('selections')
+        self.count('selection_comparisons', ready_size.bit_length())
+        self.sample('ready_queue', ready_size)
+
+    def report(self) -> dict:
+        totals = {}
+        for record in self.phases:
+            totals[record['name']] = totals.get(record['name'], 0) + record['duration_us']
+        return {
+            'total_us': self._now_us(),
+            'phase_totals_us': totals,
+            'phases': sorted(self.phases, key=lambda r: r['start_us']),
+            'counters': dict(self.counters),
+            'samples': {name: [list(s) for s in values] for name, values in self.samples.items()},
+        }
+
+    def chrome_trace(self) -> dict:
+        # Định dạng Trace Event (chrome://tracing, Perfetto): X = khoảng thời gian, C = counter
+        pid, tid = os.getpid(), threading.get_ident()
+        events = []
+        for record in self.phases:
+            args = {'peak_bytes': record['peak_bytes']} if 'peak_bytes' in record else {}
+            events.append({'name': record['name'], 'ph': 'X', 'ts': record['start_us'],
+                           'dur': record['duration_us'], 'pid': pid, 'tid': tid, 'args': args})
+        for name, values in self.samples.items():
+            for ts, value in values:
+                events.append({'name': name, 'ph': 'C', 'ts': ts, 'pid': pid,
+                               'args': {name: value}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'counters': dict(self.counters)}}
+
+
+def start(memory: bool = True) -> Profiler:
+    global _active
+    import tracemalloc
+    _active = Profiler(memory)
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return _active
+
+
+def stop() -> Profiler:
+    global _active
+    import tracemalloc
+    profiler, _active = _active, None
+    if profiler is not None and profiler.memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return profiler
+
+
+def active() -> Profiler:
+    return _active
+
+
+def phase(name: str):
+    if _active is None:
+        return _NULL_PHASE
+    return _active.phase(name)
+
+
+def count(name: str, value: int = 1):
+    if _active is not None:
+        _active.count(name, value)
+
+
+def write_profile(profiler: Profiler, filepath: str, fmt: str = 'json') -> str:
+    import json
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = profiler.chrome_trace() if fmt == 'chrome' else profiler.report()
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    print(f"[✓] Profile written ({fmt}): {filepath}")
+    return filepath
+
+
+def display_profile(profiler: Profiler):
+    report = profiler.report()
+    print("\n" + "=" * 55)
+    print("  PROFILE")
+    print("=" * 55)
+    print(f"{'Phase':<24}{'Time (ms)':>12}{'Peak (KB)':>14}")
+    print("-" * 55)
+    for record in report['phases']:
+        peak = f"{record['peak_bytes'] / 1024:.1f}" if 'peak_bytes' in record else "-"
+        name = "  " * record['depth'] + record['name']
+        print(f"{name:<24}{record['duration_us'] / 1e3:>12.3f}{peak:>14}")
+    print("-" * 55)
+    for name, value in report['counters'].items():
+        print(f"  {name:<22}: {value}")
+    print(f"  {'total':<22}: {report['total_us'] / 1e3:.3f} ms")
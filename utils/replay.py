@@ -0,0 +1,265 @@
+import argparse
+import csv
+import gzip
+import os
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+
+import numpy as np
+
+from models.process import Process
+from models.workload import Workload
+from algorithms.registry import parse_algorithm_list
+from utils.calculator import COMPARISON_METRICS, calculate_metrics_arrays
+from utils.parallel import run_algorithms_concurrently, PARALLEL_MIN_JOBS
+
+
+# Replay lịch đã ghi lại (cùng cột với export_results_to_csv, có hoặc không có phần
+# đầu "Algorithm,..." / "=== SCHEDULING RESULTS ===") và so sánh với lịch mô phỏng:
+#   lượt 1 : đọc (PID, ArrivalTime, BurstTime[, Priority]) -> workload cho các thuật toán
+#   lượt 2 : đọc lại file theo từng khối, hash join theo PID với kết quả mô phỏng
+#            (bảng băm PID -> index cột), delta tính theo cột NumPy và ghi ngay từng khối
+# Dòng đã ghi không bao giờ nằm trọn trong bộ nhớ - chỉ giữ hai cột int64 start/completion.
+RECORDED_COLUMNS = ('PID', 'ArrivalTime', 'BurstTime', 'StartTime', 'CompletionTime')
+REPLAY_CHUNK_SIZE = 100_000
+DEFAULT_REPLAY_ALGORITHMS = "FCFS,SJF"
+
+
+def _open_recorded(file) -> dict:
+    # Bỏ qua phần đầu tới dòng header; -> {tên cột: vị trí}
+    for line in file:
+        names = [name.strip() for name in line.rstrip('\r\n').split(',')]
+        if names and names[0] == 'PID':
+            columns = {name: index for index, name in enumerate(names)}
+            missing = [name for name in RECORDED_COLUMNS if name not in columns]
+            if missing:
+                raise ValueError(f"Recorded schedule missing column(s): {', '.join(missing)}")
+            return columns
+    raise ValueError("No 'PID,...' header found in recorded schedule")
+
+
+def iter_recorded_chunks(filepath: str, chunk_size: int = REPLAY_CHUNK_SIZE, skipped: list = None):
+    # -> các khối [(pid, arrival, burst, priority, start, completion)]
+    # Dừng ở dòng trống hoặc mục "=== ... ===" kế tiếp (phần metrics của file export)
+    # File .gz (export nén theo run, --compress gzip) đọc trực tiếp như text
+    opener = gzip.open if filepath.endswith('.gz') else open
+    with opener(filepath, 'rt', encoding='utf-8', newline='') as file:
+        columns = _open_recorded(file)
+        pid_col, arrival_col, burst_col, start_col, completion_col = (
+            columns[name] for name in RECORDED_COLUMNS)
+        priority_col = columns.get('Priority')
+
+        reader = csv.reader(file)
+        while True:
+            chunk, consumed = [], 0
+            for row in islice(reader, chunk_size):
+                consumed += 1
+                if not row or not row[0].strip() or row[0].startswith('==='):
+                    consumed = 0
+                    break
+                try:
+                    chunk.append((row[pid_col].strip(), int(row[arrival_col]), int(row[burst_col]),
+                                  int(row[priority_col] or 0) if priority_col is not None else 0,
+                                  int(row[start_col]), int(row[completion_col])))
+                except (ValueError, IndexError):
+                    if skipped is not None:
+                        skipped.append(row)
+            if chunk:
+                yield chunk
+            if consumed < chunk_size:
+                return
+
+
+def load_recorded_workload(filepath: str, chunk_size: int = REPLAY_CHUNK_SIZE) -> list:
+    # Lượt 1: workload (PID trùng chỉ giữ lần đầu - khoá join phải duy nhất)
+    processes, seen, skipped = [], set(), []
+    for chunk in iter_recorded_chunks(filepath, chunk_size, skipped):
+        for pid, arrival, burst, priority, _, _ in chunk:
+            if pid not in seen:
+                seen.add(pid)
+                processes.append(Process(pid, arrival, burst, priority))
+    if skipped:
+        print(f"[!] Skipped {len(skipped)} invalid rows in {filepath}")
+    return processes
+
+
+class _DeltaStats:
+    # Thống kê delta waiting time (mô phỏng - đã ghi) của một thuật toán, cộng dồn theo khối
+
+    def __init__(self):
+        self.improved = 0
+        self.worse = 0
+        self.unchanged = 0
+        self.total_delta = 0
+        self.best = 0       # delta âm nhất (job được lợi nhiều nhất)
+        self.worst = 0      # delta dương nhất
+
+    def add_many(self, delta: np.ndarray):
+        if not len(delta):
+            return
+        self.improved += int((delta < 0).sum())
+        self.worse += int((delta > 0).sum())
+        self.unchanged += int((delta == 0).sum())
+        self.total_delta += int(delta.sum())
+        self.best = min(self.best, int(delta.min()))
+        self.worst = max(self.worst, int(delta.max()))
+
+    def summary(self) -> dict:
+        n = self.improved + self.worse + self.unchanged
+        return {'jobs_improved': self.improved, 'jobs_worse': self.worse,
+                'jobs_unchanged': self.unchanged, 'total_waiting_delta': self.total_delta,
+                'avg_waiting_delta': self.total_delta / n if n else 0,
+                'best_waiting_delta': self.best, 'worst_waiting_delta': self.worst}
+
+
+def replay_schedule(filepath: str, specs: list, output_folder: str, workers: int = None,
+                    chunk_size: int = REPLAY_CHUNK_SIZE) -> dict:
+    # -> {'recorded': metrics, spec: {'metrics', 'deltas'}, 'unmatched': n, 'file': path}
+    processes = load_recorded_workload(filepath, chunk_size)
+    if not processes:
+        raise ValueError(f"No scheduled jobs found in: {filepath}")
+
+    if len(processes) < PARALLEL_MIN_JOBS:
+        workers = 1
+    results = run_algorithms_concurrently(processes, specs, workers)
+
+    # Phía build của hash join: PID -> index job, dựng một lần, mọi kết quả mô phỏng
+    # dùng chung vì cột start/completion đều đánh index theo workload
+    index = {p.pid: i for i, p in enumerate(processes)}
+    workload = Workload.from_processes(processes)
+    matched = np.zeros(len(processes), dtype=bool)
+    columns = [(spec, np.frombuffer(results[spec].start_time, dtype=np.int64),
+                np.frombuffer(results[spec].completion_time, dtype=np.int64)) for spec in specs]
+    # Chỉ giữ hai cột số đã ghi (int64, theo index job) cho metrics tổng hợp, không giữ dòng
+    recorded_start = np.zeros(len(processes), dtype=np.int64)
+    recorded_completion = np.zeros(len(processes), dtype=np.int64)
+    stats = {spec: _DeltaStats() for spec in specs}
+    unmatched = 0
+
+    os.makedirs(output_folder, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output = os.path.join(output_folder, f"Replay_{timestamp}.csv")
+    with open(output, 'w', newline='', encoding='utf-8') as file:
+        file.write(f"Recorded Schedule,{filepath}\n")
+        file.write(f"Generated,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        file.write(f"Total Processes,{len(processes)}\n\n")
+        file.write("=== PER-JOB DELTAS (simulated - recorded) ===\n")
+        writer = csv.writer(file)
+        header = ['PID', 'ArrivalTime', 'BurstTime', 'Recorded_Start', 'Recorded_WT']
+        for spec in specs:
+            header += [f"{spec}_Start", f"{spec}_WT", f"{spec}_dWT"]
+        writer.writerow(header)
+
+        # Phía probe: từng khối dòng đã ghi -> cột NumPy, tra bảng băm, delta tính theo cột
+        for chunk in iter_recorded_chunks(filepath, chunk_size):
+            pid, arrival, burst, _, start, completion = zip(*chunk)
+            probe = np.fromiter((index.get(p, -1) for p in pid), dtype=np.int64, count=len(pid))
+            # Giữ dòng khớp lần đầu: bỏ PID lạ và PID lặp lại (trong khối hoặc ở khối trước)
+            rows = np.flatnonzero(probe >= 0)
+            rows = rows[~matched[probe[rows]]]
+            rows = np.sort(rows[np.unique(probe[rows], return_index=True)[1]])
+            unmatched += len(pid) - len(rows)
+            probe = probe[rows]
+            matched[probe] = True
+
+            arrival = np.array(arrival, dtype=np.int64)[rows]
+            burst = np.array(burst, dtype=np.int64)[rows]
+            start = np.array(start, dtype=np.int64)[rows]
+            completion = np.array(completion, dtype=np.int64)[rows]
+            recorded_start[probe] = start
+            recorded_completion[probe] = completion
+
+            # burst giống nhau -> delta waiting = delta turnaround
+            waiting = completion - arrival - burst
+            out = [[pid[k] for k in rows.tolist()], arrival.tolist(), burst.tolist(),
+                   start.tolist(), waiting.tolist()]
+            for spec, sim_start, sim_completion in columns:
+                sim_waiting = sim_completion[probe] - arrival - burst
+                delta = sim_waiting - waiting
+                stats[spec].add_many(delta)
+                out += [sim_start[probe].tolist(), sim_waiting.tolist(), delta.tolist()]
+            writer.writerows(zip(*out))
+
+        # Metrics tổng hợp tính theo cột (percentile chính xác) cho cả hai phía
+        recorded = calculate_metrics_arrays(workload.arrival_time[matched], workload.burst_time[matched],
+                                            recorded_start[matched], recorded_completion[matched])
+        report = {'file': output, 'recorded': recorded, 'unmatched': unmatched}
+        for spec, sim_start, sim_completion in columns:
+            report[spec] = {'metrics': calculate_metrics_arrays(workload.arrival_time, workload.burst_time,
+                                                                sim_start, sim_completion),
+                            'deltas': stats[spec].summary()}
+
+        file.write("\n=== AGGREGATE METRIC DELTAS ===\n")
+        writer.writerow(['Metric', 'Recorded'] + [f"{spec}{suffix}" for spec in specs
+                                                  for suffix in ('', '_Delta')])
+        for name, key, _ in COMPARISON_METRICS:
+            base = report['recorded'][key]
+            values = []
+            for spec in specs:
+                value = report[spec]['metrics'][key]
+                values += [f"{value:.4f}", f"{value - base:+.4f}"]
+            writer.writerow([name, f"{base:.4f}"] + values)
+        file.write("\n=== PER-JOB WAITING TIME DELTAS ===\n")
+        for key in stats[specs[0]].summary():
+            writer.writerow([key] + [report[spec]['deltas'][key] for spec in specs])
+
+    print(f"[✓] Replay exported to: {output}")
+    return report
+
+
+def display_replay(report: dict, specs: list):
+    width = 25 + 22 * (len(specs) + 1)
+    print("\n" + "=" * width)
+    print(f"  REPLAY: recorded schedule vs {', '.join(specs)}")
+    print("=" * width)
+    print(f"{'Metric':<25}{'Recorded':<22}" + "".join(f"{spec + ' (delta)':<22}" for spec in specs))
+    print("-" * width)
+    for name, key, _ in COMPARISON_METRICS:
+        base = report['recorded'][key]
+        cells = ""
+        for spec in specs:
+            value = report[spec]['metrics'][key]
+            cells += f"{f'{value:.2f} ({value - base:+.2f})':<22}"
+        print(f"{name:<25}{base:<22.2f}{cells}")
+    print("-" * width)
+    for spec in specs:
+        deltas = report[spec]['deltas']
+        print(f"  {spec}: {deltas['jobs_improved']} jobs wait less, {deltas['jobs_worse']} wait more, "
+              f"{deltas['jobs_unchanged']} unchanged (total waiting delta {deltas['total_waiting_delta']:+d})")
+    if report['unmatched']:
+        print(f"  [!] {report['unmatched']} recorded rows had no matching PID (unknown or duplicate)")
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Replay a recorded schedule against simulated policies')
+    parser.add_argument('recorded', help='Recorded schedule CSV (columns as written by the result export)')
+    parser.add_argument('--algorithms', type=str, default=DEFAULT_REPLAY_ALGORITHMS,
+                        help=f'Comma-separated schedulers to compare (default: {DEFAULT_REPLAY_ALGORITHMS})')
+    parser.add_argument('--output', type=str, default='output',
+                        help='Folder for the per-job delta report (default: output)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for the simulations (default: CPU count, 1 = serial)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    try:
+        specs = parse_algorithm_list(args.algorithms)
+        if not specs:
+            raise ValueError("No algorithms selected")
+        start = time.perf_counter()
+        report = replay_schedule(args.recorded, specs, args.output, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    display_replay(report, specs)
+    print(f"  [✓] Finished in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
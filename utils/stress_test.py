@@ -1,117 +1,450 @@
 import time
 import random
-import copy
+import math
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from models.process import Process
-from algorithms.fcfs import fcfs_scheduling
-from algorithms.sjf import sjf_non_preemptive
+from algorithms.registry import parse_algorithm_list, run_algorithm_spec
 from utils.calculator import calculate_metrics
 import csv
 import os
+import sys
 from datetime import datetime
 
 
-def generate_random_processes(num_processes: int) -> list:
+DEFAULT_TEST_SIZES = [100, 500, 1000, 2000]
+DEFAULT_STRESS_ALGORITHMS = ['FCFS', 'SJF']
+DEFAULT_TRIALS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_SEED = 0
+
+# Tier lớn (10^5 .. 10^7 job): chỉ các thuật toán có bản chạy trên mảng (algorithms.batch),
+# không dựng object Process, không lưu kết quả dạng list
+STRESS_TIERS = ('standard', 'large')
+LARGE_TEST_SIZES = [100_000, 1_000_000, 10_000_000]
+LARGE_STRESS_ALGORITHMS = ['FCFS', 'SJF', 'PRIORITY']
+LARGE_TRIALS = 1
+LARGE_PRIORITY_LEVELS = 8
+
+
+def generate_random_processes(num_processes: int, seed: int = None) -> list:
+    rng = random.Random(seed)
     processes = []
     for i in range(num_processes):
         p = Process(
             pid=f"P{i+1}",
-            arrival_time=random. randint(0, num_processes // 2),
-            burst_time=random.randint(1, 20)
+            arrival_time=rng.randint(0, num_processes // 2),
+            burst_time=rng.randint(1, 20)
         )
         processes.append(p)
     return processes
 
 
-def run_stress_test(num_processes: int) -> dict:
+def summarize_timings(samples_ns: list) -> dict:
+    # median / p95 (nearest-rank) / stddev, đơn vị giây
+    ordered = sorted(samples_ns)
+    n = len(ordered)
+    p95_index = max(0, math.ceil(0.95 * n) - 1)
+    return {
+        'median': statistics.median(ordered) / 1e9,
+        'p95': ordered[p95_index] / 1e9,
+        'stddev': (statistics.stdev(ordered) / 1e9) if n > 1 else 0.0,
+        'samples': n
+    }
+
+
+def parse_workload_spec(text: str) -> dict:
+    # "poisson:pareto" -> tuỳ chọn cho utils.workload_gen.generate_workload
+    from utils.workload_gen import ARRIVAL_MODELS, BURST_MODELS  # cần NumPy
+    arrivals, _, bursts = text.partition(':')
+    arrivals, bursts = arrivals.strip().lower(), (bursts.strip().lower() or 'exponential')
+    if arrivals not in ARRIVAL_MODELS or bursts not in BURST_MODELS:
+        raise ValueError(f"Invalid workload '{text}', expected ARRIVALS:BURSTS "
+                         f"(arrivals: {', '.join(ARRIVAL_MODELS)}; bursts: {', '.join(BURST_MODELS)})")
+    return {'arrivals': arrivals, 'bursts': bursts}
+
+
+def check_stress_counts(trials: int, warmup: int = 0, seeds: int = 1):
+    if trials < 1:
+        raise ValueError(f"--trials must be at least 1, got {trials}")
+    if warmup < 0:
+        raise ValueError(f"--warmup must not be negative, got {warmup}")
+    if seeds < 1:
+        raise ValueError(f"--seeds must be at least 1, got {seeds}")
+
+
+def make_processes(num_processes: int, seed: int, workload: dict = None) -> list:
+    # workload = None -> generator cũ (uniform), ngược lại dùng utils.workload_gen
+    if workload is None:
+        return generate_random_processes(num_processes, seed)
+    from utils.workload_gen import generate_processes
+    return generate_processes(num_processes, seed, **workload)
+
+
+def _run_cell(num_processes: int, algorithm: str, seed: int,
+              trials: int, warmup: int, workload: dict = None) -> dict:
+    # Một ô (size, algorithm, seed) - chạy được trong worker process
+    base = make_processes(num_processes, seed, workload)
+
+    samples = []
+    for round_index in range(warmup + trials):
+        # Workload bất biến: mọi vòng dùng chung, không cần copy
+        start = time.perf_counter_ns()
+        result = run_algorithm_spec(algorithm, base)
+        elapsed = time.perf_counter_ns() - start
+        if round_index >= warmup:
+            samples.append(elapsed)
+
+    metrics = calculate_metrics(result)
+    return {
+        'num_processes': num_processes,
+        'algorithm': algorithm,
+        'seed': seed,
+        'samples_ns': samples,
+        'avg_wt': metrics.get('avg_waiting_time', 0),
+        'avg_tat': metrics.get('avg_turnaround_time', 0)
+    }
+
+
+def _merge_cells(cells: list, sizes: list, algorithms: list) -> list:
+    # Gộp các seed của cùng (size, algorithm) thành một dòng kết quả
+    grouped = {}
+    for cell in cells:
+        grouped.setdefault((cell['num_processes'], cell['algorithm']), []).append(cell)
+
+    results = []
+    for size in sizes:
+        for algorithm in algorithms:
+            group = grouped[(size, algorithm)]
+            samples = [s for cell in group for s in cell['samples_ns']]
+            summary = summarize_timings(samples)
+            results.append({
+                'num_processes': size,
+                'algorithm': algorithm,
+                'seeds': sorted(cell['seed'] for cell in group),
+                'median': summary['median'],
+                'p95': summary['p95'],
+                'stddev': summary['stddev'],
+                'samples': summary['samples'],
+                'avg_wt': statistics.fmean(cell['avg_wt'] for cell in group),
+                'avg_tat': statistics.fmean(cell['avg_tat'] for cell in group)
+            })
+    return results
+
+
+def _fastest_by_size(results: list) -> dict:
+    fastest = {}
+    for r in results:
+        best = fastest.get(r['num_processes'])
+        if best is None or r['median'] < best['median']:
+            fastest[r['num_processes']] = r
+    return {size: r['algorithm'] for size, r in fastest.items()}
+
+
+def _workload_label(workload: dict) -> str:
+    if workload is None:
+        return "uniform:uniform (legacy)"
+    return f"{workload['arrivals']}:{workload['bursts']}"
+
+
+def run_stress_test(num_processes: int, algorithms: list = None,
+                    trials: int = DEFAULT_TRIALS, warmup: int = DEFAULT_WARMUP,
+                    seed: int = DEFAULT_SEED) -> list:
+    algorithms = algorithms or DEFAULT_STRESS_ALGORITHMS
+
     print(f"\n{'='*55}")
     print(f"  STRESS TEST - {num_processes} PROCESSES")
     print("=" * 55)
-    
-    processes = generate_random_processes(num_processes)
-    
-    # Test FCFS
-    fcfs_copy = copy.deepcopy(processes)
-    start_time = time.time()
-    fcfs_result = fcfs_scheduling(fcfs_copy)
-    fcfs_exec_time = time.time() - start_time
-    fcfs_metrics = calculate_metrics(fcfs_result)
-    
-    # Test SJF
-    sjf_copy = copy.deepcopy(processes)
-    start_time = time.time()
-    sjf_result = sjf_non_preemptive(sjf_copy)
-    sjf_exec_time = time.time() - start_time
-    sjf_metrics = calculate_metrics(sjf_result)
-    
+
+    cells = [_run_cell(num_processes, algorithm, seed, trials, warmup)
+             for algorithm in algorithms]
+    results = _merge_cells(cells, [num_processes], algorithms)
+
     # Display
-    print(f"\n{'Algorithm':<12}{'Exec Time':<15}{'Avg WT':<12}{'Avg TAT':<12}")
+    print(f"\n{'Algorithm':<12}{'Median (s)':<15}{'Avg WT':<12}{'Avg TAT':<12}")
     print("-" * 50)
-    print(f"{'FCFS':<12}{fcfs_exec_time:<15.4f}{fcfs_metrics['avg_waiting_time']:<12.2f}"
-          f"{fcfs_metrics['avg_turnaround_time']:<12.2f}")
-    print(f"{'SJF':<12}{sjf_exec_time:<15.4f}{sjf_metrics['avg_waiting_time']:<12.2f}"
-          f"{sjf_metrics['avg_turnaround_time']:<12.2f}")
-    
-    return {
-        'num_processes': num_processes,
-        'fcfs_exec_time': fcfs_exec_time,
-        'sjf_exec_time': sjf_exec_time,
-        'fcfs_avg_wt': fcfs_metrics['avg_waiting_time'],
-        'sjf_avg_wt': sjf_metrics['avg_waiting_time']
-    }
+    for r in results:
+        print(f"{r['algorithm']:<12}{r['median']:<15.6f}{r['avg_wt']:<12.2f}"
+              f"{r['avg_tat']:<12.2f}")
 
+    return results
+
+
+def run_multiple_stress_tests(output_folder: str = "output", sizes: list = None,
+                              algorithms: list = None, trials: int = DEFAULT_TRIALS,
+                              warmup: int = DEFAULT_WARMUP, seeds: int = 1,
+                              workers: int = None, seed: int = DEFAULT_SEED,
+                              workload: dict = None):
+    check_stress_counts(trials, warmup, seeds)
+    test_sizes = sizes or DEFAULT_TEST_SIZES
+    algorithms = parse_algorithm_list(','.join(algorithms or DEFAULT_STRESS_ALGORITHMS))
+
+    # Mỗi ô (size, algorithm, seed) độc lập -> chia cho process pool
+    cell_args = [(size, algorithm, seed + k, trials, warmup, workload)
+                 for size in test_sizes
+                 for algorithm in algorithms
+                 for k in range(seeds)]
 
-def run_multiple_stress_tests(output_folder: str = "output"):
-    test_sizes = [100, 500, 1000, 2000]
-    results = []
-    
     print("\n" + "=" * 55)
     print("  RUNNING STRESS TESTS")
     print("=" * 55)
-    
-    for size in test_sizes: 
-        result = run_stress_test(size)
-        results.append(result)
-    
+    print(f"  Sizes: {test_sizes}")
+    print(f"  Algorithms: {', '.join(algorithms)}")
+    print(f"  Trials: {trials} (+{warmup} warm-up), Seeds: {seeds} from {seed}")
+    print(f"  Workload: {_workload_label(workload)}")
+
+    cells = []
+    if workers == 1:
+        for args in cell_args:
+            cells.append(_run_cell(*args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_cell, *args) for args in cell_args]
+            for future in as_completed(futures):
+                cell = future.result()
+                print(f"  [✓] {cell['algorithm']:<12}{cell['num_processes']:>10} processes"
+                      f"  (seed {cell['seed']})")
+                cells.append(cell)
+
+    results = _merge_cells(cells, test_sizes, algorithms)
+    fastest = _fastest_by_size(results)
+
     # Summary
-    print("\n" + "=" * 60)
+    print("\n" + "=" * 78)
     print("  STRESS TEST SUMMARY")
-    print("=" * 60)
-    print(f"{'Processes':<12}{'FCFS Time':<15}{'SJF Time':<15}{'Faster':<10}")
-    print("-" * 52)
-    
+    print("=" * 78)
+    print(f"{'Processes':<12}{'Algorithm':<12}{'Median (s)':<14}{'P95 (s)':<14}"
+          f"{'Stddev (s)':<14}{'Avg WT':<12}")
+    print("-" * 78)
+
     for r in results:
-        faster = "FCFS" if r['fcfs_exec_time'] < r['sjf_exec_time'] else "SJF"
-        print(f"{r['num_processes']:<12}{r['fcfs_exec_time']:<15.4f}"
-              f"{r['sjf_exec_time']:<15.4f}{faster:<10}")
-    
-    
+        marker = " *" if fastest[r['num_processes']] == r['algorithm'] else ""
+        print(f"{r['num_processes']:<12}{r['algorithm']:<12}{r['median']:<14.6f}"
+              f"{r['p95']:<14.6f}{r['stddev']:<14.6f}{r['avg_wt']:<12.2f}{marker}")
+    print("-" * 78)
+    print("  * = fastest median for that size")
+
+
     # Export to CSV
     os.makedirs(output_folder, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filepath = os.path.join(output_folder, f"StressTest_Results_{timestamp}.csv")
-    
+
     try:
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
             f.write("=== STRESS TEST RESULTS ===\n")
-            f.write(f"Timestamp,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            fieldnames = ['NumProcesses', 'FCFS_Time', 'SJF_Time', 'Faster_Algo', 
-                          'FCFS_Avg_WT', 'SJF_Avg_WT']
+            f.write(f"Timestamp,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Seed,{seed}\n")
+            f.write(f"Seeds Per Size,{seeds}\n")
+            f.write(f"Workload,{_workload_label(workload)}\n")
+            f.write(f"Trials,{trials}\n")
+            f.write(f"Warmup,{warmup}\n\n")
+
+            fieldnames = ['NumProcesses', 'Algorithm', 'Median_Time', 'P95_Time',
+                          'Stddev_Time', 'Samples', 'Fastest_Algo', 'Avg_WT', 'Avg_TAT']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            
+
             for r in results:
-                faster = "FCFS" if r['fcfs_exec_time'] < r['sjf_exec_time'] else "SJF"
                 writer.writerow({
                     'NumProcesses': r['num_processes'],
-                    'FCFS_Time': f"{r['fcfs_exec_time']:.6f}",
-                    'SJF_Time': f"{r['sjf_exec_time']:.6f}",
-                    'Faster_Algo': faster,
-                    'FCFS_Avg_WT': f"{r['fcfs_avg_wt']:.2f}",
-                    'SJF_Avg_WT': f"{r['sjf_avg_wt']:.2f}"
+                    'Algorithm': r['algorithm'],
+                    'Median_Time': f"{r['median']:.6f}",
+                    'P95_Time': f"{r['p95']:.6f}",
+                    'Stddev_Time': f"{r['stddev']:.6f}",
+                    'Samples': r['samples'],
+                    'Fastest_Algo': fastest[r['num_processes']],
+                    'Avg_WT': f"{r['avg_wt']:.2f}",
+                    'Avg_TAT': f"{r['avg_tat']:.2f}"
                 })
         print(f"\n[✓] Stress test results exported to: {filepath}")
     except Exception as e:
         print(f"\n[✗] Failed to export stress test results: {e}")
-    
-    return results
\ No newline at end of file
+
+    return results
+
+
+def check_large_algorithms(algorithms: list) -> list:
+    from algorithms.batch import BATCH_ALGORITHMS   # cần NumPy
+    specs = parse_algorithm_list(','.join(algorithms or LARGE_STRESS_ALGORITHMS))
+    unsupported = [spec for spec in specs if spec not in BATCH_ALGORITHMS]
+    if unsupported:
+        raise ValueError(f"No large-tier stress mode for {', '.join(unsupported)} "
+                         f"(available: {', '.join(BATCH_ALGORITHMS)})")
+    return specs
+
+
+def _reset_peak_rss() -> bool:
+    # Linux: ghi "5" vào clear_refs đặt lại VmHWM -> đỉnh RSS đo riêng cho từng thuật toán.
+    # Không có (macOS, Windows, container khoá /proc) -> đỉnh tính từ lúc process chạy
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024   # Linux: KB, macOS: byte
+
+
+def _large_workload(num_processes: int, seed: int, workload: dict = None):
+    # Sinh theo từng size ngay trước khi đo; workload = None -> uniform:uniform như tier thường
+    from utils.workload_gen import generate_workload
+    options = workload or {'arrivals': 'uniform', 'bursts': 'uniform'}
+    return generate_workload(num_processes, seed, priority_levels=LARGE_PRIORITY_LEVELS, **options)
+
+
+def _run_large_cell(batch, algorithm: str, trials: int) -> dict:
+    import tracemalloc
+    from algorithms.batch import schedule_batch
+    from utils.calculator import calculate_metrics_arrays
+
+    # Vòng đo bộ nhớ (kiêm warm-up, không tính giờ): tracemalloc thấy cả mảng NumPy lẫn
+    # list Python; tính phần vượt trên mức đang dùng (workload dùng chung không tính)
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = schedule_batch(batch, algorithm)
+    traced_peak = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+
+    # Các vòng tính giờ chạy không có tracemalloc (tracemalloc làm chậm cấp phát)
+    per_algorithm = _reset_peak_rss()
+    samples = []
+    for _ in range(trials):
+        result = None   # kết quả vòng trước không chiếm thêm bộ nhớ
+        start = time.perf_counter_ns()
+        result = schedule_batch(batch, algorithm)
+        samples.append(time.perf_counter_ns() - start)
+    peak_rss = _peak_rss_bytes()
+
+    start_time, completion_time = result
+    metrics = calculate_metrics_arrays(batch.arrival_time, batch.burst_time, start_time, completion_time)
+    return {
+        'algorithm': algorithm,
+        'samples_ns': samples,
+        'traced_peak': traced_peak,
+        'peak_rss': peak_rss,
+        'rss_scope': 'per algorithm' if per_algorithm else 'process lifetime',
+        'avg_wt': metrics.get('avg_waiting_time', 0),
+        'avg_tat': metrics.get('avg_turnaround_time', 0)
+    }
+
+
+def run_large_stress_tests(output_folder: str = "output", sizes: list = None,
+                           algorithms: list = None, trials: int = LARGE_TRIALS,
+                           seed: int = DEFAULT_SEED, workload: dict = None) -> list:
+    import numpy as np
+    from models.workload import WorkloadBatch
+
+    test_sizes = sizes or LARGE_TEST_SIZES
+    check_stress_counts(trials)
+    algorithms = check_large_algorithms(algorithms)
+
+    print("\n" + "=" * 55)
+    print("  RUNNING LARGE-SCALE STRESS TESTS")
+    print("=" * 55)
+    print(f"  Sizes: {test_sizes}")
+    print(f"  Algorithms: {', '.join(algorithms)}")
+    print(f"  Trials: {trials} (+1 traced memory round), Seed: {seed}")
+    print(f"  Workload: {_workload_label(workload)}")
+
+    results = []
+    for size in test_sizes:
+        # Một workload tại một thời điểm, dùng chung cho mọi thuật toán: cột NumPy +
+        # thứ tự arrival tính một lần. Tie-break theo thứ tự sinh (P1, P2, ...) thay cho
+        # so sánh chuỗi PID -> PID không bao giờ được dựng
+        generated = _large_workload(size, seed, workload)
+        order = np.argsort(generated.arrival_time, kind='stable')
+        batch = WorkloadBatch([generated], order=order)
+        buffer_bytes = (generated.arrival_time.nbytes + generated.burst_time.nbytes
+                        + generated.priority.nbytes + order.nbytes)
+
+        for algorithm in algorithms:
+            cell = _run_large_cell(batch, algorithm, trials)
+            summary = summarize_timings(cell['samples_ns'])
+            cell.update(num_processes=size, median=summary['median'], p95=summary['p95'],
+                        samples=summary['samples'], workload_bytes=buffer_bytes)
+            results.append(cell)
+            print(f"  [✓] {algorithm:<12}{size:>10} processes  {summary['median']:.3f}s"
+                  f"  peak RSS {cell['peak_rss'] / 2**20:.1f} MB"
+                  f"  traced {cell['traced_peak'] / 2**20:.1f} MB")
+        del batch, generated, order
+
+    fastest = _fastest_by_size(results)
+
+    # Summary
+    print("\n" + "=" * 90)
+    print("  LARGE-SCALE STRESS TEST SUMMARY")
+    print("=" * 90)
+    print(f"{'Processes':<12}{'Algorithm':<12}{'Median (s)':<14}{'Jobs/s':<14}"
+          f"{'Peak RSS (MB)':<16}{'Traced (MB)':<14}{'B/job':<8}")
+    print("-" * 90)
+    for r in results:
+        marker = " *" if fastest[r['num_processes']] == r['algorithm'] else ""
+        jobs_per_second = r['num_processes'] / r['median'] if r['median'] else 0.0
+        print(f"{r['num_processes']:<12}{r['algorithm']:<12}{r['median']:<14.6f}"
+              f"{jobs_per_second:<14.0f}{r['peak_rss'] / 2**20:<16.1f}"
+              f"{r['traced_peak'] / 2**20:<14.1f}{r['traced_peak'] / r['num_processes']:<8.1f}{marker}")
+    print("-" * 90)
+    print("  * = fastest median for that size; Traced = tracemalloc peak above the shared workload")
+
+    # Export to CSV
+    os.makedirs(output_folder, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(output_folder, f"StressTest_Large_{timestamp}.csv")
+
+    try:
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            f.write("=== LARGE-SCALE STRESS TEST RESULTS ===\n")
+            f.write(f"Timestamp,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Seed,{seed}\n")
+            f.write(f"Workload,{_workload_label(workload)}\n")
+            f.write(f"Trials,{trials}\n")
+            f.write(f"Peak RSS Scope,{results[0]['rss_scope'] if results else ''}\n\n")
+
+            fieldnames = ['NumProcesses', 'Algorithm', 'Median_Time', 'P95_Time', 'Samples',
+                          'Jobs_Per_Sec', 'Workload_MB', 'Peak_RSS_MB', 'Traced_Peak_MB',
+                          'Traced_Bytes_Per_Job', 'Fastest_Algo', 'Avg_WT', 'Avg_TAT']
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for r in results:
+                writer.writerow({
+                    'NumProcesses': r['num_processes'],
+                    'Algorithm': r['algorithm'],
+                    'Median_Time': f"{r['median']:.6f}",
+                    'P95_Time': f"{r['p95']:.6f}",
+                    'Samples': r['samples'],
+                    'Jobs_Per_Sec': f"{r['num_processes'] / r['median'] if r['median'] else 0:.0f}",
+                    'Workload_MB': f"{r['workload_bytes'] / 2**20:.2f}",
+                    'Peak_RSS_MB': f"{r['peak_rss'] / 2**20:.2f}",
+                    'Traced_Peak_MB': f"{r['traced_peak'] / 2**20:.2f}",
+                    'Traced_Bytes_Per_Job': f"{r['traced_peak'] / r['num_processes']:.1f}",
+                    'Fastest_Algo': fastest[r['num_processes']],
+                    'Avg_WT': f"{r['avg_wt']:.2f}",
+                    'Avg_TAT': f"{r['avg_tat']:.2f}"
+                })
+        print(f"\n[✓] Large-scale stress test results exported to: {filepath}")
+    except Exception as e:
+        print(f"\n[✗] Failed to export stress test results: {e}")
+
+    return results
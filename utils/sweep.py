@@ -0,0 +1,253 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from models.process import Process
+from algorithms.registry import ALGORITHM_PARAMS, parse_algorithm_list, run_algorithm_spec
+from utils.calculator import calculate_metrics
+from utils.csv_handler import read_processes_from_csv
+from utils.parallel import SharedWorkload, load_shared_workload
+from utils.stress_test import generate_random_processes
+
+
+# Lưới mặc định: thuật toán x quantum (chỉ RR) x hệ số giãn arrival x phân phối burst
+DEFAULT_SWEEP_ALGORITHMS = "FCFS,SJF,SRTF,RR"
+DEFAULT_QUANTA = "1,2,4,8"
+DEFAULT_ARRIVAL_SCALES = "0.5,1,2"
+DEFAULT_BURST_DISTRIBUTIONS = "input,exponential,bimodal"
+DEFAULT_SWEEP_SIZE = 1000
+SWEEP_TOP_ROWS = 10
+BURST_DISTRIBUTIONS = ('input', 'uniform', 'exponential', 'pareto', 'bimodal')
+
+# Workload gốc và các biến thể đã dựng trong worker (mỗi worker dựng một lần)
+_base_jobs = None
+_variants = {}
+
+
+def _resample_bursts(jobs: list, distribution: str, seed: int) -> list:
+    # Giữ nguyên burst trung bình của workload gốc để các phân phối so sánh được với nhau
+    if distribution == 'input' or not jobs:
+        return [p.burst_time for p in jobs]
+
+    rng = random.Random(seed)
+    mean = max(1.0, sum(p.burst_time for p in jobs) / len(jobs))
+    if distribution == 'uniform':
+        return [rng.randint(1, max(1, round(2 * mean - 1))) for _ in jobs]
+    if distribution == 'exponential':
+        return [max(1, round(rng.expovariate(1 / mean))) for _ in jobs]
+    if distribution == 'pareto':
+        # alpha = 1.5: đuôi nặng, x_m chọn để trung bình = mean
+        scale = mean / 3
+        return [max(1, round(scale * rng.paretovariate(1.5))) for _ in jobs]
+    if distribution == 'bimodal':
+        # 80% job ngắn, 20% job dài
+        short, long = max(1, round(mean / 2)), max(1, round(mean * 3))
+        return [long if rng.random() < 0.2 else short for _ in jobs]
+    raise ValueError(f"Unknown burst distribution '{distribution}'. "
+                     f"Available: {', '.join(BURST_DISTRIBUTIONS)}")
+
+
+def build_variant(jobs: list, arrival_scale: float, distribution: str, seed: int = 0) -> list:
+    # arrival_scale > 1 giãn các lần đến (tải nhẹ hơn), < 1 dồn lại (tải nặng hơn)
+    bursts = _resample_bursts(jobs, distribution, seed)
+    return [Process(p.pid, round(p.arrival_time * arrival_scale), burst, p.priority)
+            for p, burst in zip(jobs, bursts)]
+
+
+def expand_grid(algorithms: list, quanta: list, arrival_scales: list,
+                distributions: list) -> list:
+    # -> [(spec, arrival_scale, distribution)], gom theo biến thể workload
+    specs = []
+    for name in algorithms:
+        if ALGORITHM_PARAMS.get(name, ())[:1] == ('quantum',) and quanta:
+            specs.extend(f"{name}:{q}" for q in quanta)
+        else:
+            specs.append(name)
+    return [(spec, scale, distribution)
+            for scale in arrival_scales
+            for distribution in distributions
+            for spec in specs]
+
+
+def _init_sweep_worker(name: str):
+    global _base_jobs, _variants
+    _base_jobs = load_shared_workload(name)
+    _variants = {}
+
+
+def _run_sweep_cell(cell: tuple) -> dict:
+    spec, scale, distribution, seed = cell
+    key = (scale, distribution)
+    if key not in _variants:
+        _variants[key] = build_variant(_base_jobs, scale, distribution, seed)
+    jobs = _variants[key]
+
+    start = time.perf_counter_ns()
+    result = run_algorithm_spec(spec, jobs)
+    elapsed = time.perf_counter_ns() - start
+
+    metrics = calculate_metrics(result)
+    metrics.update({
+        'algorithm': spec,
+        'arrival_scale': scale,
+        'burst_distribution': distribution,
+        'jobs': len(jobs),
+        'elapsed_ms': elapsed / 1e6
+    })
+    return metrics
+
+
+def run_sweep(processes: list, grid: list, workers: int = None, seed: int = 0) -> list:
+    # Workload được parse một lần, đặt vào shared memory; mỗi worker attach một lần
+    # rồi chạy cả loạt ô -> không khởi động tiến trình lạnh cho từng cấu hình.
+    global _base_jobs, _variants
+    cells = [(spec, scale, distribution, seed) for spec, scale, distribution in grid]
+    workers = min(workers or os.cpu_count() or 1, len(cells))
+
+    if workers <= 1:
+        _base_jobs, _variants = processes, {}
+        try:
+            return [_run_sweep_cell(cell) for cell in cells]
+        finally:
+            _base_jobs, _variants = None, {}
+
+    # Chunk liền nhau -> phần lớn ô trong một chunk dùng chung biến thể workload
+    chunksize = max(1, len(cells) // (workers * 4))
+    with SharedWorkload(processes) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                                 initargs=(shared.name,)) as executor:
+            return list(executor.map(_run_sweep_cell, cells, chunksize=chunksize))
+
+
+SWEEP_FIELDS = [
+    ('Algorithm', 'algorithm', '{}'),
+    ('ArrivalScale', 'arrival_scale', '{:g}'),
+    ('BurstDistribution', 'burst_distribution', '{}'),
+    ('Jobs', 'jobs', '{}'),
+    ('Avg_WT', 'avg_waiting_time', '{:.2f}'),
+    ('Avg_TAT', 'avg_turnaround_time', '{:.2f}'),
+    ('P95_WT', 'p95_waiting_time', '{:.2f}'),
+    ('P99_WT', 'p99_waiting_time', '{:.2f}'),
+    ('Max_WT', 'max_waiting_time', '{}'),
+    ('CPU_Util', 'cpu_utilization', '{:.2f}'),
+    ('Throughput', 'throughput', '{:.4f}'),
+    ('Fairness', 'fairness_index', '{:.4f}'),
+    ('Starved', 'starved_jobs', '{}'),
+    ('Makespan', 'total_execution_time', '{}'),
+    ('Elapsed_ms', 'elapsed_ms', '{:.3f}'),
+]
+
+
+def export_sweep_to_csv(rows: list, output_folder: str, source: str) -> str:
+    os.makedirs(output_folder, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(output_folder, f"Sweep_Results_{timestamp}.csv")
+
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        f.write("=== PARAMETER SWEEP RESULTS ===\n")
+        f.write(f"Timestamp,{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Workload,{source}\n")
+        f.write(f"Configurations,{len(rows)}\n\n")
+        writer = csv.writer(f)
+        writer.writerow([name for name, _, _ in SWEEP_FIELDS])
+        for row in rows:
+            writer.writerow([fmt.format(row[key]) for _, key, fmt in SWEEP_FIELDS])
+
+    print(f"[✓] Sweep results exported to: {filepath}")
+    return filepath
+
+
+def display_sweep_summary(rows: list, top: int = SWEEP_TOP_ROWS):
+    print("\n" + "=" * 78)
+    print(f"  SWEEP SUMMARY - best {min(top, len(rows))} of {len(rows)} by Avg WT")
+    print("=" * 78)
+    print(f"{'Algorithm':<12}{'Arrival x':<11}{'Bursts':<13}{'Avg WT':<12}"
+          f"{'P95 WT':<12}{'Fairness':<10}{'Time (ms)':<10}")
+    print("-" * 78)
+    for row in sorted(rows, key=lambda r: r['avg_waiting_time'])[:top]:
+        print(f"{row['algorithm']:<12}{row['arrival_scale']:<11g}{row['burst_distribution']:<13}"
+              f"{row['avg_waiting_time']:<12.2f}{row['p95_waiting_time']:<12.2f}"
+              f"{row['fairness_index']:<10.4f}{row['elapsed_ms']:<10.3f}")
+    print("-" * 78)
+
+
+def _split(text: str, convert=str) -> list:
+    return [convert(v.strip()) for v in text.split(',') if v.strip()]
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Parameter sweep over scheduling configurations')
+    parser.add_argument('--input', type=str, default=None,
+                        help='Workload CSV (default: generate one with --size/--seed)')
+    parser.add_argument('--size', type=int, default=DEFAULT_SWEEP_SIZE,
+                        help=f'Processes in the generated workload (default: {DEFAULT_SWEEP_SIZE})')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the generated workload and burst resampling (default: 0)')
+    parser.add_argument('--algorithms', type=str, default=DEFAULT_SWEEP_ALGORITHMS,
+                        help=f'Comma-separated algorithms (default: {DEFAULT_SWEEP_ALGORITHMS})')
+    parser.add_argument('--quanta', type=str, default=DEFAULT_QUANTA,
+                        help=f'Round Robin quanta to sweep (default: {DEFAULT_QUANTA})')
+    parser.add_argument('--arrival-scales', type=str, default=DEFAULT_ARRIVAL_SCALES,
+                        help=f'Arrival-time multipliers; <1 = heavier load (default: {DEFAULT_ARRIVAL_SCALES})')
+    parser.add_argument('--bursts', type=str, default=DEFAULT_BURST_DISTRIBUTIONS,
+                        help=f'Burst distributions ({", ".join(BURST_DISTRIBUTIONS)}; '
+                             f'default: {DEFAULT_BURST_DISTRIBUTIONS})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count, 1 = serial)')
+    parser.add_argument('--output', type=str, default='output',
+                        help='Folder for the consolidated results table (default: output)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    try:
+        algorithms = parse_algorithm_list(args.algorithms)
+        quanta = _split(args.quanta, int)
+        scales = _split(args.arrival_scales, float)
+        distributions = _split(args.bursts)
+        for distribution in distributions:
+            if distribution not in BURST_DISTRIBUTIONS:
+                raise ValueError(f"Unknown burst distribution '{distribution}'. "
+                                 f"Available: {', '.join(BURST_DISTRIBUTIONS)}")
+        if any(q <= 0 for q in quanta) or any(s <= 0 for s in scales):
+            raise ValueError("Quanta and arrival scales must be positive")
+        if not args.input and args.size < 1:
+            raise ValueError(f"--size must be at least 1, got {args.size}")
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    if args.input:
+        processes = read_processes_from_csv(args.input)
+        if not processes:
+            print(f"[ERROR] Could not read input file: {args.input}")
+            return 1
+        source = args.input
+    else:
+        processes = generate_random_processes(args.size, args.seed)
+        source = f"generated ({args.size} processes, seed {args.seed})"
+
+    grid = expand_grid(algorithms, quanta, scales, distributions)
+    print("\n" + "=" * 55)
+    print("  PARAMETER SWEEP")
+    print("=" * 55)
+    print(f"  Workload: {source}")
+    print(f"  Configurations: {len(grid)}")
+
+    start = time.perf_counter()
+    rows = run_sweep(processes, grid, args.workers, args.seed)
+    print(f"  [✓] Finished in {time.perf_counter() - start:.2f}s")
+
+    display_sweep_summary(rows)
+    export_sweep_to_csv(rows, args.output, source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
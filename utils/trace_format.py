@@ -0,0 +1,241 @@
+import argparse
+import os
+import struct
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from models.schedule import MultiCoreResult
+from models.workload import Workload
+from utils.fast_csv import read_workload_csv
+
+
+# Binary trace (little-endian), mọi cột int64 nên luôn căn 8 byte:
+#   header (64 byte) : magic, version, flags, n, pid_bytes
+#   arrival[n] burst[n] priority[n]
+#   order[n] start[n] completion[n]          (chỉ khi có FLAG_SCHEDULE)
+#   core[n]                                  (chỉ khi có FLAG_CORES; số core nằm trong header)
+#   slice_job[m] slice_start[m] slice_end[m] (chỉ khi có FLAG_SLICES; m nằm trong header)
+#   pid_offsets[n+1]
+#   pid table: các PID utf-8 nối bằng '\n'
+TRACE_MAGIC = b'CPUTRACE'
+TRACE_VERSION = 1
+TRACE_EXTENSION = '.trace'
+FLAG_SCHEDULE = 1
+FLAG_CORES = 2
+FLAG_SLICES = 4
+
+_HEADER = struct.Struct('<8sIIQQ')
+_EXTRA = struct.Struct('<QQ')       # số core, số slice: ngay sau _HEADER, trong phần đệm của header
+_HEADER_SIZE = 64
+_INT64 = np.dtype('<i8')
+
+
+def _encode_pids(pids) -> tuple:
+    pids = [str(pid) for pid in pids]
+    joined = "\n".join(pids)
+    if joined.count('\n') != max(0, len(pids) - 1):
+        bad = next(pid for pid in pids if '\n' in pid)
+        raise ValueError(f"PID contains a newline: {bad!r}")
+    table = joined.encode('utf-8') + (b'\n' if pids else b'')
+
+    # ASCII -> số byte = số ký tự, khỏi encode từng PID
+    if len(table) == len(joined) + (1 if pids else 0):
+        lengths = np.fromiter(map(len, pids), dtype=np.int64, count=len(pids))
+    else:
+        lengths = np.fromiter((len(p.encode('utf-8')) for p in pids), dtype=np.int64, count=len(pids))
+    offsets = np.zeros(len(pids) + 1, dtype=np.int64)
+    np.cumsum(lengths + 1, out=offsets[1:])
+    return table, offsets
+
+
+def write_trace(filepath: str, workload: Workload, order=None,
+                start_time=None, completion_time=None, core=None, cores: int = 0,
+                slices: tuple = None) -> str:
+    # Ghi workload (và tuỳ chọn kết quả lập lịch, cột core của lịch nhiều CPU,
+    # slices (job, start, end) của lịch preemptive) ra file binary
+    n = len(workload)
+    pid_table, offsets = _encode_pids(workload.pid.tolist())
+    flags = FLAG_SCHEDULE if start_time is not None else 0
+    if flags and core is not None:
+        flags |= FLAG_CORES
+    if flags and slices is not None:
+        flags |= FLAG_SLICES
+
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(filepath, 'wb') as f:
+        header = _HEADER.pack(TRACE_MAGIC, TRACE_VERSION, flags, n, len(pid_table))
+        extra = _EXTRA.pack(cores if flags & FLAG_CORES else 0,
+                            len(slices[0]) if flags & FLAG_SLICES else 0)
+        f.write((header + extra).ljust(_HEADER_SIZE, b'\0'))
+        columns = [workload.arrival_time, workload.burst_time, workload.priority]
+        if flags & FLAG_SCHEDULE:
+            columns += [order, start_time, completion_time]
+        if flags & FLAG_CORES:
+            columns.append(core)
+        if flags & FLAG_SLICES:
+            columns += list(slices)
+        for column in columns + [offsets]:
+            np.asarray(column, dtype=_INT64).tofile(f)
+        f.write(pid_table)
+    return filepath
+
+
+def write_schedule_trace(filepath: str, result) -> str:
+    # ScheduleResult -> binary trace cùng format (workload + order/start/completion);
+    # MultiCoreResult ghi thêm cột core và số core; lịch preemptive ghi thêm slices
+    core = getattr(result, 'core', None)
+    slices = None
+    if result.slice_job is not None:
+        slices = tuple(np.asarray(column, dtype=_INT64)
+                       for column in (result.slice_job, result.slice_start, result.slice_end))
+    write_trace(filepath, Workload.from_processes(result.jobs),
+                order=np.asarray(result.order, dtype=_INT64),
+                start_time=np.asarray(result.start_time, dtype=_INT64),
+                completion_time=np.asarray(result.completion_time, dtype=_INT64),
+                core=None if core is None else np.asarray(core, dtype=_INT64),
+                cores=getattr(result, 'cores', 0), slices=slices)
+    return filepath
+
+
+def export_schedule_trace(result, algorithm_name: str, output_folder: str) -> str:
+    os.makedirs(output_folder, exist_ok=True)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{algorithm_name.replace(' ', '_')}_{timestamp}{TRACE_EXTENSION}"
+    filepath = write_schedule_trace(os.path.join(output_folder, filename), result)
+    
+    print(f"[✓] Exported trace:  {filepath}")
+    return filepath
+
+
+def _read_header(filepath: str) -> tuple:
+    with open(filepath, 'rb') as f:
+        raw = f.read(_HEADER_SIZE)
+    if len(raw) < _HEADER_SIZE:
+        raise ValueError(f"Not a trace file (too short): {filepath}")
+    magic, version, flags, n, pid_bytes = _HEADER.unpack_from(raw)
+    if magic != TRACE_MAGIC:
+        raise ValueError(f"Not a trace file (bad magic): {filepath}")
+    if version != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version {version}: {filepath}")
+    cores, slice_count = _EXTRA.unpack_from(raw, _HEADER.size)
+    cores = cores if flags & FLAG_CORES else 0
+    slice_count = slice_count if flags & FLAG_SLICES else 0
+
+    # File bị cắt / ghi dở -> báo rõ ở đây thay vì lỗi view dtype sâu trong NumPy
+    expected = _HEADER_SIZE + (_column_count(flags) * n + 3 * slice_count + n + 1) * 8 + pid_bytes
+    actual = os.path.getsize(filepath)
+    if actual != expected:
+        raise ValueError(f"Trace size mismatch in {filepath}: header describes {n} jobs "
+                         f"({expected} bytes) but file has {actual} bytes")
+    return flags, n, pid_bytes, cores, slice_count
+
+
+def _column_count(flags: int) -> int:
+    return 3 + (3 if flags & FLAG_SCHEDULE else 0) + (1 if flags & FLAG_CORES else 0)
+
+
+def open_trace(filepath: str) -> dict:
+    # Map cả file vào bộ nhớ - không đọc/parse gì cho tới khi cột được dùng
+    flags, n, pid_bytes, cores, slice_count = _read_header(filepath)
+    column_count = _column_count(flags)
+    data = np.memmap(filepath, dtype=np.uint8, mode='r')
+
+    def column(index, length=n):
+        begin = _HEADER_SIZE + index * n * 8
+        return data[begin:begin + length * 8].view(_INT64)
+
+    slices_begin = _HEADER_SIZE + column_count * n * 8
+
+    def slice_column(index):
+        begin = slices_begin + index * slice_count * 8
+        return data[begin:begin + slice_count * 8].view(_INT64)
+
+    offsets_begin = slices_begin + 3 * slice_count * 8
+    table_begin = offsets_begin + (n + 1) * 8
+    offsets = data[offsets_begin:table_begin].view(_INT64)
+    pid_table = data[table_begin:table_begin + pid_bytes]
+
+    def pids():
+        if n == 0:
+            return np.array([], dtype=str)
+        return np.array(pid_table.tobytes()[:-1].decode('utf-8').split('\n'))
+
+    columns = {
+        'workload': Workload(pids, column(0), column(1), column(2)),
+        'pid_offsets': offsets,
+        'pid_table': pid_table,
+    }
+    if flags & FLAG_SCHEDULE:
+        columns['order'] = column(3)
+        columns['start_time'] = column(4)
+        columns['completion_time'] = column(5)
+    if flags & FLAG_CORES:
+        columns['core'] = column(6)
+        columns['cores'] = cores
+    if flags & FLAG_SLICES:
+        columns['slices'] = tuple(slice_column(k) for k in range(3))
+    return columns
+
+
+def load_trace(filepath: str) -> Workload:
+    return open_trace(filepath)['workload']
+
+
+def load_schedule_trace(filepath: str):
+    # Đọc lại kết quả đã ghi bằng write_schedule_trace -> ScheduleResult / MultiCoreResult
+    columns = open_trace(filepath)
+    if 'start_time' not in columns:
+        raise ValueError(f"Trace has no schedule columns: {filepath}")
+    if 'core' in columns:
+        return MultiCoreResult(columns['workload'].to_processes(), columns['order'],
+                               columns['start_time'], columns['completion_time'],
+                               columns['core'], columns['cores'])
+    return columns['workload'].to_schedule_result(
+        columns['order'], columns['start_time'], columns['completion_time'], columns.get('slices'))
+
+
+def read_pid(columns: dict, index: int) -> str:
+    # Truy cập ngẫu nhiên một PID mà không decode cả bảng
+    begin, end = int(columns['pid_offsets'][index]), int(columns['pid_offsets'][index + 1])
+    return columns['pid_table'][begin:end - 1].tobytes().decode('utf-8')
+
+
+def convert_csv_to_trace(csv_path: str, trace_path: str) -> str:
+    # Parse thẳng sang Workload (cột NumPy), không dựng Process
+    try:
+        workload, report = read_workload_csv(csv_path)
+    except KeyError as e:
+        raise ValueError(f"CSV missing column: {e}") from None
+    report.print_summary(csv_path)
+    write_trace(trace_path, workload)
+    print(f"[✓] Converted {len(workload)} processes: {csv_path} -> {trace_path}")
+    return trace_path
+
+
+def is_trace_file(filepath: str) -> bool:
+    return filepath.endswith(TRACE_EXTENSION)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Convert a process CSV to the binary trace format')
+    parser.add_argument('csv', help='Input CSV (PID,ArrivalTime,BurstTime[,Priority])')
+    parser.add_argument('trace', nargs='?', help='Output trace (default: same name with .trace)')
+    args = parser.parse_args(argv)
+
+    trace_path = args.trace or os.path.splitext(args.csv)[0] + TRACE_EXTENSION
+    try:
+        convert_csv_to_trace(args.csv, trace_path)
+    except (OSError, ValueError) as e:
+        print(f"[✗] {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
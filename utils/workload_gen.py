@@ -0,0 +1,185 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from models.workload import Workload
+
+
+# Sinh workload tổng hợp bằng NumPy (vectorized, seed được):
+#   arrivals : uniform (giống generate_random_processes), poisson, onoff (bùng phát theo pha)
+#   bursts   : uniform, exponential, pareto, lognormal, bimodal - cùng burst trung bình
+#   load     : tải mục tiêu rho = arrival rate * burst trung bình (poisson / onoff)
+ARRIVAL_MODELS = ('uniform', 'poisson', 'onoff')
+BURST_MODELS = ('uniform', 'exponential', 'pareto', 'lognormal', 'bimodal')
+DEFAULT_MEAN_BURST = 10
+DEFAULT_LOAD = 0.9
+DEFAULT_ON_OFF = (50.0, 50.0)   # thời lượng trung bình pha ON / OFF (đơn vị thời gian)
+DEFAULT_PRIORITY_LEVELS = 1
+PARETO_ALPHA = 1.5
+LOGNORMAL_SIGMA = 1.0
+CSV_CHUNK_SIZE = 1_000_000
+
+
+def sample_bursts(rng, model: str, n: int, mean: float = DEFAULT_MEAN_BURST) -> np.ndarray:
+    if model == 'uniform':
+        samples = rng.integers(1, max(2, round(2 * mean)), n)
+    elif model == 'exponential':
+        samples = rng.exponential(mean, n)
+    elif model == 'pareto':
+        # numpy.pareto là Lomax -> +1 rồi nhân x_m để được Pareto cổ điển có trung bình = mean
+        scale = mean * (PARETO_ALPHA - 1) / PARETO_ALPHA
+        samples = scale * (1 + rng.pareto(PARETO_ALPHA, n))
+    elif model == 'lognormal':
+        mu = np.log(mean) - LOGNORMAL_SIGMA ** 2 / 2
+        samples = rng.lognormal(mu, LOGNORMAL_SIGMA, n)
+    elif model == 'bimodal':
+        # 80% job ngắn, 20% job dài
+        samples = np.where(rng.random(n) < 0.2, mean * 3, mean / 2)
+    else:
+        raise ValueError(f"Unknown burst model '{model}'. Available: {', '.join(BURST_MODELS)}")
+    return np.maximum(1, np.rint(samples)).astype(np.int64)
+
+
+def _poisson_arrivals(rng, n: int, rate: float) -> np.ndarray:
+    return np.cumsum(rng.exponential(1 / rate, n))
+
+
+def _on_off_arrivals(rng, n: int, rate: float, on_off: tuple) -> np.ndarray:
+    # Job chỉ đến trong pha ON với rate cao hơn, sao cho rate trung bình vẫn = rate.
+    # Sinh thời điểm trên "đồng hồ ON", rồi cộng tổng thời lượng các pha OFF đứng trước.
+    mean_on, mean_off = on_off
+    on_rate = rate * (mean_on + mean_off) / mean_on
+    on_clock = _poisson_arrivals(rng, n, on_rate)
+
+    phases = int(on_clock[-1] / mean_on * 1.2) + 16
+    on_ends = np.cumsum(rng.exponential(mean_on, phases))
+    while on_ends[-1] <= on_clock[-1]:
+        on_ends = np.concatenate([on_ends, on_ends[-1] + np.cumsum(rng.exponential(mean_on, phases))])
+    off_before = np.concatenate([[0.0], np.cumsum(rng.exponential(mean_off, len(on_ends) - 1))])
+
+    phase = np.searchsorted(on_ends, on_clock, side='right')
+    return on_clock + off_before[phase]
+
+
+def generate_workload(n: int, seed: int = None, arrivals: str = 'poisson', bursts: str = 'exponential',
+                      load: float = DEFAULT_LOAD, mean_burst: float = DEFAULT_MEAN_BURST,
+                      on_off: tuple = DEFAULT_ON_OFF,
+                      priority_levels: int = DEFAULT_PRIORITY_LEVELS) -> Workload:
+    if arrivals not in ARRIVAL_MODELS:
+        raise ValueError(f"Unknown arrival model '{arrivals}'. Available: {', '.join(ARRIVAL_MODELS)}")
+    if load <= 0:
+        raise ValueError("Target load must be positive")
+
+    rng = np.random.default_rng(seed)
+    burst_time = sample_bursts(rng, bursts, n, mean_burst)
+
+    if n == 0:
+        arrival_time = np.zeros(0, dtype=np.int64)
+    elif arrivals == 'uniform':
+        arrival_time = rng.integers(0, n // 2 + 1, n)
+    else:
+        # Hiệu chỉnh theo burst thực tế đã sinh -> tải đạt đúng mục tiêu
+        rate = load / burst_time.mean()
+        if arrivals == 'poisson':
+            arrival_time = _poisson_arrivals(rng, n, rate)
+        else:
+            arrival_time = _on_off_arrivals(rng, n, rate, on_off)
+        arrival_time = np.floor(arrival_time).astype(np.int64)
+
+    priority = rng.integers(0, max(1, priority_levels), n) if priority_levels > 1 else None
+
+    # PID chỉ dựng khi thật sự cần (to_processes / ghi file)
+    def pids():
+        return np.char.add('P', np.arange(1, n + 1).astype(str))
+
+    return Workload(pids, arrival_time, burst_time, priority)
+
+
+def generate_processes(n: int, seed: int = None, **options) -> list:
+    # Cùng kiểu trả về với stress_test.generate_random_processes
+    return generate_workload(n, seed, **options).to_processes()
+
+
+def write_workload_csv(workload: Workload, filepath: str, chunk_size: int = CSV_CHUNK_SIZE) -> str:
+    # Ghi theo từng khối -> bộ nhớ tạm chỉ tỉ lệ với chunk_size
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    pid = workload.pid
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        f.write("PID,ArrivalTime,BurstTime,Priority\n")
+        for begin in range(0, len(workload), chunk_size):
+            end = begin + chunk_size
+            rows = map("{},{},{},{}\n".format, pid[begin:end].tolist(),
+                       workload.arrival_time[begin:end].tolist(),
+                       workload.burst_time[begin:end].tolist(),
+                       workload.priority[begin:end].tolist())
+            f.write("".join(rows))
+    return filepath
+
+
+def write_workload(workload: Workload, filepath: str) -> str:
+    # .trace -> binary cột (utils.trace_format), còn lại CSV
+    from utils.trace_format import write_trace, is_trace_file
+    if is_trace_file(filepath):
+        return write_trace(filepath, workload)
+    return write_workload_csv(workload, filepath)
+
+
+def parse_on_off(text: str) -> tuple:
+    # "50:200" -> (50.0, 200.0)
+    try:
+        on, off = (float(v) for v in text.split(':'))
+    except ValueError:
+        raise ValueError(f"Invalid on/off phases '{text}', expected ON:OFF") from None
+    if on <= 0 or off < 0:
+        raise ValueError(f"Invalid on/off phases '{text}': ON must be positive, OFF non-negative")
+    return on, off
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic process workload')
+    parser.add_argument('output', help='Output file (.csv or .trace)')
+    parser.add_argument('--size', type=int, default=100_000, help='Number of processes (default: 100000)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--arrivals', choices=ARRIVAL_MODELS, default='poisson',
+                        help='Arrival model (default: poisson)')
+    parser.add_argument('--bursts', choices=BURST_MODELS, default='exponential',
+                        help='Burst-time distribution (default: exponential)')
+    parser.add_argument('--load', type=float, default=DEFAULT_LOAD,
+                        help=f'Target CPU load for poisson/onoff arrivals (default: {DEFAULT_LOAD})')
+    parser.add_argument('--mean-burst', type=float, default=DEFAULT_MEAN_BURST,
+                        help=f'Mean burst time (default: {DEFAULT_MEAN_BURST})')
+    parser.add_argument('--on-off', type=str, default=':'.join(f"{v:g}" for v in DEFAULT_ON_OFF),
+                        help='Mean ON:OFF phase durations for onoff arrivals (default: 50:50)')
+    parser.add_argument('--priorities', type=int, default=DEFAULT_PRIORITY_LEVELS,
+                        help='Number of random priority levels (default: 1 = all zero)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    try:
+        start = time.perf_counter()
+        workload = generate_workload(args.size, args.seed, args.arrivals, args.bursts, args.load,
+                                     args.mean_burst, parse_on_off(args.on_off), args.priorities)
+        generated = time.perf_counter() - start
+        write_workload(workload, args.output)
+    except (OSError, ValueError) as e:
+        print(f"[✗] {e}")
+        return 1
+
+    span = int(workload.arrival_time.max()) if len(workload) else 0
+    print(f"[✓] Generated {len(workload)} processes in {generated:.2f}s -> {args.output}")
+    print(f"  Arrivals: {args.arrivals}, Bursts: {args.bursts} "
+          f"(mean {workload.burst_time.mean() if len(workload) else 0:.2f}), "
+          f"Offered load: {workload.burst_time.sum() / span if span else 0:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())